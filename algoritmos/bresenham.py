@@ -23,8 +23,31 @@ Roteiro de apresentação – Algoritmo de Bresenham (Linha)
 5) Dicas de demonstração
     - Mostrar um caso dx>dy e outro dy≥dx.
     - Destacar quando p ultrapassa 0 e o eixo menor é atualizado.
+
+6) Versão em lote (calcular_linhas_bresenham_lote)
+    - Somando as atualizações de p, o deslocamento no eixo menor após i passos
+      tem forma fechada: k_i = floor((2·i·menor + maior) / (2·maior)),
+      com maior = max(|dx|, |dy|) e menor = min(|dx|, |dy|).
+    - O desempate "p ≥ 0" corresponde ao arredondamento para cima no meio
+      do pixel, exatamente o que o floor(... + maior) / (2·maior) faz.
+    - Assim todos os passos de todos os segmentos são calculados de uma vez
+      com NumPy, sem laço em Python, gerando os mesmos pixels da versão escalar.
+
+7) Rasterização recortada (janela=...)
+    - Recortar os extremos e rodar Bresenham de novo muda os pixels (o erro p
+      recomeça do zero no novo extremo). Em vez disso, restringimos o índice i.
+    - No eixo dominante, a janela dá direto um intervalo de i. No eixo menor,
+      como k_i é crescente, k_min <= k_i <= k_max também vira um intervalo:
+      i >= ceil((2·maior·k_min - maior) / (2·menor)) e
+      i <= ceil((2·maior·(k_max + 1) - maior) / (2·menor)) - 1.
+    - Só os passos visíveis são gerados: uma linha de 100000 pixels que cruza a
+      janela custa o trecho visível, com exatamente os pixels da linha inteira.
 """
 
+import numpy as np
+
+from .pixels import PixelBuffer
+
 def calcular_linha_bresenham(ponto_inicial, ponto_final):
     """
     Calcula todos os pontos (pixels) de uma linha entre dois pontos
@@ -35,13 +58,19 @@ def calcular_linha_bresenham(ponto_inicial, ponto_final):
         ponto_final (tuple): Uma tupla (x2, y2) com as coordenadas do ponto final.
 
     Returns:
-        list: Uma lista de tuplas [(x, y), ...], representando os pixels da linha.
+        PixelBuffer: Os pixels (x, y) da linha, em ordem (itera como tuplas).
+    """
+    return PixelBuffer(iterar_linha_bresenham(ponto_inicial, ponto_final))
+
+
+def iterar_linha_bresenham(ponto_inicial, ponto_final):
+    """
+    Versão geradora de calcular_linha_bresenham: produz os pixels (x, y) da
+    linha um a um, sem montar a lista inteira em memória.
     """
     x1, y1 = ponto_inicial  # ponto inicial (inteiros)
     x2, y2 = ponto_final    # ponto final (inteiros)
-    
-    pixels = []  # lista de (x,y) acumulados do traçado
-    
+
     # Deltas (variação entre pontos)
     dx = x2 - x1           # variação em x (pode ser negativa)
     dy = y2 - y1           # variação em y (pode ser negativa)
@@ -66,7 +95,7 @@ def calcular_linha_bresenham(ponto_inicial, ponto_final):
         x, y = x1, y1       # ponto corrente a ser emitido
         # Loop: avança dx+1 passos, emitindo um pixel por coluna
         for _ in range(dx + 1):
-            pixels.append((x, y))
+            yield (x, y)
             if p >= 0:
                 # p >= 0 => erro passou do meio entre as duas opções, então ajustamos Y
                 y += sinal_y
@@ -81,12 +110,110 @@ def calcular_linha_bresenham(ponto_inicial, ponto_final):
         x, y = x1, y1       # ponto corrente a ser emitido
         # Loop: avança dy+1 passos, emitindo um pixel por linha
         for _ in range(dy + 1):
-            pixels.append((x, y))
+            yield (x, y)
             if p >= 0:
                 # Critério de desempate: p >= 0 decide subir/baixar em X
                 x += sinal_x
                 p -= 2 * dy
             y += sinal_y
             p += 2 * dx
-            
-    return pixels
\ No newline at end of file
+
+
+def calcular_linha_bresenham_recortada(ponto_inicial, ponto_final, janela):
+    """
+    Pixels de calcular_linha_bresenham que caem na janela, na mesma ordem,
+    gerando só os passos visíveis (ver item 7 do roteiro).
+
+    Args:
+        janela (tuple): (xmin, ymin, xmax, ymax), inclusivos.
+
+    Returns:
+        PixelBuffer: Os pixels visíveis da linha.
+    """
+    segmento = [(*ponto_inicial, *ponto_final)]
+    return PixelBuffer.de_numpy(calcular_linhas_bresenham_lote(segmento, janela=janela))
+
+
+def calcular_linhas_bresenham_lote(segmentos, omitir_primeiro=False, janela=None):
+    """
+    Rasteriza vários segmentos de uma só vez (vetorizado com NumPy).
+
+    Produz exatamente os mesmos pixels, na mesma ordem, que chamar
+    calcular_linha_bresenham para cada segmento e concatenar os resultados.
+
+    Args:
+        segmentos: Array-like de formato (N, 4), cada linha (x1, y1, x2, y2).
+        omitir_primeiro: bool ou array (N,) de bool; nos segmentos marcados o
+            pixel inicial (x1, y1) não é gerado (útil em polilinhas, onde ele
+            repete o último pixel do segmento anterior).
+        janela: (xmin, ymin, xmax, ymax) opcional; se dada, só os pixels dentro
+            dela são gerados (ver item 7 do roteiro).
+
+    Returns:
+        numpy.ndarray: Array (M, 2) de inteiros com os pixels de todos os
+        segmentos, em sequência.
+    """
+    seg = np.asarray(segmentos, dtype=np.int64).reshape(-1, 4)
+    if len(seg) == 0:
+        return np.empty((0, 2), dtype=np.int64)
+    x1, y1, x2, y2 = seg.T
+
+    dx = x2 - x1
+    dy = y2 - y1
+    sinal_x = np.where(dx > 0, 1, -1)  # mesma convenção da versão escalar
+    sinal_y = np.where(dy > 0, 1, -1)
+    dx = np.abs(dx)
+    dy = np.abs(dy)
+
+    deitada = dx > dy                     # eixo dominante X (senão Y)
+    maior = np.where(deitada, dx, dy)     # passos no eixo dominante
+    menor = np.where(deitada, dy, dx)
+
+    # Índice do passo i dentro de cada segmento (0..maior, ou 1..maior se o
+    # primeiro pixel é omitido), para todos de uma vez
+    primeiro = np.broadcast_to(np.asarray(omitir_primeiro, dtype=np.int64), maior.shape)
+    ultimo = maior
+    if janela is not None:
+        primeiro, ultimo = _intervalo_visivel(x1, y1, sinal_x, sinal_y, deitada, maior, menor,
+                                              primeiro, janela)
+    passos = np.maximum(ultimo + 1 - primeiro, 0)
+    indice_segmento = np.repeat(np.arange(len(seg)), passos)
+    inicio = np.cumsum(passos) - passos
+    i = np.arange(int(passos.sum())) - inicio[indice_segmento] + primeiro[indice_segmento]
+
+    # Deslocamento no eixo menor em forma fechada (ver item 6 do roteiro);
+    # maior == 0 só ocorre no segmento de um ponto, onde i = 0 e k = 0
+    maior_i = maior[indice_segmento]
+    k = (2 * i * menor[indice_segmento] + maior_i) // (2 * np.maximum(maior_i, 1))
+
+    deitada_i = deitada[indice_segmento]
+    pixels = np.empty((len(i), 2), dtype=np.int64)
+    pixels[:, 0] = x1[indice_segmento] + sinal_x[indice_segmento] * np.where(deitada_i, i, k)
+    pixels[:, 1] = y1[indice_segmento] + sinal_y[indice_segmento] * np.where(deitada_i, k, i)
+    return pixels
+
+
+def _intervalo_visivel(x1, y1, sinal_x, sinal_y, deitada, maior, menor, primeiro, janela):
+    """Passos [primeiro, ultimo] de cada segmento cujos pixels caem na janela."""
+    xmin, ymin, xmax, ymax = janela
+    # Eixo dominante (a) e eixo menor (b) de cada segmento
+    a1, sinal_a = np.where(deitada, x1, y1), np.where(deitada, sinal_x, sinal_y)
+    b1, sinal_b = np.where(deitada, y1, x1), np.where(deitada, sinal_y, sinal_x)
+    a_min, a_max = np.where(deitada, xmin, ymin), np.where(deitada, xmax, ymax)
+    b_min, b_max = np.where(deitada, ymin, xmin), np.where(deitada, ymax, xmax)
+
+    # a1 + sinal_a·i dentro de [a_min, a_max]
+    primeiro = np.maximum(primeiro, np.where(sinal_a > 0, a_min - a1, a1 - a_max))
+    ultimo = np.minimum(maior, np.where(sinal_a > 0, a_max - a1, a1 - a_min))
+
+    # b1 + sinal_b·k_i dentro de [b_min, b_max], com k_i crescente (item 7 do roteiro)
+    k_min = np.where(sinal_b > 0, b_min - b1, b1 - b_max)
+    k_max = np.where(sinal_b > 0, b_max - b1, b1 - b_min)
+    divisor = 2 * np.maximum(menor, 1)
+    i_min = -((maior - 2 * maior * k_min) // divisor)            # ceil(...)
+    i_max = -((maior - 2 * maior * (k_max + 1)) // divisor) - 1
+    # menor == 0: k_i = 0 sempre; o segmento inteiro está dentro ou fora no eixo menor
+    parado_dentro = (k_min <= 0) & (k_max >= 0)
+    i_min = np.where(menor > 0, i_min, np.where(parado_dentro, 0, maior + 1))
+    i_max = np.where(menor > 0, i_max, maior)
+    return np.maximum(primeiro, np.maximum(i_min, 0)), np.minimum(ultimo, i_max)
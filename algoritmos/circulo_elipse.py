@@ -12,12 +12,37 @@ Roteiro de apresentação – Círculo e Elipse (Algoritmo do Ponto Médio)
 3) Ideia principal (elipse)
     - Duas regiões: onde |dy/dx| > 1 e onde |dy/dx| ≤ 1, com critérios diferentes.
     - Simetria em 4 quadrantes; calculamos um e espelhamos.
+    - Decisões multiplicadas por 4 para usar só inteiros (exato para raios grandes).
+    - iterar_faixas_elipse dá uma faixa por linha para a elipse preenchida.
 
 4) Dicas de apresentação
     - Mostrar a evolução de p (círculo) e p1/p2 (elipse) e quando y decrementa/incrementa.
     - Destacar espelhamento para cobrir octantes/quadrantes.
+
+5) Círculo sem repetições (calcular_circulo_unico)
+    - O espelhamento em 8 repete pixels sobre os eixos (x = 0) e na diagonal (x = y).
+    - Calculamos o octante uma vez e só espelhamos as cópias distintas; opcionalmente
+      montamos o contorno em ordem (quadrante a quadrante, sentido horário).
+    - Para discos preenchidos, iterar_faixas_circulo devolve uma faixa
+      (y, x_inicio, x_fim) por linha, a partir da maior |x| do contorno em cada y.
+
+6) Rasterização recortada (janela=...)
+    - Como p0 = 1 - r é o 5/4 - r clássico arredondado e p nunca zera, o y do
+      octante em cada x tem forma fechada: y(x) = (isqrt(4·(r² - x²)) + 1) // 2.
+    - Em cada cópia espelhada, o x do octante vira uma coordenada de tela (x ou y),
+      então a janela dá direto o intervalo de x visível; só ele é calculado.
+    - Elipse: as regiões do Ponto Médio não têm forma fechada exata (a Região 2
+      pode ficar para trás da curva), então o quadrante é percorrido, mas só as
+      cópias dentro da janela são produzidas e o percurso para assim que x ou y
+      saem do alcance da janela (x só cresce e y só decresce no quadrante).
 """
 
+from math import isqrt
+
+import numpy as np
+
+from .pixels import PixelBuffer
+
 def calcular_circulo(centro, raio):
     """
     Calcula os pixels de um círculo usando o Algoritmo do Ponto Médio.
@@ -27,40 +52,190 @@ def calcular_circulo(centro, raio):
         raio (int): O raio do círculo.
 
     Returns:
-        list: Uma lista de tuplas [(x, y), ...], representando os pixels do círculo.
+        PixelBuffer: Os pixels (x, y) do círculo (itera como tuplas).
+    """
+    return PixelBuffer(iterar_circulo(centro, raio))
+
+
+def iterar_circulo(centro, raio):
+    """
+    Versão geradora de calcular_circulo: produz os pixels na mesma ordem,
+    8 pixels simétricos por passo, sem acumular a lista.
     """
     xc, yc = centro           # xc, yc: coordenadas do centro do círculo
     x = 0                     # começamos no ponto mais à direita do eixo vertical superior do octante
     y = raio                  # y inicial no topo do círculo
     p = 1 - raio              # parâmetro de decisão inicial (p0)
 
-    pixels = []               # acumula todos os pixels do círculo (sem deduplicação)
-
-    def adicionar_pixels_simetricos(x, y):
-        """Adiciona os 8 pixels simétricos para o octante calculado."""
+    def pixels_simetricos(x, y):
+        """Os 8 pixels simétricos para o octante calculado (sem deduplicação)."""
         # Espelhamentos: (±x, ±y) e trocas (x<->y) para cobrir 8 octantes
-        pixels.append((xc + x, yc + y))
-        pixels.append((xc - x, yc + y))
-        pixels.append((xc + x, yc - y))
-        pixels.append((xc - x, yc - y))
-        pixels.append((xc + y, yc + x))
-        pixels.append((xc - y, yc + x))
-        pixels.append((xc + y, yc - x))
-        pixels.append((xc - y, yc - x))
+        return (
+            (xc + x, yc + y), (xc - x, yc + y), (xc + x, yc - y), (xc - x, yc - y),
+            (xc + y, yc + x), (xc - y, yc + x), (xc + y, yc - x), (xc - y, yc - x),
+        )
 
     # Loop do octante: avança x até x ultrapassar y (linha de 45°); invariante: (x,y) permanece no contorno do octante.
     # - Se p < 0: próximo pixel (x+1, y) ainda está mais perto do círculo ideal.
     # - Se p ≥ 0: decrementamos y (subimos um pixel) para aproximar do contorno.
     while x <= y:
-        adicionar_pixels_simetricos(x, y)
+        yield from pixels_simetricos(x, y)
         x += 1                 # passo base: avançamos uma coluna para a direita
         if p < 0:              # dentro do círculo: apenas ajusta p
             p += 2 * x + 1     # atualização incremental para o próximo x
         else:                  # cruzou a fronteira: ajusta y também
             y -= 1
             p += 2 * (x - y) + 1
-            
-    return pixels
+
+def _octante_circulo(raio):
+    """Pontos (x, y) do octante 0 <= x <= y, na ordem do Ponto Médio (x crescente)."""
+    octante = []
+    x, y = 0, raio
+    p = 1 - raio
+    while x <= y:
+        octante.append((x, y))
+        x += 1
+        if p < 0:
+            p += 2 * x + 1
+        else:
+            y -= 1
+            p += 2 * (x - y) + 1
+    return octante
+
+
+def _y_octante_circulo(raio, x):
+    """y do octante em x, em forma fechada (ver item 6 do roteiro); x é um array."""
+    n = 4 * (raio * raio - x * x)
+    s = np.floor(np.sqrt(n)).astype(np.int64)
+    s -= s * s > n                # corrige o arredondamento do sqrt em float
+    s += (s + 1) * (s + 1) <= n
+    return (s + 1) // 2
+
+
+def _tamanho_octante_circulo(raio):
+    """Quantidade de pontos do octante (x = 0 .. último x com x <= y)."""
+    def y(x):
+        return (isqrt(4 * (raio * raio - x * x)) + 1) // 2
+    x = isqrt(raio * raio // 2)
+    while x + 1 <= raio and x + 1 <= y(x + 1):
+        x += 1
+    while x > y(x):
+        x -= 1
+    return x + 1
+
+
+def calcular_circulo_unico(centro, raio, ordem_contorno=False, janela=None):
+    """
+    Pixels do círculo (mesmo conjunto de calcular_circulo), cada um uma única vez.
+
+    Args:
+        centro (tuple): Coordenadas (xc, yc) do centro.
+        raio (int): O raio do círculo.
+        ordem_contorno (bool): Se True, os pixels saem em ordem de percurso do
+            contorno, começando em (xc, yc + raio) no sentido horário; se False,
+            saem agrupados por ponto do octante (ordem de calcular_circulo).
+        janela (tuple): (xmin, ymin, xmax, ymax) opcional; se dada, só os pixels
+            dentro dela são produzidos, na mesma ordem. Sem ordem_contorno, só
+            os pontos do octante visíveis são calculados (item 6 do roteiro).
+
+    Returns:
+        PixelBuffer: Os pixels únicos do círculo.
+    """
+    if raio < 0:
+        return PixelBuffer()
+    if janela is not None and not ordem_contorno:
+        return _circulo_unico_recortado(centro, raio, janela)
+    if janela is not None:
+        pixels = calcular_circulo_unico(centro, raio, ordem_contorno).como_numpy()
+        return PixelBuffer.de_numpy(pixels[_dentro_da_janela(pixels, janela)])
+    octante = _octante_circulo(raio)
+    if not octante:
+        return PixelBuffer()
+    pts = np.array(octante, dtype=np.int64)
+    return PixelBuffer.de_numpy(_copias_octante(pts, ordem_contorno) + centro)
+
+
+def _copias_octante(pts, ordem_contorno=False):
+    """Cópias espelhadas e distintas dos pontos do octante, relativas ao centro."""
+    x, y = pts[:, 0], pts[:, 1]
+
+    if ordem_contorno:
+        # Quarto de arco de (0, r) até (r, 0): octante + octante trocado (x<->y) de trás para frente
+        trocado = pts[::-1, ::-1]
+        if x[-1] == y[-1]:
+            trocado = trocado[1:]  # ponto da diagonal já está no octante
+        quarto = np.concatenate([pts, trocado])
+        if len(quarto) == 1:
+            contorno = quarto  # raio 0
+        else:
+            # Demais quadrantes espelhando o quarto; descarta os pontos sobre os eixos repetidos
+            contorno = np.concatenate([
+                quarto,                               # topo -> direita
+                (quarto[::-1] * (1, -1))[1:],         # direita -> base
+                (quarto * (-1, -1))[1:],              # base -> esquerda
+                (quarto[::-1] * (-1, 1))[1:-1],       # esquerda -> topo (sem repetir o início)
+            ])
+    else:
+        # As 8 cópias de cada ponto e quais delas são distintas (ver item 5 do roteiro)
+        sinais = np.array([(1, 1), (-1, 1), (1, -1), (-1, -1)])
+        copias = np.empty((len(pts), 8, 2), dtype=np.int64)
+        copias[:, :4] = pts[:, None, :] * sinais            # (±x, ±y)
+        copias[:, 4:] = pts[:, None, ::-1] * sinais         # (±y, ±x)
+        x_nz, y_nz, fora_diag = x != 0, y != 0, x != y
+        validas = np.empty((len(pts), 8), dtype=bool)
+        validas[:, 0] = True
+        validas[:, 1] = x_nz
+        validas[:, 2] = y_nz
+        validas[:, 3] = x_nz & y_nz
+        validas[:, 4:] = validas[:, :4][:, [0, 2, 1, 3]] & fora_diag[:, None]
+        contorno = copias[validas]
+    return contorno
+
+
+def _circulo_unico_recortado(centro, raio, janela):
+    """calcular_circulo_unico só com os pontos do octante que têm cópia visível."""
+    xc, yc = centro
+    xmin, ymin, xmax, ymax = janela
+    n = _tamanho_octante_circulo(raio)
+    # Intervalos de x do octante em que cada cópia pode cair na janela: nas
+    # cópias (±x, ±y) o x do octante é uma abscissa; nas (±y, ±x), uma ordenada
+    intervalos = [(xmin - xc, xmax - xc), (xc - xmax, xc - xmin),
+                  (ymin - yc, ymax - yc), (yc - ymax, yc - ymin)]
+    partes = [np.arange(max(a, 0), min(b, n - 1) + 1) for a, b in intervalos]
+    x = np.unique(np.concatenate(partes)).astype(np.int64)
+    if len(x) == 0:
+        return PixelBuffer()
+    pts = np.stack([x, _y_octante_circulo(raio, x)], axis=1)
+    pixels = _copias_octante(pts) + centro
+    return PixelBuffer.de_numpy(pixels[_dentro_da_janela(pixels, janela)])
+
+
+def _dentro_da_janela(pixels, janela):
+    """Máscara dos pixels (k, 2) dentro de (xmin, ymin, xmax, ymax)."""
+    xmin, ymin, xmax, ymax = janela
+    return ((pixels[:, 0] >= xmin) & (pixels[:, 0] <= xmax)
+            & (pixels[:, 1] >= ymin) & (pixels[:, 1] <= ymax))
+
+
+def iterar_faixas_circulo(centro, raio):
+    """
+    Faixas horizontais do disco preenchido, de baixo para cima.
+
+    Yields:
+        tuple: (y, x_inicio, x_fim), com x_inicio <= x_fim (inclusivos).
+    """
+    if raio < 0:
+        return
+    xc, yc = centro
+    # meia_largura[d]: maior |x| do contorno na linha y = yc ± d
+    meia_largura = [0] * (raio + 1)
+    for x, y in _octante_circulo(raio):
+        meia_largura[y] = max(meia_largura[y], x)   # linhas ±y alcançam até ±x
+        meia_largura[x] = max(meia_largura[x], y)   # linhas ±x alcançam até ±y (octante trocado)
+    for dy in range(-raio, raio + 1):
+        w = meia_largura[abs(dy)]
+        yield (yc + dy, xc - w, xc + w)
+
 
 def calcular_elipse(centro, rx, ry):
     """
@@ -72,53 +247,103 @@ def calcular_elipse(centro, rx, ry):
         ry (int): O raio no eixo Y.
 
     Returns:
-        list: Uma lista de tuplas [(x, y), ...], representando os pixels da elipse.
+        PixelBuffer: Os pixels (x, y) da elipse (itera como tuplas).
+    """
+    return PixelBuffer(iterar_elipse(centro, rx, ry))
+
+
+def iterar_elipse(centro, rx, ry, janela=None):
+    """
+    Versão geradora de calcular_elipse: produz os pixels na mesma ordem,
+    sem acumular a lista. Com janela (xmin, ymin, xmax, ymax), produz só os
+    pixels dentro dela (ver item 6 do roteiro).
     """
     xc, yc = centro           # centro da elipse
-    pixels = []               # lista de pixels acumulados
+    if janela is None:
+        # Espelha cada ponto do quadrante nos quatro quadrantes (±x, ±y)
+        for x, y in _quadrante_elipse(rx, ry):
+            yield (xc + x, yc + y)
+            yield (xc - x, yc + y)
+            yield (xc + x, yc - y)
+            yield (xc - x, yc - y)
+        return
+    xmin, ymin, xmax, ymax = janela
+    # Além destes limites nenhuma das quatro cópias cai na janela; como x só
+    # cresce e y só decresce no quadrante, o percurso pode parar ao atingi-los
+    x_limite = max(xmax - xc, xc - xmin)
+    y_limite = min(ymin - yc, yc - ymax)
+    for x, y in _quadrante_elipse(rx, ry):
+        if x > x_limite or y < y_limite:
+            return
+        for px, py in ((xc + x, yc + y), (xc - x, yc + y), (xc + x, yc - y), (xc - x, yc - y)):
+            if xmin <= px <= xmax and ymin <= py <= ymax:
+                yield (px, py)
+
+
+def _quadrante_elipse(rx, ry):
+    """
+    Pontos (x, y) do primeiro quadrante da elipse centrada na origem, na ordem
+    do Ponto Médio (Região 1 e depois Região 2), só com aritmética inteira.
 
-    def adicionar_pixels_simetricos(x, y):
-        """Adiciona os 4 pixels simétricos para o quadrante calculado."""
-        # Espelha nos quatro quadrantes (±x, ±y)
-        pixels.append((xc + x, yc + y))
-        pixels.append((xc - x, yc + y))
-        pixels.append((xc + x, yc - y))
-        pixels.append((xc - x, yc - y))
+    As variáveis de decisão são as da formulação clássica multiplicadas por 4
+    (P1 = 4·p1, P2 = 4·p2): os termos 0.25·rx² e (x + 0.5)² viram inteiros e o
+    sinal, que é o que decide o passo, não muda. Os quadrados são calculados
+    uma vez e as derivadas dx, dy são atualizadas por soma.
+    """
+    rx2, ry2 = rx * rx, ry * ry  # quadrados dos raios (fora do laço)
 
     # --- Região 1 ---
     x = 0                      # começa no topo do quadrante
     y = ry
-    # p1: decisão na Região 1 (onde dx < dy), derivado da equação implícita da elipse
-    p1 = (ry**2) - (rx**2 * ry) + (0.25 * rx**2)
-    dx = 2 * (ry**2) * x       # derivadas incrementais em x
-    dy = 2 * (rx**2) * y       # derivadas incrementais em y
+    # P1 = 4·(ry² - rx²·ry + rx²/4): decisão na Região 1 (onde dx < dy)
+    p1 = 4 * ry2 - 4 * rx2 * ry + rx2
+    dx = 0                     # dx = 2·ry²·x (derivada incremental em x)
+    dy = 2 * rx2 * y           # dy = 2·rx²·y (derivada incremental em y)
 
     # Região 1: variação em x domina (pendente < -1 ou > 1 em termos de derivadas)
     while dx < dy:
-        adicionar_pixels_simetricos(x, y)
+        yield (x, y)
         x += 1
-        dx = 2 * (ry**2) * x
+        dx += 2 * ry2
         if p1 < 0:                 # próximo ponto ainda acima da curva: não reduz y
-            p1 += dx + (ry**2)
+            p1 += 4 * (dx + ry2)
         else:                       # cruza a curva: reduz y
             y -= 1
-            dy = 2 * (rx**2) * y
-            p1 += dx - dy + (ry**2)
+            dy -= 2 * rx2
+            p1 += 4 * (dx - dy + ry2)
 
     # --- Região 2 ---
-    # p2: decisão na Região 2 (onde dx ≥ dy), continuando de (x,y) da região anterior
-    p2 = (ry**2 * (x + 0.5)**2) + (rx**2 * (y - 1)**2) - (rx**2 * ry**2)
-    
+    # P2 = 4·(ry²·(x + 1/2)² + rx²·(y - 1)² - rx²·ry²), continuando de (x,y) da região anterior
+    p2 = ry2 * (2 * x + 1) ** 2 + 4 * rx2 * (y - 1) ** 2 - 4 * rx2 * ry2
+
     # Região 2: variação em y domina (agora diminuímos y a cada passo base)
     while y >= 0:
-        adicionar_pixels_simetricos(x, y)
+        yield (x, y)
         y -= 1
-        dy = 2 * (rx**2) * y
+        dy -= 2 * rx2
         if p2 > 0:                 # permanece do mesmo lado: não aumenta x
-            p2 += (rx**2) - dy
+            p2 += 4 * (rx2 - dy)
         else:                       # cruza a curva: aumenta x
             x += 1
-            dx = 2 * (ry**2) * x
-            p2 += dx - dy + (rx**2)
-            
-    return pixels
\ No newline at end of file
+            dx += 2 * ry2
+            p2 += 4 * (dx - dy + rx2)
+
+
+def iterar_faixas_elipse(centro, rx, ry):
+    """
+    Faixas horizontais da elipse preenchida, de baixo para cima.
+
+    Yields:
+        tuple: (y, x_inicio, x_fim), com x_inicio <= x_fim (inclusivos).
+    """
+    if ry < 0:
+        return
+    xc, yc = centro
+    # meia_largura[y]: maior x do contorno no quadrante, na linha y (0..ry)
+    meia_largura = [0] * (ry + 1)
+    for x, y in _quadrante_elipse(rx, ry):
+        if x > meia_largura[y]:
+            meia_largura[y] = x
+    for dy in range(-ry, ry + 1):
+        w = meia_largura[abs(dy)]
+        yield (yc + dy, xc - w, xc + w)
@@ -10,29 +10,169 @@ Roteiro de apresentação – Curvas de Bézier Cúbicas
     - Amostramos t em passos (num_segmentos) e conectamos com linhas (polilinha).
 
 3) Passo a passo (para narrar)
-    - Calcular pontos da curva para t = 0..1 (coeficientes b0..b3).
-    - Arredondar para grid, evitar duplicatas consecutivas.
+    - Calcular pontos da curva para t = 0..1. Em vez de avaliar os coeficientes de
+      Bernstein b0..b3 em cada t, escrevemos B(t) = a·t³ + b·t² + c·t + d e usamos
+      diferenças progressivas: com passo h fixo, cada nova amostra custa 3 somas
+      (f += Δf; Δf += Δ²f; Δ²f += Δ³f), pois Δ³f é constante para uma cúbica.
+    - Arredondar para grid (após fixar CASAS_AMOSTRA casas, para que empates em .5
+      não dependam do erro de ponto flutuante de cada método), evitar duplicatas consecutivas.
     - Usar Bresenham para rasterizar cada segmento consecutivo.
 
 4) Complexidade e observações
     - O(num_segmentos) para amostragem + Bresenham por segmento.
     - Quanto maior num_segmentos, mais suave (trade-off custo x qualidade).
+    - Por padrão num_segmentos é adaptativo (fórmula de Wang): escolhemos o menor n
+      que garante distância <= tolerancia (em células) entre curva e polilinha:
+        n = ceil( sqrt( 3/4 · M / tolerancia ) ),  M = max |P_i - 2·P_{i+1} + P_{i+2}|
+      limitado pelo comprimento do polígono de controle (segmentos menores que
+      uma célula não acrescentam pixels). Curvas pequenas usam poucos segmentos;
+      curvas enormes, quantos forem necessários.
 
 5) Dicas de demo
     - Mostrar efeito de mover p1/p2 nas tangentes iniciais/finais.
     - Comparar poucas vs. muitas amostras.
+
+6) Grau qualquer, Bézier composta e B-spline (caminhos longos num só item)
+    - Com n + 1 amostras e grau d, a avaliação é um produto de matrizes:
+        amostras = B · P,  B[s, i] = base_i(t_s)  (matriz (n + 1) x (d + 1))
+      B só depende de (grau, num_segmentos), então fica em cache (lru_cache) e
+      reavaliar a curva após uma edição custa apenas o produto.
+    - Bézier composta: trechos de grau d que compartilham as extremidades
+      (P0..Pd, Pd..P2d, ...); B-spline uniforme: um trecho por janela de d + 1
+      pontos consecutivos (C² para d = 3), com as extremidades repetidas para
+      a curva começar e terminar nos pontos dados.
+    - Todos os trechos de mesmo grau são avaliados num único produto (einsum).
+    - Número de segmentos: a mesma fórmula de Wang, com fator d(d-1)/8 para
+      Bézier e 1/8 para B-spline uniforme.
 """
 
-from .bresenham import calcular_linha_bresenham  # usamos a linha de Bresenham para rasterizar os segmentos da curva
+import math
+from functools import lru_cache
+
+import numpy as np
+
+from .pixels import PixelBuffer
+from .bresenham import calcular_linhas_bresenham_lote  # usamos a linha de Bresenham (em lote) para rasterizar os segmentos da curva
+
+
+# Distância máxima (em células da grade) tolerada entre a curva e a polilinha
+# amostrada; abaixo de meia célula o Bresenham já não distingue a diferença.
+TOLERANCIA_PADRAO = 0.5
+
+# Casas decimais em que as amostras são fixadas antes do arredondamento para a
+# grade: diferenças progressivas e produto B · P chegam ao mesmo valor com erros
+# de ~1e-14, que decidiriam para lados opostos um empate em .5.
+CASAS_AMOSTRA = 9
+
+
+def numero_segmentos_adaptativo(p0, p1, p2, p3, tolerancia=TOLERANCIA_PADRAO):
+    """
+    Número de segmentos para aproximar a cúbica com erro <= tolerancia (fórmula de Wang).
+
+    Args:
+        p0, p1, p2, p3 (tuple): Pontos de controle.
+        tolerancia (float): Distância máxima curva-polilinha, em células (> 0).
+
+    Returns:
+        int: num_segmentos >= 1.
+    """
+    if tolerancia <= 0:
+        raise ValueError("A tolerância deve ser positiva.")
+    # M: maior "segunda diferença" do polígono de controle (mede a curvatura)
+    m = max(
+        math.hypot(p0[0] - 2 * p1[0] + p2[0], p0[1] - 2 * p1[1] + p2[1]),
+        math.hypot(p1[0] - 2 * p2[0] + p3[0], p1[1] - 2 * p2[1] + p3[1]),
+    )
+    n = math.ceil(math.sqrt(0.75 * m / tolerancia))  # grau 3: d(d-1)/8 = 3/4
+    # Limite pela resolução da grade: o comprimento do polígono de controle
+    # (>= comprimento da curva) em células
+    comprimento = (math.hypot(p1[0] - p0[0], p1[1] - p0[1])
+                   + math.hypot(p2[0] - p1[0], p2[1] - p1[1])
+                   + math.hypot(p3[0] - p2[0], p3[1] - p2[1]))
+    return max(1, min(n, math.ceil(comprimento)))
+
 
+def _coeficientes_diferencas(p0, p1, p2, p3, h):
+    """
+    Valores iniciais (f, Δf, Δ²f, Δ³f) das diferenças progressivas com passo h.
 
-def calcular_pontos_bezier_cubica(p0, p1, p2, p3, num_segmentos=20):
+    Funciona com escalares (uma coordenada) ou arrays NumPy (várias curvas).
+    """
+    # Forma polinomial B(t) = a·t³ + b·t² + c·t + d (a partir da base de Bernstein)
+    a = -p0 + 3 * p1 - 3 * p2 + p3
+    b = 3 * p0 - 6 * p1 + 3 * p2
+    c = -3 * p0 + 3 * p1
+    h2 = h * h
+    h3 = h2 * h
+    return p0, a * h3 + b * h2 + c * h, 6 * a * h3 + 2 * b * h2, 6 * a * h3
+
+
+def calcular_amostras_bezier_cubica(p0, p1, p2, p3, num_segmentos):
+    """
+    Amostras contínuas B(i / num_segmentos), i = 0..num_segmentos, por diferenças progressivas.
+
+    Returns:
+        list: num_segmentos + 1 tuplas (x, y) de floats; a última é exatamente p3.
+    """
+    h = 1 / num_segmentos
+    fx, dfx, d2fx, d3fx = _coeficientes_diferencas(p0[0], p1[0], p2[0], p3[0], h)
+    fy, dfy, d2fy, d3fy = _coeficientes_diferencas(p0[1], p1[1], p2[1], p3[1], h)
+    amostras = [(fx, fy)]
+    # Três somas por coordenada a cada passo
+    for _ in range(num_segmentos - 1):
+        fx += dfx
+        dfx += d2fx
+        d2fx += d3fx
+        fy += dfy
+        dfy += d2fy
+        d2fy += d3fy
+        amostras.append((fx, fy))
+    amostras.append((p3[0], p3[1]))  # ponto final exato, sem erro acumulado
+    return amostras
+
+
+def avaliar_bezier_lote(controles, num_segmentos):
+    """
+    Avalia várias cúbicas de uma vez com diferenças progressivas vetorizadas.
+
+    As três somas por passo viram três somas cumulativas (np.cumsum, que soma
+    em sequência), então cada amostra é idêntica à de calcular_amostras_bezier_cubica.
+
+    Args:
+        controles: Array-like (N, 4, 2) com os pontos de controle de N curvas.
+        num_segmentos (int): Número de segmentos (igual para todas as curvas).
+
+    Returns:
+        numpy.ndarray: Array (N, num_segmentos + 1, 2) de floats.
+    """
+    c = np.asarray(controles, dtype=np.float64).reshape(-1, 4, 2)
+    f0, df0, d2f0, d3f = _coeficientes_diferencas(c[:, 0], c[:, 1], c[:, 2], c[:, 3], 1 / num_segmentos)
+    n_curvas = len(c)
+    # Δ²f_k = Δ²f_0 + Δ³f + ... ; Δf_k = Δf_0 + Δ²f_0 + ... ; f_k = f_0 + Δf_0 + ...
+    termos = np.empty((n_curvas, num_segmentos, 2))
+    termos[:, 0] = d2f0
+    termos[:, 1:] = d3f[:, None]
+    d2f = np.cumsum(termos, axis=1)
+    termos[:, 0] = df0
+    termos[:, 1:] = d2f[:, :-1]
+    df = np.cumsum(termos, axis=1)
+    amostras = np.empty((n_curvas, num_segmentos + 1, 2))
+    amostras[:, 0] = f0
+    amostras[:, 1:] = df
+    amostras = np.cumsum(amostras, axis=1)
+    amostras[:, -1] = c[:, 3]  # ponto final exato
+    return amostras
+
+
+def calcular_pontos_bezier_cubica(p0, p1, p2, p3, num_segmentos=None, tolerancia=TOLERANCIA_PADRAO):
     """
     Calcula uma lista de pontos ao longo de uma Curva de Bézier Cúbica.
 
     Args:
         p0, p1, p2, p3 (tuple): Pontos inicial, de controle 1, de controle 2 e final.
         num_segmentos (int): A "resolução" da curva. Mais segmentos = mais suave.
+            Se None, é escolhido por numero_segmentos_adaptativo(tolerancia).
+        tolerancia (float): Erro máximo (em células) usado no modo adaptativo.
 
     Returns:
         list: Uma lista de pontos [(x, y), ...] que formam a curva.
@@ -43,29 +183,15 @@ def calcular_pontos_bezier_cubica(p0, p1, p2, p3, num_segmentos=20):
     #   - p2: ponto de controle que define a tangente final
     #   - p3: ponto final
     # num_segmentos: inteiro que define quantas divisões de t em [0,1] faremos; controla a suavidade
+    if num_segmentos is None:
+        num_segmentos = numero_segmentos_adaptativo(p0, p1, p2, p3, tolerancia)
 
     pontos_da_curva = []  # lista de tuplas (x, y) inteiras amostradas ao longo da curva
 
-    # Amostragem uniforme de t em [0, 1]
-    for i in range(num_segmentos + 1):
-        # i: índice da amostra, varia de 0 até num_segmentos (inclusive)
-        t = i / num_segmentos  # t: parâmetro contínuo da curva no intervalo [0.0, 1.0]
-
-        # Fórmula da Curva de Bézier Cúbica (coeficientes de Bernstein)
-        um_menos_t = 1 - t  # ajuda para computar potências sem repetir subtração
-
-        # Coeficientes da combinação convexa (dependem de t)
-        # b0..b3 somam 1.0 (partição da unidade), ponderando cada ponto de controle
-        b0 = um_menos_t ** 3             # contribuição de p0 quando t é pequeno
-        b1 = 3 * t * (um_menos_t ** 2)   # contribuição de p1, controla tangente inicial
-        b2 = 3 * (t ** 2) * um_menos_t   # contribuição de p2, controla tangente final
-        b3 = t ** 3                      # contribuição de p3 quando t é grande
-
-        # Calcula o ponto (x, y) contínuo e arredonda para o grid inteiro de pixels
-        x_cont = b0 * p0[0] + b1 * p1[0] + b2 * p2[0] + b3 * p3[0]  # x(t) real
-        y_cont = b0 * p0[1] + b1 * p1[1] + b2 * p2[1] + b3 * p3[1]  # y(t) real
-        x = round(x_cont)  # x: inteiro no grid
-        y = round(y_cont)  # y: inteiro no grid
+    # Amostragem uniforme de t em [0, 1] (diferenças progressivas)
+    for x_cont, y_cont in calcular_amostras_bezier_cubica(p0, p1, p2, p3, num_segmentos):
+        x = round(round(x_cont, CASAS_AMOSTRA))  # x: inteiro no grid
+        y = round(round(y_cont, CASAS_AMOSTRA))  # y: inteiro no grid
 
         # Evita duplicar pontos iguais consecutivos (mesma célula de pixel)
         if not pontos_da_curva or pontos_da_curva[-1] != (x, y):
@@ -74,31 +200,262 @@ def calcular_pontos_bezier_cubica(p0, p1, p2, p3, num_segmentos=20):
     return pontos_da_curva
 
 
-def rasterizar_curva_bezier(p0, p1, p2, p3, num_segmentos=20):
+def rasterizar_curva_bezier(p0, p1, p2, p3, num_segmentos=None, tolerancia=TOLERANCIA_PADRAO):
     """
-    Calcula os pontos da curva e usa Bresenham para gerar os pixels.
+    Calcula os pontos da curva e usa Bresenham para gerar os pixels, em
+    ordem de percurso e sem repetições. Com num_segmentos=None, a amostragem
+    é adaptativa (ver numero_segmentos_adaptativo).
 
     Returns:
-        list: A lista final de pixels a serem desenhados.
+        PixelBuffer: Os pixels finais a serem desenhados.
     """
-    # pixels_finais: lista de tuplas (x, y) de todos os pixels dos segmentos rasterizados
-    pixels_finais = []
+    return PixelBuffer(iterar_curva_bezier(p0, p1, p2, p3, num_segmentos, tolerancia))
+
 
+def iterar_curva_bezier(p0, p1, p2, p3, num_segmentos=None, tolerancia=TOLERANCIA_PADRAO):
+    """
+    Versão geradora de rasterizar_curva_bezier: produz os pixels da curva em
+    ordem de percurso, cada um uma única vez.
+    """
     # 1. Calcula os vértices da polilinha que aproxima a curva
     # pontos_da_curva: lista de vértices (x, y) inteiros conectados em sequência
-    pontos_da_curva = calcular_pontos_bezier_cubica(p0, p1, p2, p3, num_segmentos)
-
-    # 2. Usa Bresenham entre cada par consecutivo de amostras
-    for i in range(len(pontos_da_curva) - 1):
-        # i: índice do segmento atual da polilinha (de 0 até n-2)
-        ponto_atual = pontos_da_curva[i]        # vértice i
-        proximo_ponto = pontos_da_curva[i + 1]  # vértice i+1
-
-        # Rasteriza o segmento com Bresenham (lista de pixels inteiros)
-        segmento = calcular_linha_bresenham(ponto_atual, proximo_ponto)
-        # segmento: lista de (x, y) do traçado entre ponto_atual e proximo_ponto
-        pixels_finais.extend(segmento)  # concatena os pixels deste segmento
-
-    # Remove duplicados que podem ocorrer nas junções dos segmentos
-    # set: elimina repetidos; list(...) retransforma em lista
-    return list(set(pixels_finais))
\ No newline at end of file
+    pontos_da_curva = calcular_pontos_bezier_cubica(p0, p1, p2, p3, num_segmentos, tolerancia)
+
+    # 2. Usa Bresenham entre cada par consecutivo de amostras, todos de uma vez
+    # segmentos: (x1, y1, x2, y2) do vértice i ao vértice i+1
+    segmentos = [(*pontos_da_curva[i], *pontos_da_curva[i + 1]) for i in range(len(pontos_da_curva) - 1)]
+
+    # Remove duplicados que ocorrem nas junções (e em laços) da curva
+    # vistos: pixels já produzidos; limitado ao tamanho da própria curva
+    vistos = set()
+    for pixel in map(tuple, calcular_linhas_bresenham_lote(segmentos).tolist()):
+        if pixel not in vistos:
+            vistos.add(pixel)
+            yield pixel
+
+
+def rasterizar_curvas_bezier_lote(controles, num_segmentos=None, tolerancia=TOLERANCIA_PADRAO):
+    """
+    Rasteriza várias cúbicas com poucas chamadas NumPy: amostragem em lote
+    (avaliar_bezier_lote, uma chamada por número de segmentos distinto),
+    Bresenham em lote para todos os segmentos e remoção de repetições por curva.
+
+    Args:
+        controles: Array-like (N, 4, 2) com os pontos de controle de N curvas.
+        num_segmentos (int): Fixo para todas; se None, adaptativo por curva.
+        tolerancia (float): Erro máximo (em células) usado no modo adaptativo.
+
+    Returns:
+        list: N PixelBuffers, iguais aos de rasterizar_curva_bezier para cada curva.
+    """
+    c = np.asarray(controles, dtype=np.int64).reshape(-1, 4, 2)
+    if len(c) == 0:
+        return []
+    # Agrupa as curvas pelo número de segmentos para avaliar cada grupo numa chamada
+    if num_segmentos is None:
+        segmentos_por_curva = [numero_segmentos_adaptativo(*curva.tolist(), tolerancia=tolerancia) for curva in c]
+    else:
+        segmentos_por_curva = [num_segmentos] * len(c)
+    grupos = {}
+    for i, n in enumerate(segmentos_por_curva):
+        grupos.setdefault(n, []).append(i)
+
+    # Segmentos (x1, y1, x2, y2) de todas as curvas, com o índice da curva dona
+    todos_segmentos = []
+    donos = []
+    for n, indices in grupos.items():
+        amostras = np.round(np.round(avaliar_bezier_lote(c[indices], n), CASAS_AMOSTRA)).astype(np.int64)
+        segmentos = np.concatenate([amostras[:, :-1], amostras[:, 1:]], axis=2).reshape(-1, 4)  # (G·n, 4)
+        # Amostras repetidas consecutivas (mesma célula) são descartadas, como em
+        # calcular_pontos_bezier_cubica: uma curva toda numa célula fica sem segmentos
+        distintos = np.any(segmentos[:, :2] != segmentos[:, 2:], axis=1)
+        todos_segmentos.append(segmentos[distintos])
+        donos.append(np.repeat(indices, n)[distintos])
+    todos_segmentos = np.concatenate(todos_segmentos)
+    donos = np.concatenate(donos)
+    if len(todos_segmentos) == 0:
+        return [PixelBuffer() for _ in range(len(c))]
+
+    pixels = calcular_linhas_bresenham_lote(todos_segmentos)
+    passos = np.abs(todos_segmentos[:, 2:] - todos_segmentos[:, :2]).max(axis=1) + 1
+    curva_do_pixel = np.repeat(donos, passos)
+
+    # Primeira ocorrência de cada (curva, x, y), preservando a ordem de percurso
+    # Chave inteira única por (curva, x, y): coordenadas relativas ao mínimo do lote
+    x = pixels[:, 0] - pixels[:, 0].min()
+    y = pixels[:, 1] - pixels[:, 1].min()
+    largura, altura = int(x.max()) + 1, int(y.max()) + 1
+    if len(c) * largura * altura < 2 ** 62:
+        chaves = (curva_do_pixel * largura + x) * altura + y
+        _, primeiros = np.unique(chaves, return_index=True)
+    else:  # lote gigantesco: a chave não cabe em 64 bits
+        _, primeiros = np.unique(np.stack([curva_do_pixel, x, y], axis=1), axis=0, return_index=True)
+    ordem = primeiros[np.lexsort((primeiros, curva_do_pixel[primeiros]))]
+    unicos = pixels[ordem]
+    limites = np.searchsorted(curva_do_pixel[ordem], np.arange(len(c) + 1))
+    return [PixelBuffer.de_numpy(unicos[limites[i]:limites[i + 1]]) for i in range(len(c))]
+
+
+# --- Grau qualquer, Bézier composta e B-spline (roteiro, item 6) ---
+
+@lru_cache(maxsize=128)
+def matriz_base_bezier(grau, num_segmentos):
+    """
+    Matriz de Bernstein (num_segmentos + 1, grau + 1) para t = i / num_segmentos.
+
+    Fica em cache por (grau, num_segmentos) e é somente leitura.
+    """
+    t = np.linspace(0.0, 1.0, num_segmentos + 1)[:, None]
+    i = np.arange(grau + 1)
+    binomiais = np.array([math.comb(grau, k) for k in i], dtype=np.float64)
+    base = binomiais * t ** i * (1.0 - t) ** (grau - i)
+    base.flags.writeable = False
+    return base
+
+
+@lru_cache(maxsize=128)
+def matriz_base_bspline(grau, num_segmentos):
+    """
+    Matriz (num_segmentos + 1, grau + 1) da B-spline uniforme de um trecho.
+
+    A linha s traz os pesos de P_i..P_{i+grau} em t = s / num_segmentos:
+    peso_j = N(grau + t - j), com N a B-spline cardinal de grau `grau`,
+        N(x) = 1/grau! · Σ_k (-1)^k · C(grau + 1, k) · max(x - k, 0)^grau.
+    Fica em cache por (grau, num_segmentos) e é somente leitura.
+    """
+    if grau < 1:
+        raise ValueError("O grau da B-spline deve ser pelo menos 1.")
+    t = np.linspace(0.0, 1.0, num_segmentos + 1)[:, None]
+    x = grau + t - np.arange(grau + 1)                       # (n + 1, grau + 1)
+    base = np.zeros_like(x)
+    for k in range(grau + 2):
+        base += (-1) ** k * math.comb(grau + 1, k) * np.maximum(x - k, 0.0) ** grau
+    base /= math.factorial(grau)
+    base.flags.writeable = False
+    return base
+
+
+def _numero_segmentos_trechos(trechos, fator, tolerancia):
+    """
+    Número de segmentos (comum a todos os trechos (S, d + 1, 2)) pela fórmula
+    de Wang com o fator do tipo de curva, limitado pelo comprimento do
+    polígono de controle do trecho mais longo.
+    """
+    if tolerancia <= 0:
+        raise ValueError("A tolerância deve ser positiva.")
+    if trechos.shape[1] < 3:
+        m = 0.0  # trecho reto: um segmento basta
+    else:
+        segundas = trechos[:, :-2] - 2 * trechos[:, 1:-1] + trechos[:, 2:]
+        m = float(np.hypot(segundas[..., 0], segundas[..., 1]).max())
+    n = math.ceil(math.sqrt(fator * m / tolerancia))
+    lados = np.diff(trechos, axis=1)
+    comprimento = float(np.hypot(lados[..., 0], lados[..., 1]).sum(axis=1).max())
+    return max(1, min(n, math.ceil(comprimento)))
+
+
+def _avaliar_trechos(trechos, base):
+    """Amostras (S · n + 1, 2) dos trechos encadeados, sem repetir as junções."""
+    amostras = np.einsum('sk,tkd->tsd', base, trechos)      # (S, n + 1, 2)
+    return np.concatenate([amostras[:1, 0], amostras[:, 1:].reshape(-1, 2)])
+
+
+def avaliar_bezier_grau_n(pontos, num_segmentos=None, tolerancia=TOLERANCIA_PADRAO):
+    """
+    Amostras de uma Bézier de grau len(pontos) - 1 como um produto B · P.
+
+    Returns:
+        numpy.ndarray: Array (num_segmentos + 1, 2) de floats.
+    """
+    p = np.asarray(pontos, dtype=np.float64).reshape(-1, 2)
+    if len(p) < 2:
+        return p.copy()
+    grau = len(p) - 1
+    if num_segmentos is None:
+        num_segmentos = _numero_segmentos_trechos(p[None], grau * (grau - 1) / 8, tolerancia)
+    return matriz_base_bezier(grau, num_segmentos) @ p
+
+
+def avaliar_bezier_composta(pontos, grau=3, num_segmentos=None, tolerancia=TOLERANCIA_PADRAO):
+    """
+    Amostras de uma Bézier composta: trechos de `grau` que compartilham as
+    extremidades (P0..Pd, Pd..P2d, ...). Se sobrarem pontos, o último trecho
+    tem o grau que eles permitirem.
+
+    Returns:
+        numpy.ndarray: Array (k, 2) de floats, do primeiro ao último ponto.
+    """
+    p = np.asarray(pontos, dtype=np.float64).reshape(-1, 2)
+    if len(p) < 2:
+        return p.copy()
+    n_completos = (len(p) - 1) // grau
+    partes = [p[:1]]
+    if n_completos:
+        # Janelas P[i·d .. i·d + d] de todos os trechos completos, avaliadas juntas
+        inicios = np.arange(n_completos) * grau
+        trechos = p[inicios[:, None] + np.arange(grau + 1)]
+        n = num_segmentos or _numero_segmentos_trechos(trechos, grau * (grau - 1) / 8, tolerancia)
+        partes.append(_avaliar_trechos(trechos, matriz_base_bezier(grau, n))[1:])
+    resto = p[n_completos * grau:]
+    if len(resto) > 1:
+        partes.append(avaliar_bezier_grau_n(resto, num_segmentos, tolerancia)[1:])
+    return np.concatenate(partes)
+
+
+def avaliar_bspline(pontos, grau=3, num_segmentos=None, tolerancia=TOLERANCIA_PADRAO):
+    """
+    Amostras de uma B-spline uniforme de `grau` (3 = cúbica, C²).
+
+    As extremidades são repetidas grau - 1 vezes para que a curva comece no
+    primeiro ponto e termine no último.
+
+    Returns:
+        numpy.ndarray: Array (k, 2) de floats.
+    """
+    p = np.asarray(pontos, dtype=np.float64).reshape(-1, 2)
+    if len(p) < 2:
+        return p.copy()
+    p = np.concatenate([np.repeat(p[:1], grau - 1, axis=0), p, np.repeat(p[-1:], grau - 1, axis=0)])
+    n_trechos = len(p) - grau
+    trechos = p[np.arange(n_trechos)[:, None] + np.arange(grau + 1)]
+    n = num_segmentos or _numero_segmentos_trechos(trechos, 1 / 8, tolerancia)
+    return _avaliar_trechos(trechos, matriz_base_bspline(grau, n))
+
+
+def rasterizar_amostras(amostras):
+    """
+    Arredonda as amostras, liga as consecutivas com Bresenham (em lote) e
+    devolve os pixels em ordem de percurso, cada um uma única vez.
+
+    Returns:
+        PixelBuffer: Os pixels da polilinha que aproxima a curva.
+    """
+    pontos = np.asarray(amostras, dtype=np.float64).reshape(-1, 2)
+    pontos = np.round(np.round(pontos, CASAS_AMOSTRA)).astype(np.int64)
+    # Evita segmentos degenerados entre amostras na mesma célula
+    distintos = np.ones(len(pontos), dtype=bool)
+    distintos[1:] = np.any(pontos[1:] != pontos[:-1], axis=1)
+    pontos = pontos[distintos]
+    if len(pontos) < 2:
+        return PixelBuffer()  # curva toda numa célula: sem segmentos, como em iterar_curva_bezier
+    pixels = calcular_linhas_bresenham_lote(np.concatenate([pontos[:-1], pontos[1:]], axis=1))
+    # Primeira ocorrência de cada pixel (chave inteira x·altura + y)
+    x = pixels[:, 0] - pixels[:, 0].min()
+    y = pixels[:, 1] - pixels[:, 1].min()
+    _, primeiros = np.unique(x * (int(y.max()) + 1) + y, return_index=True)
+    return PixelBuffer.de_numpy(pixels[np.sort(primeiros)])
+
+
+def rasterizar_bezier_grau_n(pontos, num_segmentos=None, tolerancia=TOLERANCIA_PADRAO):
+    """Pixels de uma Bézier de grau len(pontos) - 1 (ver avaliar_bezier_grau_n)."""
+    return rasterizar_amostras(avaliar_bezier_grau_n(pontos, num_segmentos, tolerancia))
+
+
+def rasterizar_bezier_composta(pontos, grau=3, num_segmentos=None, tolerancia=TOLERANCIA_PADRAO):
+    """Pixels de uma Bézier composta (ver avaliar_bezier_composta)."""
+    return rasterizar_amostras(avaliar_bezier_composta(pontos, grau, num_segmentos, tolerancia))
+
+
+def rasterizar_bspline(pontos, grau=3, num_segmentos=None, tolerancia=TOLERANCIA_PADRAO):
+    """Pixels de uma B-spline uniforme (ver avaliar_bspline)."""
+    return rasterizar_amostras(avaliar_bspline(pontos, grau, num_segmentos, tolerancia))
@@ -0,0 +1,216 @@
+# algoritmos/pixels.py
+"""
+Representação compacta de pixels e utilitários para consumo em streaming.
+
+PixelBuffer guarda as coordenadas intercaladas (x0, y0, x1, y1, ...) num
+array('i') contíguo: 8 bytes por pixel, contra ~70+ bytes de uma tupla (x, y)
+com dois ints dentro de uma lista. É o tipo devolvido pelos rasterizadores e
+o armazenado em parametros['pontos'] dos desenhos do tipo "Pontos"; iterar
+sobre ele continua produzindo tuplas (x, y), então o código existente que só
+percorre/indexa os pixels não muda.
+
+Os rasterizadores têm versões geradoras (iterar_*) que produzem pixels (x, y)
+um a um. Para consumidores vetorizados (pintura com NumPy, exportação,
+ocupação do flood fill) é mais eficiente receber blocos: arrays (k, 2) de
+inteiros com no máximo `tamanho_bloco` pixels cada, o que mantém a memória
+limitada mesmo para formas enormes.
+
+Regiões preenchidas são mais compactas como faixas horizontais
+(y, x_inicio, x_fim), inclusivas: um disco de raio 100 tem ~31 mil pixels,
+mas só 201 faixas. pixels_de_faixas e faixas_de_pixels convertem entre as
+duas formas; recortar_faixas limita as faixas a uma janela retangular.
+"""
+
+from array import array
+from itertools import chain, islice
+
+import numpy as np
+
+# Pixels por bloco: grande o bastante para amortizar o custo do NumPy,
+# pequeno o bastante para não pesar na memória (~128 KB por bloco).
+TAMANHO_BLOCO_PADRAO = 8192
+
+
+class PixelBuffer:
+    """Sequência de pixels (x, y) inteiros apoiada em array('i')."""
+    __slots__ = ('_coords',)
+
+    def __init__(self, pixels=()):
+        self._coords = array('i')  # x0, y0, x1, y1, ...
+        self.extend(pixels)
+
+    @classmethod
+    def de_numpy(cls, pontos):
+        """Cria um buffer a partir de um array (k, 2) de inteiros."""
+        buffer = cls()
+        buffer.extend(np.asarray(pontos).reshape(-1, 2))
+        return buffer
+
+    def append(self, pixel):
+        x, y = pixel
+        self._coords.append(x)
+        self._coords.append(y)
+
+    def extend(self, pixels):
+        """Acrescenta pixels de outro PixelBuffer, de um array (k, 2) ou de um iterável de pares."""
+        if isinstance(pixels, PixelBuffer):
+            self._coords.extend(pixels._coords)
+        elif isinstance(pixels, np.ndarray):
+            self._coords.frombytes(np.ascontiguousarray(pixels, dtype=np.intc).tobytes())
+        else:
+            self._coords.extend(chain.from_iterable(pixels))
+
+    def deduplicar(self):
+        """Remove pixels repetidos (no próprio buffer), preservando a ordem da primeira ocorrência."""
+        pontos = self.como_numpy().astype(np.int64)
+        if len(pontos) < 2:
+            return
+        # Chave única de 64 bits por pixel: x nos 32 bits altos, y nos baixos
+        chaves = (pontos[:, 0] << 32) | (pontos[:, 1] & 0xFFFFFFFF)
+        _, primeiros = np.unique(chaves, return_index=True)
+        primeiros.sort()
+        if len(primeiros) < len(pontos):
+            self._coords = array('i')
+            self._coords.frombytes(pontos[primeiros].astype(np.intc).tobytes())
+
+    def como_numpy(self):
+        """Cópia dos pixels como array NumPy (k, 2) de int32 (np.intc)."""
+        return np.frombuffer(self._coords, dtype=np.intc).reshape(-1, 2).copy()
+
+    def __array__(self, dtype=None, copy=None):
+        pontos = self.como_numpy()
+        return pontos if dtype is None else pontos.astype(dtype, copy=False)
+
+    def __len__(self):
+        return len(self._coords) // 2
+
+    def __iter__(self):
+        coords = iter(self._coords)
+        return zip(coords, coords)  # pares consecutivos (x, y)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            buffer = PixelBuffer()
+            inicio, fim, passo = indice.indices(len(self))
+            if passo == 1:
+                buffer._coords = self._coords[2 * inicio:2 * max(inicio, fim)]
+            else:
+                buffer.extend(self.como_numpy()[indice])
+            return buffer
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("índice de pixel fora do intervalo")
+        return (self._coords[2 * indice], self._coords[2 * indice + 1])
+
+    def __eq__(self, outro):
+        if isinstance(outro, PixelBuffer):
+            return self._coords == outro._coords
+        try:
+            return len(self) == len(outro) and all(a == tuple(b) for a, b in zip(self, outro))
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None  # mutável, como list
+
+    def __repr__(self):
+        return f"PixelBuffer({len(self)} pixels)"
+
+    def __reduce__(self):
+        return (_reconstruir_pixel_buffer, (self._coords,))
+
+
+def _reconstruir_pixel_buffer(coords):
+    buffer = PixelBuffer()
+    buffer._coords = coords
+    return buffer
+
+
+def pixels_de_faixas(faixas):
+    """
+    Expande faixas horizontais (y, x_inicio, x_fim), inclusivas, em pixels.
+
+    Returns:
+        PixelBuffer: Os pixels de cada faixa, da esquerda para a direita, na
+        ordem das faixas. Faixas vazias (x_fim < x_inicio) são ignoradas.
+    """
+    if not isinstance(faixas, np.ndarray):
+        faixas = list(faixas)
+    f = np.asarray(faixas, dtype=np.int64).reshape(-1, 3)
+    comprimentos = np.maximum(f[:, 2] - f[:, 1] + 1, 0)
+    total = int(comprimentos.sum())
+    pontos = np.empty((total, 2), dtype=np.int64)
+    # Deslocamento de cada pixel dentro da sua faixa: 0, 1, ..., comprimento-1
+    inicio = np.cumsum(comprimentos) - comprimentos
+    deslocamento = np.arange(total) - np.repeat(inicio, comprimentos)
+    pontos[:, 0] = np.repeat(f[:, 1], comprimentos) + deslocamento
+    pontos[:, 1] = np.repeat(f[:, 0], comprimentos)
+    return PixelBuffer.de_numpy(pontos)
+
+
+def recortar_faixas(faixas, janela):
+    """
+    Parte de cada faixa (y, x_inicio, x_fim) dentro da janela (xmin, ymin, xmax, ymax).
+
+    Returns:
+        numpy.ndarray: Array (k, 3) de int64, na ordem original, sem as faixas
+        que ficam inteiramente fora.
+    """
+    xmin, ymin, xmax, ymax = janela
+    if not isinstance(faixas, np.ndarray):
+        faixas = list(faixas)
+    f = np.asarray(faixas, dtype=np.int64).reshape(-1, 3)
+    recortadas = np.stack([f[:, 0], np.maximum(f[:, 1], xmin), np.minimum(f[:, 2], xmax)], axis=1)
+    visiveis = (f[:, 0] >= ymin) & (f[:, 0] <= ymax) & (recortadas[:, 1] <= recortadas[:, 2])
+    return recortadas[visiveis]
+
+
+def faixas_de_pixels(pixels):
+    """
+    Agrupa pixels em faixas horizontais máximas (inverso de pixels_de_faixas).
+
+    Returns:
+        numpy.ndarray: Array (k, 3) de int64 com (y, x_inicio, x_fim), ordenado
+        por y e depois por x; pixels repetidos contam uma vez.
+    """
+    if isinstance(pixels, PixelBuffer):
+        pts = pixels.como_numpy()
+    else:
+        pts = np.asarray(pixels if isinstance(pixels, np.ndarray) else list(pixels), dtype=np.int64)
+    pts = pts.reshape(-1, 2).astype(np.int64, copy=False)
+    if len(pts) == 0:
+        return np.empty((0, 3), dtype=np.int64)
+    ordem = np.lexsort((pts[:, 0], pts[:, 1]))  # por y e depois por x
+    x, y = pts[ordem, 0], pts[ordem, 1]
+    # Nova faixa onde muda a linha ou há um buraco em x; repetidos (dx = 0) continuam a faixa
+    quebra = np.ones(len(x), dtype=bool)
+    quebra[1:] = (y[1:] != y[:-1]) | (x[1:] - x[:-1] > 1)
+    inicios = np.flatnonzero(quebra)
+    fins = np.append(inicios[1:], len(x)) - 1
+    return np.stack([y[inicios], x[inicios], x[fins]], axis=1)
+
+
+def agrupar_em_blocos(pixels, tamanho_bloco=TAMANHO_BLOCO_PADRAO):
+    """
+    Agrupa um iterável de pixels (x, y) em blocos NumPy.
+
+    Args:
+        pixels: Qualquer iterável de pares (x, y), inclusive geradores.
+        tamanho_bloco (int): Número máximo de pixels por bloco.
+
+    Yields:
+        numpy.ndarray: Arrays (k, 2) de inteiros, com 1 <= k <= tamanho_bloco.
+    """
+    if isinstance(pixels, (PixelBuffer, np.ndarray)):
+        # Já materializado: os blocos são apenas fatias do array
+        pontos = np.asarray(pixels).reshape(-1, 2)
+        for inicio in range(0, len(pontos), tamanho_bloco):
+            yield pontos[inicio:inicio + tamanho_bloco]
+        return
+    iterador = iter(pixels)
+    while True:
+        # Achata os pares do próximo bloco em x0, y0, x1, y1, ... para o fromiter
+        coords = np.fromiter(chain.from_iterable(islice(iterador, tamanho_bloco)), dtype=np.int64)
+        if coords.size == 0:
+            return
+        yield coords.reshape(-1, 2)
@@ -1,5 +1,9 @@
-from typing import List, Tuple
-from algoritmos.bresenham import calcular_linha_bresenham
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from algoritmos.bresenham import calcular_linhas_bresenham_lote
+from algoritmos.pixels import PixelBuffer
 
 """
 Roteiro de apresentação – Polilinha
@@ -10,32 +14,141 @@ Roteiro de apresentação – Polilinha
 2) Ideia
    - Para cada par consecutivo de pontos, usamos Bresenham para rasterizar a linha.
    - Concatenamos todos os pixels dos segmentos.
+   - Os segmentos são rasterizados juntos pela versão em lote de Bresenham
+     (mesmos pixels da versão escalar, sem laço em Python por segmento).
+   - Em modo streaming (iterar_polilinha_blocos), os segmentos são processados
+     em grupos, de modo que polilinhas enormes não ocupam memória de uma vez.
 
 3) Observações
-   - Não removemos duplicatas entre segmentos; se quiser, pode deduplicar depois.
+   - Vértices compartilhados: o primeiro pixel de cada segmento (a partir do
+     segundo) é o último do anterior, então não é gerado; numa polilinha
+     fechada (último vértice = primeiro) o pixel inicial também não se repete.
+   - Autointerseções (a polilinha cruzando a si mesma) ainda repetem pixels;
+     com deduplicar=True eles são removidos com um bitmap do retângulo
+     envolvente dos vértices (1 byte por célula), mantendo a ordem.
    - Se houver menos de 2 pontos, não há segmento a rasterizar.
+   - Com janela=(xmin, ymin, xmax, ymax), cada segmento gera só os passos de
+     Bresenham visíveis (calcular_linhas_bresenham_lote com janela): o
+     resultado são os pixels da polilinha inteira que caem na janela.
 """
 
-def rasterizar_polilinha(pontos: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+Janela = Tuple[int, int, int, int]  # (xmin, ymin, xmax, ymax), inclusiva
+
+# Acima desta área (em células) o bitmap de deduplicação ocuparia memória
+# demais; usamos então as chaves dos pixels já vistos (np.isin).
+AREA_MAXIMA_BITMAP = 1 << 24
+
+
+def rasterizar_polilinha(pontos: List[Tuple[int, int]], deduplicar: bool = False,
+                         janela: Optional[Janela] = None) -> PixelBuffer:
     """
     Rasteriza uma polilinha conectando uma lista de pontos em sequência.
 
     Args:
         pontos: Uma lista de tuplas (x, y) representando os vértices da polilinha.
+        deduplicar: Se True, remove também os pixels repetidos por autointerseções.
+        janela: (xmin, ymin, xmax, ymax) opcional; só os pixels dentro dela são gerados.
 
     Returns:
-        Uma lista de pixels (x, y) que formam a polilinha.
+        Um PixelBuffer com os pixels (x, y) que formam a polilinha, sem repetir
+        os vértices compartilhados entre segmentos.
+    """
+    pixels = PixelBuffer()
+    for bloco in iterar_polilinha_blocos(pontos, deduplicar=deduplicar, janela=janela):
+        pixels.extend(bloco)  # blocos NumPy entram direto, sem passar por tuplas
+    return pixels
+
+
+def iterar_polilinha(pontos: List[Tuple[int, int]], deduplicar: bool = False,
+                     janela: Optional[Janela] = None) -> Iterator[Tuple[int, int]]:
+    """Versão geradora de rasterizar_polilinha: produz os pixels (x, y) em ordem."""
+    for bloco in iterar_polilinha_blocos(pontos, deduplicar=deduplicar, janela=janela):
+        yield from map(tuple, bloco.tolist())
+
+
+def iterar_polilinha_blocos(pontos: List[Tuple[int, int]], segmentos_por_bloco: int = 1024,
+                            deduplicar: bool = False, janela: Optional[Janela] = None) -> Iterator[np.ndarray]:
+    """
+    Rasteriza a polilinha em uma passada, em blocos: cada bloco é o array
+    (k, 2) de pixels de até `segmentos_por_bloco` segmentos consecutivos
+    (Bresenham em lote), sem o pixel de junção repetido (ver roteiro, item 3).
     """
-    pixels_total = []  # acumula todos os pixels dos segmentos consecutivos
     if len(pontos) < 2:
-        return []      # menos de 2 pontos => nada a ligar
-
-    # Loop de segmentos: conecta ponto i ao ponto i+1
-    for i in range(len(pontos) - 1):
-        ponto_inicial = pontos[i]      # vértice atual
-        ponto_final = pontos[i + 1]    # próximo vértice
-        # Rasteriza o segmento com Bresenham e adiciona ao total
-        pixels_linha = calcular_linha_bresenham(ponto_inicial, ponto_final)
-        pixels_total.extend(pixels_linha)
-    
-    return pixels_total
+        return         # menos de 2 pontos => nada a ligar
+
+    vertices = np.asarray(pontos, dtype=np.int64).reshape(-1, 2)
+    # Vértices repetidos em sequência formam segmentos de um pixel só, que já
+    # seria omitido; descartá-los garante que o último segmento termina no
+    # último pixel (usado no fechamento abaixo)
+    distintos = np.ones(len(vertices), dtype=bool)
+    distintos[1:] = np.any(vertices[1:] != vertices[:-1], axis=1)
+    vertices = vertices[distintos]
+    visivel = None
+    if janela is not None:
+        xmin, ymin, xmax, ymax = janela
+        visivel = np.array([[xmin, ymin], [xmax, ymax]], dtype=np.int64)
+        dentro = np.all((vertices >= visivel[0]) & (vertices <= visivel[1]), axis=1)
+    if len(vertices) == 1:
+        if visivel is None or dentro[0]:
+            yield vertices  # todos os pontos coincidem: um único pixel
+        return
+    n_segmentos = len(vertices) - 1
+    fechada = n_segmentos > 1 and bool(np.all(vertices[0] == vertices[-1]))
+    # O pixel final da polilinha fechada só sai no último bloco se estiver visível
+    cortar_fim = fechada and (visivel is None or bool(dentro[0]))
+    filtro = None
+    if deduplicar:
+        if visivel is None:
+            filtro = _FiltroRepetidos(vertices)
+        else:
+            # Pixels visíveis ficam na interseção do envoltório com a janela
+            cantos = np.stack([np.maximum(vertices.min(axis=0), visivel[0]),
+                               np.minimum(vertices.max(axis=0), visivel[1])])
+            if np.any(cantos[0] > cantos[1]):
+                return  # envoltório fora da janela: nada visível
+            filtro = _FiltroRepetidos(cantos)
+
+    # Grupos de segmentos: ponto i ligado ao ponto i+1, montados como (x1, y1, x2, y2)
+    for inicio in range(0, n_segmentos, segmentos_por_bloco):
+        fim = min(inicio + segmentos_por_bloco, n_segmentos)
+        segmentos = np.concatenate([vertices[inicio:fim], vertices[inicio + 1:fim + 1]], axis=1)
+        # Todo segmento, exceto o primeiro da polilinha, começa no fim do anterior
+        omitir = np.ones(fim - inicio, dtype=bool)
+        omitir[0] = inicio > 0
+        bloco = calcular_linhas_bresenham_lote(segmentos, omitir_primeiro=omitir, janela=janela)
+        if cortar_fim and fim == n_segmentos:
+            bloco = bloco[:-1]  # último pixel = primeiro pixel da polilinha
+        if filtro is not None:
+            bloco = filtro.novos(bloco)
+        if len(bloco):
+            yield bloco
+
+
+class _FiltroRepetidos:
+    """Lembra os pixels já produzidos e filtra, de cada bloco, os inéditos (em ordem)."""
+
+    def __init__(self, vertices: np.ndarray):
+        # Os pixels de Bresenham ficam no retângulo envolvente dos vértices
+        self.minimo = vertices.min(axis=0)
+        largura, altura = (vertices.max(axis=0) - self.minimo + 1).tolist()
+        self.altura = altura
+        if largura * altura <= AREA_MAXIMA_BITMAP:
+            self.bitmap = np.zeros(largura * altura, dtype=bool)
+            self.vistos = None
+        else:
+            self.bitmap = None
+            self.vistos = np.empty(0, dtype=np.int64)  # chaves ordenadas
+
+    def novos(self, bloco: np.ndarray) -> np.ndarray:
+        relativos = bloco - self.minimo
+        chaves = relativos[:, 0] * self.altura + relativos[:, 1]
+        # Primeira ocorrência de cada pixel dentro do bloco
+        _, primeiros = np.unique(chaves, return_index=True)
+        primeiros.sort()
+        if self.bitmap is not None:
+            primeiros = primeiros[~self.bitmap[chaves[primeiros]]]
+            self.bitmap[chaves[primeiros]] = True
+        else:
+            primeiros = primeiros[~np.isin(chaves[primeiros], self.vistos, assume_unique=True)]
+            self.vistos = np.union1d(self.vistos, chaves[primeiros])
+        return bloco[primeiros]
@@ -11,163 +11,302 @@ Roteiro de apresentação – Preenchimento
 3) Versão Multi (vários polígonos)
 	- Junta todas as arestas e varre de uma vez para aplicar regra par-ímpar global.
 
-4) Flood Fill (DFS/BFS)
+4) Flood Fill (por faixas, Smith/Heckbert)
 	- Expande a partir de uma semente por vizinhança (4-conexa), respeitando limites/bordas.
-
-5) Dicas de demonstração
+	- Em vez de empilhar os 4 vizinhos de cada pixel, estende a semente para a esquerda e
+	  a direita até a borda (uma faixa) e só empilha uma semente por corrida livre nas
+	  linhas de cima e de baixo.
+	- Bordas/ocupação e visitados ficam num único bitmap NumPy do tamanho dos limites.
+
+5) Modo streaming (iterar_*)
+	- Cada função tem uma versão geradora que produz os pixels à medida que são encontrados.
+	- No scanline, duplicatas só podem ocorrer na mesma linha y, então basta deduplicar por linha
+	  (memória O(largura) em vez de O(área)); no flood, o bitmap de visitados já evita repetição.
+
+6) Tabela de arestas (ET) e arestas ativas (AET)
+	- Em vez de testar todas as arestas em cada linha (O(H·E)), cada aresta entra na lista
+	  de ativas no seu y inferior e sai no superior: custo O(H + E + faixas).
+	- A interseção avança x += dx/dy a cada linha, guardada como inteiro + resto/dy
+	  (aritmética exata, sem divisão em ponto flutuante nem erro acumulado).
+	- A saída natural são faixas (y, x_inicio, x_fim); os pixels vêm de expandi-las.
+
+7) Saída em faixas (como_faixas=True)
+	- Os preencher_* podem devolver um array (k, 3) de faixas (y, x_inicio, x_fim) em vez
+	  dos pixels: uma região 200×200 vira 200 faixas em vez de 40 000 pixels.
+	- As faixas saem direto da varredura (scanline) e do preenchimento por faixas (flood).
+
+8) Regras de preenchimento (par-ímpar e não-zero)
+	- Par-ímpar: um ponto está dentro se a semi-reta até ele cruza um número ímpar de
+	  arestas; onde dois polígonos se sobrepõem (2 cruzamentos), fica um buraco.
+	- Não-zero: cada aresta guarda seu sentido (+1 subindo, -1 descendo); o ponto está
+	  dentro se a soma dos sentidos à sua esquerda (winding) não é zero. Com todos os
+	  polígonos no mesmo sentido (utils.geometria.garantir_ccw), preenche a união numa passada.
+	- A AET é a mesma; só muda como os pares (entrada, saída) são formados em cada linha.
+
+9) Scanline paralelo por bandas horizontais (trabalhadores > 1)
+	- O intervalo de y é dividido em bandas; cada processo de um ProcessPoolExecutor
+	  varre as bandas que recebe e devolve as faixas como array NumPy.
+	- A tabela de arestas é montada uma vez e enviada uma vez por processo (initializer);
+	  cada banda só recebe (y_inicio, y_fim, regra).
+	- Uma banda começa no meio das arestas: a interseção em y_inicio é obtida direto
+	  (x_int + k·passo, com o vai-um do resto por divmod), sem passar pelas linhas anteriores.
+	- Como as faixas de uma linha só dependem dessa linha, concatenar as bandas em ordem
+	  dá exatamente o resultado serial. Só compensa em grades/polígonos muito grandes.
+
+10) Dicas de demonstração
 	- Mostrar diferença entre borda aberta/fechada e o fechamento automático do polígono.
 	- Ilustrar por que ignorar horizontais e usar [ymin, ymax) evita artefatos.
 	- Flood: mostrar escolha automática de seed (centro da bbox) e limitação por bounds.
 """
 
-from typing import List, Tuple, Optional, Set  # tipos usados para clareza
-import math
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Tuple, Optional, Set, Union  # tipos usados para clareza
+
+import numpy as np
+
+from algoritmos.pixels import pixels_de_faixas
 
 Point = Tuple[int, int]  # alias para coordenada inteira (x, y)
+Faixa = Tuple[int, int, int]  # faixa horizontal (y, x_inicio, x_fim), inclusiva
+Ocupacao = Union[Set[Point], np.ndarray]  # células ocupadas: conjunto de pontos ou bitmap bool
 
-def preencher_scanline(vertices: List[Point]) -> List[Point]:
+# Regras de preenchimento do scanline (item 8 do roteiro)
+REGRA_PAR_IMPAR = 'par-impar'
+REGRA_NAO_ZERO = 'nao-zero'
+
+def preencher_scanline(vertices: List[Point], como_faixas: bool = False, regra: str = REGRA_PAR_IMPAR):
 	"""
 	Preenche um polígono simples usando o algoritmo de Scanline.
 
 	- vertices: lista de vértices (x, y) em ordem (horária ou anti-horária).
 				O polígono é considerado fechado (liga último ao primeiro).
-	- Retorna: lista de pixels (x, y) inteiros no interior (bordas incluídas).
+	- como_faixas: se True, devolve as faixas em vez dos pixels (ver item 7 do roteiro).
+	- regra: REGRA_PAR_IMPAR ou REGRA_NAO_ZERO (ver item 8 do roteiro).
+	- Retorna: PixelBuffer com os pixels (x, y) inteiros no interior (bordas incluídas).
+	"""
+	if como_faixas:
+		return _array_de_faixas(iterar_faixas_scanline(vertices, regra))
+	return pixels_de_faixas(iterar_faixas_scanline(vertices, regra))
+
+
+def iterar_scanline(vertices: List[Point], regra: str = REGRA_PAR_IMPAR) -> Iterator[Point]:
+	"""Versão geradora de preencher_scanline: produz os pixels linha a linha, sem repetição."""
+	for y, xi, xf in iterar_faixas_scanline(vertices, regra):
+		for x in range(xi, xf + 1):
+			yield (x, y)
+
+
+def iterar_faixas_scanline(vertices: List[Point], regra: str = REGRA_PAR_IMPAR) -> Iterator[Faixa]:
+	"""
+	Faixas horizontais (y, x_inicio, x_fim) do polígono preenchido, de baixo
+	para cima; numa mesma linha, disjuntas e em x crescente (inclusivas).
 	"""
+	_validar_regra(regra)
 	if not vertices or len(vertices) < 3:
-		return []
+		return
+	yield from _varrer_faixas(_tabela_de_arestas([vertices]), regra)
 
-	# Garante fechamento (evita depender de último==primeiro)
-	pts = list(vertices)  # cópia mutável dos vértices de entrada
-	if pts[0] != pts[-1]:
-		pts.append(pts[0])
 
-	min_y = min(y for _, y in pts)  # menor y dentre os vértices (limite inferior da varredura)
-	max_y = max(y for _, y in pts)  # maior y dentre os vértices (limite superior da varredura)
+def preencher_scanline_multi(poligonos: List[List[Point]], como_faixas: bool = False,
+							 regra: str = REGRA_PAR_IMPAR, trabalhadores: Optional[int] = None):
+	"""
+	Aplica Scanline considerando múltiplos polígonos ao mesmo tempo.
+
+	- poligonos: lista de polígonos; cada polígono é uma lista de vértices (x,y) em ordem.
+	- como_faixas: se True, devolve as faixas em vez dos pixels.
+	- regra: REGRA_PAR_IMPAR (sobreposições de duas camadas viram buracos) ou
+			 REGRA_NAO_ZERO (pelo sentido das arestas; com todos os polígonos no mesmo
+			 sentido, preenche a união).
+	- trabalhadores: se > 1, varre bandas horizontais em processos separados
+					 (ver item 9 do roteiro); o resultado é idêntico ao serial.
+	- Retorna: PixelBuffer com os pixels (x, y) preenchidos considerando todos como um só conjunto.
+	"""
+	if trabalhadores is not None and trabalhadores > 1:
+		faixas = faixas_scanline_paralelo(poligonos, regra, trabalhadores)
+	else:
+		faixas = _array_de_faixas(iterar_faixas_scanline_multi(poligonos, regra))
+	return faixas if como_faixas else pixels_de_faixas(faixas)
 
-	preenchidos: List[Point] = []  # lista final de pixels preenchidos
 
-	# Loop principal de varredura (scanline): percorre cada linha horizontal entre min_y e max_y.
-	# Invariante: para cada y, vamos coletar interseções com as arestas e preencher pares [entrada, saída].
-	for y in range(min_y, max_y + 1):
-		xs: List[float] = []  # interseções em x com a linha de varredura corrente
-		# Para cada aresta (par de vértices consecutivos), verifica se intersecta a linha y atual.
-		for i in range(len(pts) - 1):
-			x1, y1 = pts[i]       # ponto inicial da aresta
-			x2, y2 = pts[i + 1]   # ponto final da aresta
+def iterar_scanline_multi(poligonos: List[List[Point]], regra: str = REGRA_PAR_IMPAR) -> Iterator[Point]:
+	"""Versão geradora de preencher_scanline_multi: produz os pixels linha a linha, sem repetição."""
+	for y, xi, xf in iterar_faixas_scanline_multi(poligonos, regra):
+		for x in range(xi, xf + 1):
+			yield (x, y)
 
-			# Ignora arestas horizontais (não contribuem com interseções em y fixo)
-			if y1 == y2:
-				continue
 
-			ymin = min(y1, y2)     # y mínimo da aresta
-			ymax = max(y1, y2)     # y máximo da aresta
-			# Intervalo semiaberto [ymin, ymax): evita dupla contagem no vértice superior
-			if y >= ymin and y < ymax:
-				t = (y - y1) / (y2 - y1)  # parâmetro de interpolação ao longo da aresta
-				x = x1 + t * (x2 - x1)    # abscissa do ponto de interseção
-				xs.append(x)
+def iterar_faixas_scanline_multi(poligonos: List[List[Point]], regra: str = REGRA_PAR_IMPAR) -> Iterator[Faixa]:
+	"""Faixas (y, x_inicio, x_fim) de vários polígonos varridos juntos, numa única passada."""
+	_validar_regra(regra)
+	# Polígonos com menos de 3 vértices são ignorados
+	yield from _varrer_faixas(_tabela_de_arestas([v for v in poligonos if v and len(v) >= 3]), regra)
 
-		if not xs:
-			continue
 
-		xs.sort()  # ordena interseções em x para formar pares
-		for j in range(0, len(xs), 2):
-			if j + 1 >= len(xs):
-				break
-			x_in = xs[j]         # entrada no interior do polígono
-			x_out = xs[j + 1]    # saída do interior do polígono
-			# Ceil/Floor para cobrir integralmente os pixels entre as interseções
-			xi = math.ceil(min(x_in, x_out))  # primeiro pixel cheio no intervalo
-			xf = math.floor(max(x_in, x_out)) # último pixel cheio no intervalo
-			for x in range(xi, xf + 1):
-				preenchidos.append((x, y))
-
-	# Remove duplicados preservando ordem: percorre a lista e usa um set para filtrar repetidos.
-	vistos = set()              # pixels já vistos
-	unicos: List[Point] = []    # pixels únicos na ordem de preenchimento
-	for p in preenchidos:
-		if p not in vistos:
-			vistos.add(p)
-			unicos.append(p)
-	return unicos
-
-
-def preencher_scanline_multi(poligonos: List[List[Point]]) -> List[Point]:
+def faixas_scanline_paralelo(poligonos: List[List[Point]], regra: str = REGRA_PAR_IMPAR,
+							 trabalhadores: int = 2, bandas_por_trabalhador: int = 4) -> np.ndarray:
 	"""
-	Aplica Scanline considerando múltiplos polígonos ao mesmo tempo (regra par-ímpar).
+	Faixas (y, x_inicio, x_fim) de vários polígonos, varrendo bandas horizontais
+	num ProcessPoolExecutor. Mesmo resultado (e mesma ordem) de
+	iterar_faixas_scanline_multi, como array (k, 3) de int64.
 
-	- poligonos: lista de polígonos; cada polígono é uma lista de vértices (x,y) em ordem.
-	- Retorna: lista de pixels (x, y) inteiros preenchidos considerando todos como um só conjunto.
+	- bandas_por_trabalhador: mais bandas que processos equilibram a carga quando
+	  as linhas têm custos diferentes (muitas arestas concentradas numa região).
 	"""
-	# Filtra e normaliza polígonos válidos (fecha e decompõe em segmentos)
-	segmentos = []  # lista de pares ((x1,y1),(x2,y2)) representando todas as arestas
-	min_y_glb = None  # menor y entre todos os segmentos (varredura global)
-	max_y_glb = None  # maior y entre todos os segmentos (varredura global)
-	# Normaliza cada polígono de entrada: fecha (se necessário) e coleta suas arestas.
+	_validar_regra(regra)
+	tabela = _tabela_de_arestas([v for v in poligonos if v and len(v) >= 3])
+	if not tabela:
+		return _array_de_faixas([])
+	y_min = min(tabela)
+	y_max = max(a[0] for arestas in tabela.values() for a in arestas)  # exclusivo
+	num_bandas = max(1, min(trabalhadores * bandas_por_trabalhador, y_max - y_min))
+	cortes = [y_min + (y_max - y_min) * i // num_bandas for i in range(num_bandas + 1)]
+	bandas = [(y0, y1, regra) for y0, y1 in zip(cortes, cortes[1:]) if y0 < y1]
+	with ProcessPoolExecutor(max_workers=trabalhadores, initializer=_iniciar_trabalhador,
+							 initargs=(tabela,)) as executor:
+		# map devolve na ordem das bandas: basta concatenar
+		return np.concatenate(list(executor.map(_faixas_da_banda, bandas)))
+
+
+# Tabela de arestas do processo trabalhador (recebida uma vez no initializer)
+_tabela_trabalhador: Dict[int, List[List[int]]] = {}
+
+
+def _iniciar_trabalhador(tabela: Dict[int, List[List[int]]]) -> None:
+	global _tabela_trabalhador
+	_tabela_trabalhador = tabela
+
+
+def _faixas_da_banda(banda: Tuple[int, int, str]) -> np.ndarray:
+	"""Faixas das linhas y_inicio <= y < y_fim, no processo trabalhador."""
+	y_inicio, y_fim, regra = banda
+	return _array_de_faixas(_varrer_faixas(_tabela_trabalhador, regra, y_inicio, y_fim))
+
+
+def _validar_regra(regra: str) -> None:
+	if regra not in (REGRA_PAR_IMPAR, REGRA_NAO_ZERO):
+		raise ValueError(f"Regra de preenchimento desconhecida: {regra!r}")
+
+
+def _array_de_faixas(faixas: Iterator[Faixa]) -> np.ndarray:
+	"""Faixas (y, x_inicio, x_fim) num array (k, 3) de int64."""
+	return np.array(list(faixas), dtype=np.int64).reshape(-1, 3)
+
+
+def _tabela_de_arestas(poligonos: List[List[Point]]) -> Dict[int, List[List[int]]]:
+	"""
+	Tabela de arestas (ET): para cada y, as arestas cujo y inferior é y.
+
+	Cada aresta é guardada como [y_topo, x_int, resto, passo_int, passo_resto, dy, sentido],
+	com a abscissa da interseção representada exatamente como x_int + resto/dy
+	(0 <= resto < dy). A cada linha x avança dx/dy = passo_int + passo_resto/dy,
+	só com somas inteiras (ver item 6 do roteiro). sentido é +1 se a aresta
+	original sobe e -1 se desce (usado pela regra não-zero).
+	"""
+	tabela: Dict[int, List[List[int]]] = {}
 	for verts in poligonos:
-		if not verts or len(verts) < 3:
-			continue
 		pts = list(verts)  # cópia dos vértices do polígono atual
 		if pts[0] != pts[-1]:
-			pts.append(pts[0])
-		# Decompõe o polígono em segmentos (arestas contíguas) e atualiza faixa global de y.
-		for i in range(len(pts) - 1):
-			a = pts[i]
-			b = pts[i + 1]
-			segmentos.append((a, b))  # adiciona aresta (a->b) à lista global
-			# Atualiza faixa global de varredura
-			ay, by = a[1], b[1]  # coordenadas y dos extremos
-			lo = min(ay, by)     # y mínimo da aresta
-			hi = max(ay, by)     # y máximo da aresta
-			if min_y_glb is None or lo < min_y_glb:
-				min_y_glb = lo
-			if max_y_glb is None or hi > max_y_glb:
-				max_y_glb = hi
-
-	if not segmentos or min_y_glb is None or max_y_glb is None:
-		return []
-
-	preenchidos: List[Point] = []  # pixels preenchidos resultado da varredura global
-
-	# Varredura global (multi-polígono): mesmo princípio do scanline simples, agora considerando todas as arestas juntas.
-	for y in range(min_y_glb, max_y_glb + 1):
-		xs: List[float] = []  # interseções com a linha y atual
-		# Para cada segmento, acumula a interseção (se houver) com a linha y corrente.
-		for (x1, y1), (x2, y2) in segmentos:
-			# Ignora arestas horizontais
+			pts.append(pts[0])  # fecha o polígono (liga o último ao primeiro)
+		for (x1, y1), (x2, y2) in zip(pts, pts[1:]):
+			# Arestas horizontais não contribuem com interseções em y fixo
 			if y1 == y2:
 				continue
-			ymin = min(y1, y2)  # y inferior do segmento
-			ymax = max(y1, y2)  # y superior do segmento
-			# Intervalo semiaberto [ymin, ymax)
-			if y >= ymin and y < ymax:
-				t = (y - y1) / (y2 - y1)  # parâmetro de interpolação
-				x = x1 + t * (x2 - x1)    # ponto de interseção em x
-				xs.append(x)
-
-		if not xs:
-			continue
+			# Orienta de baixo para cima: ativa em [y_base, y_topo), semiaberto
+			sentido = 1
+			if y1 > y2:
+				x1, y1, x2, y2 = x2, y2, x1, y1
+				sentido = -1
+			dy = y2 - y1
+			passo_int, passo_resto = divmod(x2 - x1, dy)
+			tabela.setdefault(y1, []).append([y2, x1, 0, passo_int, passo_resto, dy, sentido])
+	return tabela
+
+
+def _varrer_faixas(tabela: Dict[int, List[List[int]]], regra: str = REGRA_PAR_IMPAR,
+				   y_inicio: Optional[int] = None, y_fim: Optional[int] = None) -> Iterator[Faixa]:
+	"""
+	Varredura com tabela de arestas ativas (AET): arestas entram ao atingir o
+	y inferior e saem no y superior; as interseções avançam incrementalmente.
+	Os pares (entrada, saída) de cada linha seguem a regra de preenchimento.
 
-		xs.sort()
-		for j in range(0, len(xs), 2):
-			if j + 1 >= len(xs):
-				break
-			x_in = xs[j]        # entrada no interior
-			x_out = xs[j + 1]   # saída do interior
-			# Idem ao caso simples: usa ceil/floor para cobrir pixels inteiros
-			xi = math.ceil(min(x_in, x_out))  # limite inteiro à esquerda
-			xf = math.floor(max(x_in, x_out)) # limite inteiro à direita
-			for x in range(xi, xf + 1):
-				preenchidos.append((x, y))
-
-	# Remove duplicados preservando ordem (mesmo procedimento do caso simples).
-	vistos = set()            # pixels já vistos
-	unicos: List[Point] = []  # saída sem duplicatas
-	for p in preenchidos:
-		if p not in vistos:
-			vistos.add(p)
-			unicos.append(p)
-	return unicos
+	y_inicio/y_fim restringem a varredura à banda y_inicio <= y < y_fim. A
+	tabela não é alterada (as arestas ativas são cópias), então pode ser
+	reaproveitada por várias bandas.
+	"""
+	nao_zero = regra == REGRA_NAO_ZERO
+	if not tabela:
+		return
+	inicios = sorted(tabela)  # linhas em que alguma aresta entra
+	proximo = 0               # índice em 'inicios' da próxima aresta a entrar
+	ativas: List[List[int]] = []
+	y = inicios[0]
+	if y_inicio is not None and y_inicio > y:
+		# Banda: arestas que entraram antes de y_inicio e ainda cruzam essa linha
+		proximo = bisect_left(inicios, y_inicio)
+		ativas = [_aresta_avancada(a, y_inicio - y_base)
+				  for y_base in inicios[:proximo] for a in tabela[y_base] if a[0] > y_inicio]
+		y = y_inicio
+	# Invariante: 'ativas' tem exatamente as arestas com y_base <= y < y_topo,
+	# cada uma com a interseção exata na linha y.
+	while ativas or proximo < len(inicios):
+		if not ativas:
+			y = inicios[proximo]  # salta linhas vazias entre partes desconexas
+		if y_fim is not None and y >= y_fim:
+			break
+		if proximo < len(inicios) and inicios[proximo] == y:
+			ativas.extend([a.copy() for a in tabela[inicios[proximo]]])
+			proximo += 1
+		ativas = [a for a in ativas if a[0] > y]  # remove as que terminaram em y
+		if ativas:
+			# Ordem pela interseção (quase ordenadas de uma linha para a outra)
+			ativas.sort(key=lambda a: a[1] + a[2] / a[5])
+			ultimo_xf = None
+			for entrada, saida in (_pares_nao_zero(ativas) if nao_zero else zip(ativas[::2], ativas[1::2])):
+				# ceil na entrada e floor na saída cobrem os pixels entre as interseções
+				xi = entrada[1] + (entrada[2] > 0)
+				xf = saida[1]
+				if xi > xf:
+					continue
+				if ultimo_xf is not None and xi <= ultimo_xf + 1:
+					ultimo_xf = max(ultimo_xf, xf)  # encosta/sobrepõe a anterior: une
+					continue
+				if ultimo_xf is not None:
+					yield (y, ultimo_xi, ultimo_xf)
+				ultimo_xi, ultimo_xf = xi, xf
+			if ultimo_xf is not None:
+				yield (y, ultimo_xi, ultimo_xf)
+			# Avança a interseção de cada aresta ativa para a linha y + 1
+			for a in ativas:
+				a[1] += a[3]
+				a[2] += a[4]
+				if a[2] >= a[5]:
+					a[2] -= a[5]
+					a[1] += 1
+		y += 1
+
+
+def _aresta_avancada(aresta: List[int], linhas: int) -> List[int]:
+	"""Cópia da aresta com a interseção avançada 'linhas' linhas acima, em O(1)."""
+	y_topo, x_int, resto, passo_int, passo_resto, dy, sentido = aresta
+	vai_um, resto = divmod(resto + linhas * passo_resto, dy)
+	return [y_topo, x_int + linhas * passo_int + vai_um, resto, passo_int, passo_resto, dy, sentido]
+
+
+def _pares_nao_zero(ativas: List[List[int]]) -> Iterator[Tuple[List[int], List[int]]]:
+	"""
+	Pares (entrada, saída) pela regra não-zero: somando o sentido das arestas da
+	esquerda para a direita, entra-se quando a soma (winding) deixa o zero e
+	sai-se quando volta a ele.
+	"""
+	winding = 0
+	entrada = None
+	for aresta in ativas:
+		if winding == 0:
+			entrada = aresta
+		winding += aresta[6]
+		if winding == 0:
+			yield entrada, aresta
 
 
 def _ponto_em_segmento(p: Point, a: Point, b: Point) -> bool:
@@ -236,15 +375,38 @@ def _escolher_seed(vertices: List[Point]) -> Optional[Point]:
 	return None
 
 
-def preencher_recursao(vertices: List[Point], seed: Optional[Point] = None) -> List[Point]:
-	"""Preenche área interna via flood fill (DFS iterativo) delimitada pelo polígono.
+def preencher_recursao(vertices: List[Point], seed: Optional[Point] = None, como_faixas: bool = False):
+	"""Preenche área interna via flood fill por faixas delimitada pelo polígono.
 
 	- vertices: polígono simples (fechado implicitamente)
 	- seed: ponto inicial; se None, será escolhido automaticamente
-	Retorna lista de pontos preenchidos (inclui borda).
+	- como_faixas: se True, devolve as faixas em vez dos pixels
+	Retorna PixelBuffer com os pontos preenchidos (inclui borda).
+	"""
+	faixas = _faixas_recursao(vertices, seed)
+	return _array_de_faixas(faixas) if como_faixas else pixels_de_faixas(faixas)
+
+
+def iterar_recursao(vertices: List[Point], seed: Optional[Point] = None) -> Iterator[Point]:
 	"""
+	Versão geradora de preencher_recursao: produz cada ponto preenchido uma única vez,
+	faixa a faixa à medida que a busca as encontra (na ordem da pilha de sementes,
+	não ordenada por y). Só o bitmap da bbox fica em memória, não a lista de faixas.
+	"""
+	for y, xi, xf in _iterar_faixas_recursao(vertices, seed):
+		for x in range(xi, xf + 1):
+			yield (x, y)
+
+
+def _faixas_recursao(vertices: List[Point], seed: Optional[Point]) -> List[Faixa]:
+	"""Faixas (ordenadas por y e x) da região 4-conexa da seed dentro do polígono."""
+	return sorted(_iterar_faixas_recursao(vertices, seed))
+
+
+def _iterar_faixas_recursao(vertices: List[Point], seed: Optional[Point]) -> Iterator[Faixa]:
+	"""Faixas da região 4-conexa da seed dentro do polígono, na ordem em que são encontradas."""
 	if not vertices or len(vertices) < 3:
-		return []
+		return
 
 	# Normaliza/fecha polígono e remove duplicados consecutivos
 	pts = []  # polígono normalizado sem duplicatas consecutivas
@@ -263,84 +425,140 @@ def preencher_recursao(vertices: List[Point], seed: Optional[Point] = None) -> L
 	# Escolhe seed se necessário
 	s = seed or _escolher_seed(pts)  # escolhe semente se não for fornecida
 	if s is None:
-		return []
+		return
 
-	preenchidos: List[Point] = []  # acumula pixels preenchidos
-	visitados: Set[Point] = set()  # marca o que já foi processado
-	pilha: List[Point] = [s]       # estrutura LIFO para DFS
+	# Bloqueadas: células da bbox fora do polígono (mesmo teste de _ponto_dentro_poligono)
+	bloqueado = ~_mascara_dentro_poligono(pts, (min_x, max_x, min_y, max_y))
+	yield from _iterar_faixas_semente(bloqueado, s, (min_x, max_x, min_y, max_y))
 
-	# DFS iterativo (poderia ser BFS); 4-vizinhos para não vazar em diagonais.
-	# Invariante: cada ponto entra na pilha no máximo uma vez e é marcado em 'visitados' ao ser processado.
-	while pilha:
-		x, y = pilha.pop()
-		if (x, y) in visitados:
-			continue
-		visitados.add((x, y))
-
-		if x < min_x or x > max_x or y < min_y or y > max_y:
-			continue
-		if not _ponto_dentro_poligono((x, y), pts):
-			continue
 
-		preenchidos.append((x, y))
-		# 4-vizinhos (N, S, L, O)
-		pilha.append((x + 1, y))
-		pilha.append((x - 1, y))
-		pilha.append((x, y + 1))
-		pilha.append((x, y - 1))
+def _mascara_dentro_poligono(pts: List[Point], bounds: Tuple[int, int, int, int]) -> np.ndarray:
+	"""
+	Versão vetorizada de _ponto_dentro_poligono para todas as células de bounds.
 
-	# Remove duplicados preservando ordem.
-	vistos = set()
-	unicos: List[Point] = []
-	for p in preenchidos:
-		if p not in vistos:
-			vistos.add(p)
-			unicos.append(p)
-	return unicos
+	- pts: polígono já fechado (último == primeiro)
+	Retorna array bool (altura, largura), linha = y - min_y, coluna = x - min_x.
+	"""
+	min_x, max_x, min_y, max_y = bounds
+	y, x = np.mgrid[min_y:max_y + 1, min_x:max_x + 1]
+	borda = np.zeros(x.shape, dtype=bool)
+	dentro = np.zeros(x.shape, dtype=bool)
+	for (x1, y1), (x2, y2) in zip(pts, pts[1:]):
+		# Borda conta como dentro: colinear (determinante zero) e na bbox do segmento
+		det = (x2 - x1) * (y - y1) - (y2 - y1) * (x - x1)
+		borda |= (det == 0) & (x >= min(x1, x2)) & (x <= max(x1, x2)) & (y >= min(y1, y2)) & (y <= max(y1, y2))
+		# Ray casting: alterna onde a aresta cruza a semi-reta à direita do ponto
+		if y1 == y2:
+			continue  # horizontal: nunca cruza
+		cruza = (y1 > y) != (y2 > y)
+		xinters = (x2 - x1) * (y - y1) / (y2 - y1) + x1
+		dentro ^= cruza & (x < xinters)
+	return borda | dentro
+
+
+def _livres_no_inicio(linha: np.ndarray) -> int:
+	"""
+	Quantas células livres há no início de linha, antes da primeira bloqueada.
+	Examina janelas de tamanho dobrando (argmax em cada fatia), de modo que o
+	custo acompanha o comprimento da corrida, não o da linha inteira.
+	"""
+	inicio, janela, n = 0, 32, len(linha)
+	while inicio < n:
+		trecho = linha[inicio:inicio + janela]
+		k = int(trecho.argmax())
+		if trecho[k]:
+			return inicio + k
+		inicio += janela
+		janela *= 2
+	return n
+
+
+def _iterar_faixas_semente(bloqueado: np.ndarray, seed: Point,
+						   bounds: Tuple[int, int, int, int]) -> Iterator[Faixa]:
+	"""
+	Preenchimento por faixas a partir da seed (Smith/Heckbert), ver item 4 do roteiro.
 
+	- bloqueado: array bool (altura, largura) sobre bounds; True = borda/ocupado.
+	  É também o bitmap de visitados: cada faixa preenchida vira True (o array é modificado).
+	- bounds: (min_x, max_x, min_y, max_y) inclusivos; linha = y - min_y, coluna = x - min_x.
+	Produz as faixas (y, x_inicio, x_fim) à medida que são preenchidas.
+	"""
+	min_x, max_x, min_y, max_y = bounds
+	sx, sy = seed
+	if sx < min_x or sx > max_x or sy < min_y or sy > max_y:
+		return
+	altura = bloqueado.shape[0]
+	pilha: List[Tuple[int, int]] = [(sx - min_x, sy - min_y)]  # sementes (coluna, linha)
 
-def preencher_flood_canvas(ocupados: Set[Point], seed: Point, bounds: Tuple[int, int, int, int]) -> List[Point]:
+	# Invariante: toda célula livre alcançável ou já está numa faixa, ou está na mesma
+	# corrida livre de alguma semente da pilha.
+	while pilha:
+		c, l = pilha.pop()
+		linha = bloqueado[l]
+		if linha[c]:
+			continue  # corrida já preenchida a partir de outra semente
+		# Estende para a esquerda e para a direita até a primeira célula bloqueada
+		a = c - _livres_no_inicio(linha[:c][::-1])
+		b = c + _livres_no_inicio(linha[c + 1:])
+		linha[a:b + 1] = True
+		yield (l + min_y, a + min_x, b + min_x)
+		# Nas linhas vizinhas, uma semente por corrida livre que toca [a, b]
+		for vizinha in (l - 1, l + 1):
+			if 0 <= vizinha < altura:
+				livres = ~bloqueado[vizinha, a:b + 1]
+				inicios = np.flatnonzero(livres[1:] & ~livres[:-1]) + 1
+				if livres[0]:
+					pilha.append((a, vizinha))
+				pilha.extend((a + k, vizinha) for k in inicios.tolist())
+
+
+def preencher_flood_canvas(ocupados: Ocupacao, seed: Point, bounds: Tuple[int, int, int, int],
+						   como_faixas: bool = False):
 	"""Flood fill genérico no canvas, preenchendo todas as células vazias conectadas à seed.
 
-	- ocupados: conjunto de pontos já ocupados (bordas/desenhos existentes)
+	- ocupados: conjunto de pontos já ocupados (bordas/desenhos existentes) ou bitmap
+				bool (altura, largura) sobre bounds, com linha = y - min_y e coluna = x - min_x
+				(ex.: AreaDesenho.mapa_ocupacao); o bitmap não é alterado
 	- seed: ponto inicial do preenchimento
 	- bounds: (min_x, max_x, min_y, max_y) limites inclusivos do grid
-	Retorna lista de pontos preenchidos.
+	- como_faixas: se True, devolve as faixas em vez dos pixels
+	Retorna PixelBuffer com os pontos preenchidos.
 	"""
-	min_x, max_x, min_y, max_y = bounds
-	sx, sy = seed
-	if sx < min_x or sx > max_x or sy < min_y or sy > max_y:
-		return []
-	if seed in ocupados:
-		return []
+	faixas = _faixas_flood_canvas(ocupados, seed, bounds)
+	return _array_de_faixas(faixas) if como_faixas else pixels_de_faixas(faixas)
 
-	visitados: Set[Point] = set()  # marca pixels já processados
-	preenchidos: List[Point] = []  # resultado do flood
-	pilha: List[Point] = [seed]    # pilha inicial com a semente
 
-	# Flood fill no canvas (sem polígono): mesmo laço DFS com verificação de bounds e células ocupadas.
-	while pilha:
-		x, y = pilha.pop()
-		if (x, y) in visitados:
-			continue
-		visitados.add((x, y))
+def iterar_flood_canvas(ocupados: Ocupacao, seed: Point, bounds: Tuple[int, int, int, int]) -> Iterator[Point]:
+	"""
+	Versão geradora de preencher_flood_canvas: produz cada ponto preenchido uma única
+	vez, faixa a faixa à medida que a busca as encontra (não ordenada por y).
+	"""
+	for y, xi, xf in _iterar_faixas_flood_canvas(ocupados, seed, bounds):
+		for x in range(xi, xf + 1):
+			yield (x, y)
 
-		if x < min_x or x > max_x or y < min_y or y > max_y:
-			continue
-		if (x, y) in ocupados:
-			continue
 
-		preenchidos.append((x, y))
-		pilha.append((x + 1, y))
-		pilha.append((x - 1, y))
-		pilha.append((x, y + 1))
-		pilha.append((x, y - 1))
-
-	# Remove duplicados preservando ordem.
-	vistos = set()
-	unicos: List[Point] = []
-	for p in preenchidos:
-		if p not in vistos:
-			vistos.add(p)
-			unicos.append(p)
-	return unicos
+def _faixas_flood_canvas(ocupados: Ocupacao, seed: Point, bounds: Tuple[int, int, int, int]) -> List[Faixa]:
+	"""Faixas do flood no canvas ordenadas por y e x."""
+	return sorted(_iterar_faixas_flood_canvas(ocupados, seed, bounds))
+
+
+def _iterar_faixas_flood_canvas(ocupados: Ocupacao, seed: Point,
+								bounds: Tuple[int, int, int, int]) -> Iterator[Faixa]:
+	"""Faixas do flood no canvas: monta o bitmap de ocupação sobre bounds e varre por faixas."""
+	min_x, max_x, min_y, max_y = bounds
+	if max_x < min_x or max_y < min_y:
+		return
+	if isinstance(ocupados, np.ndarray):
+		if ocupados.shape != (max_y - min_y + 1, max_x - min_x + 1):
+			raise ValueError("O bitmap de ocupação deve ter o formato (altura, largura) dos limites.")
+		# Bitmap pronto: só a cópia (que vira o bitmap de visitados), sem percorrer os desenhos
+		yield from _iterar_faixas_semente(ocupados.astype(bool, copy=True), seed, bounds)
+		return
+	bloqueado = np.zeros((max_y - min_y + 1, max_x - min_x + 1), dtype=bool)
+	if ocupados:
+		pts = np.array(list(ocupados), dtype=np.int64).reshape(-1, 2)
+		dentro = (pts[:, 0] >= min_x) & (pts[:, 0] <= max_x) & (pts[:, 1] >= min_y) & (pts[:, 1] <= max_y)
+		pts = pts[dentro]
+		bloqueado[pts[:, 1] - min_y, pts[:, 0] - min_x] = True
+	yield from _iterar_faixas_semente(bloqueado, seed, bounds)
@@ -8,15 +8,58 @@ Roteiro de apresentação – Recorte (Clipping)
     - Atribui códigos de região (LEFT/RIGHT/BOTTOM/TOP); aceita/rejeita trivialmente ou intersecta iterativamente.
     - Vantagem: rápido para janelas retangulares; simples de implementar.
 
-3) Polígonos: Sutherland–Hodgman
+3) Linhas: Liang–Barsky (paramétrico, em lote)
+    - P(t) = P1 + t·(P2 - P1), 0 <= t <= 1; cada borda dá uma desigualdade p·t <= q.
+    - Bordas com p < 0 são de entrada (t0 = max q/p) e com p > 0 de saída (t1 = min q/p);
+      p == 0 e q < 0 significa paralela e fora. Aceita se t0 <= t1.
+    - Não move extremos passo a passo: calcula t0/t1 e arredonda uma única vez.
+    - liang_barsky_clip_lote faz tudo isso para N segmentos numa passada NumPy
+      (aceitação/rejeição trivial pelos outcodes, também vetorizados).
+
+4) Polígonos: Sutherland–Hodgman
     - Recorta iterativamente contra cada borda do retângulo (ou polígono convexo).
     - Mantém a ordem dos vértices; produz polígono resultante.
-
-4) Dicas de demonstração
+    - Na janela retangular, cada borda é um estágio vetorizado (NumPy) sobre
+      todas as arestas: sem laço em Python por vértice nem índices com módulo.
+      As interseções ficam em float entre as bordas e o resultado é
+      arredondado uma única vez, no fim, sem acumular erro.
+
+5) Janela convexa: Cyrus–Beck (JanelaConvexa)
+    - A janela é preparada uma vez: normais internas de cada borda (em ordem CCW)
+      e caixa envolvente; depois recorta quantos segmentos/polígonos forem precisos.
+    - Ponto dentro da janela em O(log m): busca binária no leque de triângulos
+      a partir do vértice 0 (m = número de vértices da janela).
+    - Segmentos: Cyrus–Beck é o Liang–Barsky com as normais da janela no lugar
+      dos quatro eixos (n·(P(t) - a) >= 0 em cada borda), vetorizado em lote.
+    - Polígonos: sujeito todo dentro (pela busca binária) volta sem estágios;
+      só as bordas com algum vértice do sujeito do lado de fora viram estágio.
+
+6) Polígonos quaisquer: Greiner–Hormann (greiner_hormann_clip)
+    - Janela e sujeito podem ser côncavos; operações: interseção, união e diferença.
+    - Acha todas as interseções entre as arestas dos dois polígonos e as insere
+      nas duas listas de vértices, ligando cada par de "vizinhos".
+    - Marca cada interseção como entrada/saída (alternando a partir de um
+      vértice sabidamente dentro ou fora) e percorre: para frente nas entradas,
+      para trás nas saídas, trocando de polígono a cada interseção. Cada volta
+      fechada é um contorno do resultado (pode haver vários).
+    - União inverte as marcas dos dois polígonos; diferença, só as do sujeito.
+    - Índice espacial: as arestas da janela ficam numa grade uniforme e cada
+      aresta do sujeito só é testada contra as das células que sua caixa toca.
+    - Degenerações (vértice sobre aresta, arestas sobrepostas) são evitadas
+      deslocando a janela por uma fração minúscula e irracional de pixel;
+      o resultado é arredondado para inteiros no fim.
+
+7) Dicas de demonstração
     - Mostrar casos: aceitação trivial, rejeição trivial e recorte parcial.
     - Em polígonos, destacar a sequência de recortes (esquerda, direita, baixo, topo).
 """
 
+import math
+from collections import defaultdict
+from itertools import chain
+
+import numpy as np
+
 # Códigos de região para o algoritmo de Cohen-Sutherland (bitmask de 4 bits)
 # Bit 0 (1)  -> LEFT   : ponto está à esquerda de xmin
 # Bit 1 (2)  -> RIGHT  : ponto está à direita de xmax
@@ -121,6 +164,93 @@ def cohen_sutherland_clip(p1, p2, xmin, ymin, xmax, ymax):
         return ((x1, y1), (x2, y2))
     return None
 
+def liang_barsky_clip(p1, p2, xmin, ymin, xmax, ymax):
+    """
+    Recorta uma linha (p1, p2) para uma janela retangular (Liang–Barsky).
+
+    Mesma interface de cohen_sutherland_clip; os extremos recortados são
+    calculados pelos parâmetros t0/t1 e arredondados uma única vez.
+
+    Returns:
+        tuple: ((x1, y1), (x2, y2)) recortada, ou None se estiver toda fora.
+    """
+    x1, y1 = p1
+    x2, y2 = p2
+    dx, dy = x2 - x1, y2 - y1
+    t0, t1 = 0.0, 1.0  # trecho visível: [t0, t1]
+    # Uma desigualdade p·t <= q por borda: esquerda, direita, baixo, topo
+    for p, q in ((-dx, x1 - xmin), (dx, xmax - x1), (-dy, y1 - ymin), (dy, ymax - y1)):
+        if p == 0:
+            if q < 0:
+                return None  # paralela à borda e do lado de fora
+        elif p < 0:
+            t0 = max(t0, q / p)  # entrando
+        else:
+            t1 = min(t1, q / p)  # saindo
+    if t0 > t1:
+        return None
+    # Extremos que já estavam dentro (t = 0 ou 1) são mantidos exatamente
+    inicio = (x1, y1) if t0 == 0 else (round(x1 + t0 * dx), round(y1 + t0 * dy))
+    fim = (x2, y2) if t1 == 1 else (round(x1 + t1 * dx), round(y1 + t1 * dy))
+    return (inicio, fim)
+
+
+def liang_barsky_clip_lote(segmentos, xmin, ymin, xmax, ymax):
+    """
+    Recorta N segmentos contra a mesma janela retangular numa passada NumPy.
+
+    Args:
+        segmentos: array-like (N, 4) com (x1, y1, x2, y2) ou (N, 2, 2).
+        xmin, ymin, xmax, ymax: limites da janela.
+
+    Returns:
+        tuple: (recortados, aceitos) — array (N, 4) de int64 com os extremos
+        recortados (mesmos valores de liang_barsky_clip) e máscara (N,) bool
+        dos segmentos que têm alguma parte dentro da janela. As linhas de
+        'recortados' com aceitos == False não têm significado.
+    """
+    seg = np.asarray(segmentos, dtype=np.int64).reshape(-1, 4)
+    recortados = seg.copy()
+    # Outcodes vetorizados: aceitação (ambos dentro) e rejeição (mesmo lado) triviais
+    x, y = seg[:, 0::2], seg[:, 1::2]
+    codigos = ((x < xmin) * LEFT | (x > xmax) * RIGHT | (y < ymin) * BOTTOM | (y > ymax) * TOP)
+    dentro = (codigos[:, 0] | codigos[:, 1]) == INSIDE
+    rejeitados = (codigos[:, 0] & codigos[:, 1]) != INSIDE
+    aceitos = dentro.copy()
+
+    # Só os casos restantes passam pelo recorte paramétrico
+    parciais = np.flatnonzero(~dentro & ~rejeitados)
+    if len(parciais):
+        x1, y1, x2, y2 = seg[parciais].T
+        dx, dy = x2 - x1, y2 - y1
+        p = np.stack([-dx, dx, -dy, dy], axis=1)
+        q = np.stack([x1 - xmin, xmax - x1, y1 - ymin, ymax - y1], axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            razao = q / p
+        t0 = np.max(np.where(p < 0, razao, 0.0), axis=1, initial=0.0)
+        t1 = np.min(np.where(p > 0, razao, 1.0), axis=1, initial=1.0)
+        fora_paralela = np.any((p == 0) & (q < 0), axis=1)
+        visiveis = ~fora_paralela & (t0 <= t1)
+        recortados[parciais] = _extremos_recortados(seg[parciais], t0, t1)
+        aceitos[parciais] = visiveis
+    return recortados, aceitos
+
+
+def _extremos_recortados(seg, t0, t1):
+    """
+    Extremos (k, 4) de int64 do trecho [t0, t1] de cada segmento (x1, y1, x2, y2),
+    arredondados uma única vez; extremos com t = 0 ou t = 1 são preservados.
+    """
+    x1, y1, x2, y2 = seg.T
+    dx, dy = x2 - x1, y2 - y1
+    return np.stack([
+        np.where(t0 == 0, x1, np.rint(x1 + t0 * dx)),
+        np.where(t0 == 0, y1, np.rint(y1 + t0 * dy)),
+        np.where(t1 == 1, x2, np.rint(x1 + t1 * dx)),
+        np.where(t1 == 1, y2, np.rint(y1 + t1 * dy)),
+    ], axis=1).astype(np.int64)
+
+
 def sutherland_hodgman_clip(subject_polygon, clip_window):
     """
     Recorta um polígono usando o algoritmo de Sutherland-Hodgman.
@@ -133,130 +263,250 @@ def sutherland_hodgman_clip(subject_polygon, clip_window):
         list: Lista de vértices do polígono recortado.
     """
     # Limites da janela de recorte retangular
-    xmin, ymin, xmax, ymax = clip_window  # valores inteiros ou floats; usamos arredondamento nas interseções
-    
-    def clip_left(vertices):
-        # Recorta contra a borda esquerda x = xmin
-        # vertices: lista [(x,y), ...] do polígono intermediário
-        clipped = []
-        # Loop sobre todas as arestas do polígono sujeito (p1->p2), fechando com módulo:
-        # - Invariante: p1 é o vértice atual; p2 é o próximo (ou o primeiro se i for o último).
-        # - Objetivo: decidir para cada aresta se estamos entrando/saindo da região válida e
-        #   adicionar a interseção e/ou o vértice conforme os quatro casos de Sutherland–Hodgman.
-        for i in range(len(vertices)):
-            p1 = vertices[i]                   # vértice corrente
-            p2 = vertices[(i + 1) % len(vertices)]  # próximo vértice (fecha ciclo com módulo)
-            p1_inside = p1[0] >= xmin          # p1 está à direita/na borda esquerda?
-            p2_inside = p2[0] >= xmin          # p2 está à direita/na borda esquerda?
-
-            if p1_inside and p2_inside: # Ambos dentro: mantém p2
-                clipped.append(p2)
-            elif p1_inside and not p2_inside: # P1 dentro, P2 fora: guarda interseção
-                x = xmin                                       # x na borda
-                y = p1[1] + (p2[1] - p1[1]) * (xmin - p1[0]) / (p2[0] - p1[0])  # y da interseção
-                clipped.append((round(x), round(y)))           # adiciona ponto de saída
-            elif not p1_inside and p2_inside: # P1 fora, P2 dentro: interseção + p2
-                x = xmin
-                y = p1[1] + (p2[1] - p1[1]) * (xmin - p1[0]) / (p2[0] - p1[0])
-                clipped.append((round(x), round(y)))          # ponto de entrada
-                clipped.append(p2)                             # mantém p2 (dentro)
-        return clipped
-
-    def clip_right(vertices):
-        # Recorta contra a borda direita x = xmax
-        clipped = []
-        # Loop sobre arestas p1->p2 do polígono atual, utilizando fechamento com módulo.
-        # - Invariante: construímos "clipped" apenas com pontos dentro ou interseções.
-        for i in range(len(vertices)):
-            p1 = vertices[i]
-            p2 = vertices[(i + 1) % len(vertices)]
-            p1_inside = p1[0] <= xmax
-            p2_inside = p2[0] <= xmax
-
-            if p1_inside and p2_inside:  # Ambos dentro
-                clipped.append(p2)
-            elif p1_inside and not p2_inside:  # Saindo: adiciona interseção
-                x = xmax
-                y = p1[1] + (p2[1] - p1[1]) * (xmax - p1[0]) / (p2[0] - p1[0])
-                clipped.append((round(x), round(y)))
-            elif not p1_inside and p2_inside:  # Entrando: interseção + p2
-                x = xmax
-                y = p1[1] + (p2[1] - p1[1]) * (xmax - p1[0]) / (p2[0] - p1[0])
-                clipped.append((round(x), round(y)))
-                clipped.append(p2)
-        return clipped
-
-    def clip_bottom(vertices):
-        # Recorta contra a borda inferior y = ymin
-        clipped = []
-        # Loop de varredura das arestas p1->p2 do polígono corrente.
-        # - Objetivo: manter apenas o que está acima/na borda inferior y=ymin.
-        for i in range(len(vertices)):
-            p1 = vertices[i]
-            p2 = vertices[(i + 1) % len(vertices)]
-            p1_inside = p1[1] >= ymin
-            p2_inside = p2[1] >= ymin
-
-            if p1_inside and p2_inside:  # Ambos dentro
-                clipped.append(p2)
-            elif p1_inside and not p2_inside:  # Saindo: interseção
-                y = ymin
-                x = p1[0] + (p2[0] - p1[0]) * (ymin - p1[1]) / (p2[1] - p1[1])
-                clipped.append((round(x), round(y)))
-            elif not p1_inside and p2_inside:  # Entrando: interseção + p2
-                y = ymin
-                x = p1[0] + (p2[0] - p1[0]) * (ymin - p1[1]) / (p2[1] - p1[1])
-                clipped.append((round(x), round(y)))
-                clipped.append(p2)
-        return clipped
-
-    def clip_top(vertices):
-        # Recorta contra a borda superior y = ymax
-        clipped = []
-        # Loop de arestas p1->p2 para aplicar a regra de entrada/saída na borda superior.
-        for i in range(len(vertices)):
-            p1 = vertices[i]
-            p2 = vertices[(i + 1) % len(vertices)]
-            p1_inside = p1[1] <= ymax
-            p2_inside = p2[1] <= ymax
-
-            if p1_inside and p2_inside:  # Ambos dentro
-                clipped.append(p2)
-            elif p1_inside and not p2_inside:  # Saindo: interseção
-                y = ymax
-                x = p1[0] + (p2[0] - p1[0]) * (ymax - p1[1]) / (p2[1] - p1[1])
-                clipped.append((round(x), round(y)))
-            elif not p1_inside and p2_inside:  # Entrando: interseção + p2
-                y = ymax
-                x = p1[0] + (p2[0] - p1[0]) * (ymax - p1[1]) / (p2[1] - p1[1])
-                clipped.append((round(x), round(y)))
-                clipped.append(p2)
-        return clipped
+    xmin, ymin, xmax, ymax = clip_window
 
     # Normaliza entrada: remove fechamento duplicado se existir
     # subject_polygon: lista [(x,y), ...]; se último == primeiro, remove o último
     if subject_polygon and len(subject_polygon) >= 2 and subject_polygon[0] == subject_polygon[-1]:
         subject_polygon = subject_polygon[:-1]
-    # Recortes sucessivos
-    clipped_polygon = clip_left(subject_polygon)
-    clipped_polygon = clip_right(clipped_polygon)
-    clipped_polygon = clip_bottom(clipped_polygon)
-    clipped_polygon = clip_top(clipped_polygon)
-
-    # Remove vértices redundantes consecutivos (ex.: iguais)
-    if clipped_polygon:
-        compact = [clipped_polygon[0]]   # lista final sem duplicatas consecutivas
-        # Loop para remover duplicatas consecutivas: compara cada vértice "p" com o último do "compact".
-        for p in clipped_polygon[1:]:    # p: vértice atual
-            if p != compact[-1]:         # se diferente do último adicionado
-                compact.append(p)
-        clipped_polygon = compact
+
+    # Recorta contra esquerda, direita, baixo e topo; cada borda é um estágio
+    # vetorizado sobre todas as arestas, com coordenadas em float do início ao fim
+    pontos = np.fromiter(chain.from_iterable(subject_polygon), dtype=np.float64).reshape(-1, 2)
+    for eixo, limite, lado in ((0, xmin, 1), (0, xmax, -1), (1, ymin, 1), (1, ymax, -1)):
+        if len(pontos) == 0:
+            break
+        pontos = _recortar_borda(pontos, eixo, limite, lado)
+
+    return _poligono_arredondado(pontos)
+
+
+def _poligono_arredondado(pontos):
+    """
+    Arredonda os vértices (float) uma única vez, remove repetidos consecutivos
+    e fecha o polígono (quando há pelo menos 2 vértices). Retorna lista de (x, y).
+    """
+    arredondados = np.rint(pontos).astype(np.int64)
+    if len(arredondados):
+        distintos = np.ones(len(arredondados), dtype=bool)
+        distintos[1:] = np.any(arredondados[1:] != arredondados[:-1], axis=1)
+        arredondados = arredondados[distintos]
+    poligono = [tuple(p) for p in arredondados.tolist()]
 
     # Garante polígono fechado quando há pelo menos 2 vértices
-    if clipped_polygon and len(clipped_polygon) >= 2 and clipped_polygon[0] != clipped_polygon[-1]:
-        clipped_polygon.append(clipped_polygon[0])  # fecha repetindo o primeiro
+    if len(poligono) >= 2 and poligono[0] != poligono[-1]:
+        poligono.append(poligono[0])  # fecha repetindo o primeiro
+    return poligono
+
 
-    return clipped_polygon
+def _recortar_borda(pontos, eixo, limite, lado):
+    """
+    Um estágio de Sutherland–Hodgman contra a borda 'coordenada eixo = limite',
+    com dentro <=> lado * (coordenada - limite) >= 0, para todas as arestas de
+    uma vez. Para cada aresta p -> q, na ordem, emite a interseção (se cruza a
+    borda) e depois q (se está dentro), como a versão com laço.
+    """
+    p = pontos
+    q = np.roll(pontos, -1, axis=0)  # aresta i: vértice i -> i+1 (fecha no primeiro)
+    p_dentro = lado * (p[:, eixo] - limite) >= 0
+    q_dentro = lado * (q[:, eixo] - limite) >= 0
+    cruza = p_dentro != q_dentro
+    contagem = cruza.astype(np.int64) + q_dentro
+    posicao = np.cumsum(contagem) - contagem  # onde começa a saída de cada aresta
+    saida = np.empty((int(contagem.sum()), 2), dtype=np.float64)
+
+    # Interseção a partir de p (multiplica antes de dividir: com entradas
+    # inteiras, uma interseção exatamente em ,5 não vira ,4999...)
+    outro = 1 - eixo
+    pc, qc = p[cruza], q[cruza]
+    destino = posicao[cruza]
+    saida[destino, eixo] = limite
+    saida[destino, outro] = pc[:, outro] + (qc[:, outro] - pc[:, outro]) * (limite - pc[:, eixo]) / (qc[:, eixo] - pc[:, eixo])
+    saida[(posicao + cruza)[q_dentro]] = q[q_dentro]
+    return saida
+
+
+def _recortar_semiplano(pontos, distancias):
+    """
+    Um estágio de Sutherland–Hodgman contra um semiplano qualquer, dadas as
+    distâncias (com sinal, não normalizadas) de cada vértice à borda:
+    dentro <=> distância >= 0. Mesma ordem de saída de _recortar_borda.
+    """
+    p, dp = pontos, distancias
+    q, dq = np.roll(pontos, -1, axis=0), np.roll(distancias, -1)
+    p_dentro = dp >= 0
+    q_dentro = dq >= 0
+    cruza = p_dentro != q_dentro
+    contagem = cruza.astype(np.int64) + q_dentro
+    posicao = np.cumsum(contagem) - contagem
+    saida = np.empty((int(contagem.sum()), 2), dtype=np.float64)
+
+    # Interseção a partir de p: t = dp / (dp - dq), com dp e dq de sinais opostos
+    t = dp[cruza] / (dp[cruza] - dq[cruza])
+    pc, qc = p[cruza], q[cruza]
+    saida[posicao[cruza]] = pc + t[:, None] * (qc - pc)
+    saida[(posicao + cruza)[q_dentro]] = q[q_dentro]
+    return saida
+
+
+def _sem_colineares(pontos):
+    """Remove vértices repetidos e colineares (não mudam a região da janela)."""
+    def colinear(a, b, c):
+        return (b[0] - a[0]) * (c[1] - b[1]) - (b[1] - a[1]) * (c[0] - b[0]) == 0
+
+    saida = []
+    for p in pontos:
+        saida.append(p)
+        while len(saida) >= 3 and colinear(saida[-3], saida[-2], saida[-1]):
+            del saida[-2]
+    # Emenda entre o fim e o começo da lista
+    while len(saida) >= 3 and colinear(saida[-2], saida[-1], saida[0]):
+        saida.pop()
+    while len(saida) >= 3 and colinear(saida[-1], saida[0], saida[1]):
+        saida.pop(0)
+    return saida
+
+
+class JanelaConvexa:
+    """
+    Janela de recorte poligonal convexa, preparada uma única vez e reutilizada
+    para recortar quantos segmentos e polígonos forem necessários.
+
+    Na construção os vértices ficam em ordem CCW (sem repetidos nem colineares)
+    e cada borda a -> b ganha sua normal interna n = (-(by - ay), bx - ax):
+    um ponto p está dentro (ou sobre a borda) <=> n·(p - a) >= 0.
+    """
+
+    # Limite de elementos (segmentos x bordas) por bloco no Cyrus–Beck em lote
+    _ELEMENTOS_POR_BLOCO = 1 << 20
+
+    def __init__(self, clip_polygon):
+        from utils.geometria import garantir_ccw  # garante orientação CCW do polígono de recorte
+
+        vertices = list(clip_polygon)
+        if len(vertices) >= 2 and vertices[0] == vertices[-1]:
+            vertices = vertices[:-1]  # remove fechamento duplicado
+        vertices = _sem_colineares(garantir_ccw(vertices))
+        if len(vertices) < 3:
+            raise ValueError("A janela convexa precisa de pelo menos 3 vértices não colineares.")
+
+        self.vertices = np.array(vertices, dtype=np.float64)
+        arestas = np.roll(self.vertices, -1, axis=0) - self.vertices
+        self.normais = np.stack([-arestas[:, 1], arestas[:, 0]], axis=1)
+        # n·p >= n·a  <=>  dentro da borda: guarda n·a de cada borda
+        self.deslocamentos = np.einsum('ij,ij->i', self.normais, self.vertices)
+        self.caixa = (*self.vertices.min(axis=0), *self.vertices.max(axis=0))
+        # Leque a partir do vértice 0, usado na busca binária de contem_lote
+        self._leque = self.vertices - self.vertices[0]
+
+    def contem(self, ponto):
+        """True se o ponto (x, y) está dentro da janela ou sobre a borda. O(log m)."""
+        return bool(self.contem_lote([ponto])[0])
+
+    def contem_lote(self, pontos):
+        """
+        Máscara (N,) bool dos pontos dentro da janela (borda inclusa).
+
+        Busca binária no leque v0 -> v_i: acha a fatia (v0, v_i, v_i+1) que
+        contém a direção do ponto e testa só a borda v_i -> v_i+1, em
+        O(log m) passos vetorizados sobre todos os pontos.
+        """
+        p = np.asarray(pontos, dtype=np.float64).reshape(-1, 2) - self.vertices[0]
+        leque = self._leque
+        m = len(leque)
+
+        def cruzado(v, w):
+            return v[..., 0] * w[..., 1] - v[..., 1] * w[..., 0]
+
+        # Fora do ângulo do leque: antes da primeira ou depois da última diagonal
+        no_angulo = (cruzado(leque[1], p) >= 0) & (cruzado(leque[m - 1], p) <= 0)
+        # Invariante: o ponto está à esquerda de v0 -> v_baixo e não à esquerda de v0 -> v_alto
+        baixo = np.ones(len(p), dtype=np.int64)
+        alto = np.full(len(p), m - 1, dtype=np.int64)
+        while True:
+            ativos = alto - baixo > 1
+            if not ativos.any():
+                break
+            meio = (baixo + alto) // 2
+            a_esquerda = cruzado(leque[meio], p) >= 0
+            baixo = np.where(ativos & a_esquerda, meio, baixo)
+            alto = np.where(ativos & ~a_esquerda, meio, alto)
+        a, b = leque[baixo], leque[baixo + 1]
+        return no_angulo & (cruzado(b - a, p - a) >= 0)
+
+    def recortar_segmentos(self, segmentos):
+        """
+        Recorta N segmentos contra a janela (Cyrus–Beck em lote).
+
+        Mesma convenção de liang_barsky_clip_lote: recebe array-like (N, 4)
+        ou (N, 2, 2) e retorna (recortados, aceitos), com os extremos
+        arredondados uma única vez.
+        """
+        seg = np.asarray(segmentos, dtype=np.int64).reshape(-1, 4)
+        recortados = seg.copy()
+        aceitos = np.zeros(len(seg), dtype=bool)
+
+        # Rejeição trivial pela caixa envolvente; aceitação pelos dois extremos dentro
+        xmin, ymin, xmax, ymax = self.caixa
+        x, y = seg[:, 0::2], seg[:, 1::2]
+        rejeitados = ((x < xmin).all(axis=1) | (x > xmax).all(axis=1)
+                      | (y < ymin).all(axis=1) | (y > ymax).all(axis=1))
+        candidatos = np.flatnonzero(~rejeitados)
+        extremos = seg[candidatos].reshape(-1, 2)
+        dentro = self.contem_lote(extremos).reshape(-1, 2).all(axis=1)
+        aceitos[candidatos[dentro]] = True
+
+        # Restantes: P(t) = P1 + t·d; em cada borda n·P1 - n·a + t·(n·d) >= 0
+        parciais = candidatos[~dentro]
+        bloco = max(1, self._ELEMENTOS_POR_BLOCO // len(self.normais))
+        for inicio in range(0, len(parciais), bloco):
+            indices = parciais[inicio:inicio + bloco]
+            s = seg[indices].astype(np.float64)
+            num = s[:, :2] @ self.normais.T - self.deslocamentos
+            den = (s[:, 2:] - s[:, :2]) @ self.normais.T
+            with np.errstate(divide='ignore', invalid='ignore'):
+                razao = -num / den
+            t0 = np.max(np.where(den > 0, razao, 0.0), axis=1, initial=0.0)  # entrando
+            t1 = np.min(np.where(den < 0, razao, 1.0), axis=1, initial=1.0)  # saindo
+            fora_paralela = np.any((den == 0) & (num < 0), axis=1)
+            recortados[indices] = _extremos_recortados(seg[indices], t0, t1)
+            aceitos[indices] = ~fora_paralela & (t0 <= t1)
+        return recortados, aceitos
+
+    def recortar_poligono(self, subject_polygon):
+        """
+        Recorta um polígono (aberto ou fechado) contra a janela.
+
+        Retorna lista de (x, y) do polígono resultante, fechado se houver pelo
+        menos 2 vértices, ou [] se o sujeito tem menos de 3 vértices ou fica fora.
+        """
+        S = list(subject_polygon)
+        if len(S) >= 2 and S[0] == S[-1]:
+            S = S[:-1]  # remove fechamento duplicado
+        if len(S) < 3:
+            return []
+        pontos = np.fromiter(chain.from_iterable(S), dtype=np.float64).reshape(-1, 2)
+
+        # Caixas envolventes disjuntas: nada a recortar
+        xmin, ymin, xmax, ymax = self.caixa
+        if (pontos[:, 0].max() < xmin or pontos[:, 0].min() > xmax
+                or pontos[:, 1].max() < ymin or pontos[:, 1].min() > ymax):
+            return []
+        # Sujeito todo dentro (janela convexa): o resultado é ele mesmo
+        if self.contem_lote(pontos).all():
+            return _poligono_arredondado(pontos)
+
+        # Só as bordas com algum vértice original do lado de fora podem cortar:
+        # o recorte fica sempre dentro do fecho convexo dos vértices originais
+        cortantes = np.flatnonzero((pontos @ self.normais.T < self.deslocamentos).any(axis=0))
+        for j in cortantes:
+            distancias = pontos @ self.normais[j] - self.deslocamentos[j]
+            if distancias.min() >= 0:
+                continue  # os estágios anteriores já deixaram tudo do lado de dentro
+            pontos = _recortar_semiplano(pontos, distancias)
+            if len(pontos) == 0:
+                break
+        return _poligono_arredondado(pontos)
 
 
 def suth_hodgman_clip_convexo(subject_polygon, clip_polygon):
@@ -265,74 +515,221 @@ def suth_hodgman_clip_convexo(subject_polygon, clip_polygon):
     subject_polygon: lista de (x,y) do polígono a recortar (aberto ou fechado).
     clip_polygon: lista de (x,y) do polígono convexo da janela (aberto ou fechado).
     Retorna lista de (x,y) do polígono resultante (fechado se houver pelo menos 2 vértices).
+
+    Para recortar vários polígonos pela mesma janela, crie uma JanelaConvexa
+    uma vez e chame recortar_poligono para cada um.
     """
-    from utils.geometria import garantir_ccw  # garante orientação CCW do polígono de recorte
-
-    def intersect(p1, p2, q1, q2):
-        # Interseção de segmentos p1->p2 e q1->q2 (tratados como linhas infinitas)
-        x1, y1 = p1; x2, y2 = p2  # coordenadas do primeiro segmento
-        x3, y3 = q1; x4, y4 = q2  # coordenadas do segundo segmento
-        den = (x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4)  # denominador do cruzamento (determinante)
-        if den == 0:
-            return p2  # paralelos/colineares; devolve p2 para manter continuidade da cadeia
-        # Fórmulas de interseção (usando determinantes)
-        px = ((x1*y2 - y1*x2)*(x3 - x4) - (x1 - x2)*(x3*y4 - y3*x4)) / den
-        py = ((x1*y2 - y1*x2)*(y3 - y4) - (y1 - y2)*(x3*y4 - y3*x4)) / den
-        return (round(px), round(py))  # arredonda para grid de pixels
-
-    def inside(p, a, b):
-        # Considerando borda a->b com polígono clip CCW, lado interno é à esquerda (cross >= 0)
-        ax, ay = a; bx, by = b; px, py = p
-        # Produto vetorial 2D: (b-a) x (p-a) >= 0 -> p está à esquerda/na borda -> dentro
-        return (bx - ax) * (py - ay) - (by - ay) * (px - ax) >= 0
-
-    # Normaliza: remove fechamento duplicado
-    S = subject_polygon[:]  # cópia dos vértices do polígono sujeito (para não mutar a entrada)
-    if len(S) >= 2 and S[0] == S[-1]:
-        S = S[:-1]  # remove fechamento duplicado
-    C = clip_polygon[:]  # cópia da janela de recorte convexa
-    if len(C) >= 2 and C[0] == C[-1]:
-        C = C[:-1]
-    if len(C) < 3 or len(S) < 3:
-        return []  # precisa de pelo menos 3 vértices em cada polígono
-    C = garantir_ccw(C)  # assegura sentido anti-horário (CCW) em C
-
-    output = S  # lista de vértices resultante após cada etapa de recorte
-    # Loop externo: percorre cada borda do polígono de recorte convexo (a->b)
-    # - Invariante: após a i-ésima iteração, "output" é o polígono sujeito recortado pelas i primeiras bordas.
-    # - Se "output" esvaziar em qualquer etapa, podemos interromper (nenhuma área resta).
-    for i in range(len(C)):
-        a = C[i]                       # vértice corrente da borda de recorte
-        b = C[(i + 1) % len(C)]        # próximo vértice (borda a->b)
-        input_list = output            # polígono a ser recortado contra a borda atual
-        if not input_list:             # se esvaziou, pode interromper
-            break
-        output = []                    # acumulará o polígono recortado da etapa
-        # Loop interno: varre todas as arestas s->e do polígono sujeito atual.
-        # - Para cada aresta, decidimos entre manter e, inserir interseção, ou descartar ambos fora.
-        for j in range(len(input_list)):
-            s = input_list[j]                         # vértice inicial do lado do sujeito
-            e = input_list[(j + 1) % len(input_list)] # vértice final
-            s_in = inside(s, a, b)                    # s está dentro em relação à borda a->b?
-            e_in = inside(e, a, b)                    # e está dentro?
-            if s_in and e_in:
-                output.append(e)                      # mantém e
-            elif s_in and not e_in:
-                output.append(intersect(s, e, a, b))  # saindo: adiciona ponto de saída
-            elif (not s_in) and e_in:
-                output.append(intersect(s, e, a, b))  # entrando: interseção + e
-                output.append(e)
-            # ambos fora: adiciona nada
-
-    # Remove duplicatas consecutivas
-    if output:
-        compact = [output[0]]                 # remove duplicações consecutivas
-        # Loop de compactação: ignora vértices repetidos consecutivos em "output".
-        for p in output[1:]:
-            if p != compact[-1]:
-                compact.append(p)
-        output = compact
-
-    if output and len(output) >= 2 and output[0] != output[-1]:
-        output.append(output[0])  # fecha polígono
-    return output
+    try:
+        janela = JanelaConvexa(clip_polygon)
+    except ValueError:
+        return []  # janela degenerada (menos de 3 vértices não colineares)
+    return janela.recortar_poligono(subject_polygon)
+
+
+# Operações do recorte geral (greiner_hormann_clip)
+OPERACAO_INTERSECAO = 'intersecao'
+OPERACAO_UNIAO = 'uniao'
+OPERACAO_DIFERENCA = 'diferenca'  # sujeito menos janela
+
+# Deslocamento aplicado à janela para que nenhum vértice (inteiro) do sujeito
+# caia exatamente sobre uma aresta dela nem haja arestas sobrepostas; a
+# direção (√2, √3) não é paralela a nenhuma aresta de coordenadas inteiras.
+_PERTURBACAO = (math.sqrt(2) * 1e-6, math.sqrt(3) * 1e-6)
+
+
+def _validar_operacao(operacao):
+    if operacao not in (OPERACAO_INTERSECAO, OPERACAO_UNIAO, OPERACAO_DIFERENCA):
+        raise ValueError(f"Operação de recorte desconhecida: {operacao!r}")
+
+
+class _Vertice:
+    """Nó da lista circular de vértices do Greiner–Hormann."""
+
+    __slots__ = ('x', 'y', 'prox', 'ant', 'intersecao', 'entrada', 'vizinho', 'visitado')
+
+    def __init__(self, x, y, intersecao=False):
+        self.x, self.y = x, y
+        self.prox = self.ant = None
+        self.intersecao = intersecao
+        self.entrada = False
+        self.vizinho = None   # o mesmo ponto de interseção na lista do outro polígono
+        self.visitado = False
+
+
+class _IndiceArestas:
+    """
+    Grade uniforme sobre as arestas de um polígono: cada célula guarda as
+    arestas cuja caixa envolvente a toca. Com ~n células para n arestas, cada
+    consulta olha só as arestas próximas em vez de todas.
+    """
+
+    def __init__(self, pontos):
+        n = len(pontos)
+        xs = [x for x, _ in pontos]
+        ys = [y for _, y in pontos]
+        self.x0, self.y0 = min(xs), min(ys)
+        self.lado = max(1, math.isqrt(n))  # células por eixo
+        extensao = max(max(xs) - self.x0, max(ys) - self.y0)
+        self.tamanho = extensao / self.lado if extensao > 0 else 1.0
+        self.celulas = defaultdict(list)
+        for i in range(n):
+            (ax, ay), (bx, by) = pontos[i], pontos[(i + 1) % n]
+            for celula in self._celulas(min(ax, bx), min(ay, by), max(ax, bx), max(ay, by)):
+                self.celulas[celula].append(i)
+
+    def _celulas(self, xmin, ymin, xmax, ymax):
+        """Células (cx, cy) da grade tocadas pela caixa dada (limitadas à grade)."""
+        def indice(valor, origem):
+            return min(self.lado - 1, max(0, int((valor - origem) // self.tamanho)))
+        for cx in range(indice(xmin, self.x0), indice(xmax, self.x0) + 1):
+            for cy in range(indice(ymin, self.y0), indice(ymax, self.y0) + 1):
+                yield cx, cy
+
+    def candidatas(self, a, b):
+        """Índices das arestas que podem cruzar o segmento a -> b."""
+        (ax, ay), (bx, by) = a, b
+        encontradas = set()
+        for celula in self._celulas(min(ax, bx), min(ay, by), max(ax, bx), max(ay, by)):
+            encontradas.update(self.celulas.get(celula, ()))
+        return encontradas
+
+
+def _dentro_par_impar(ponto, poligono):
+    """Ponto dentro do polígono pela regra par-ímpar (raio horizontal para a direita)."""
+    px, py = ponto
+    dentro = False
+    n = len(poligono)
+    for i in range(n):
+        (ax, ay), (bx, by) = poligono[i], poligono[(i + 1) % n]
+        if (ay > py) != (by > py) and px < ax + (py - ay) * (bx - ax) / (by - ay):
+            dentro = not dentro
+    return dentro
+
+
+def _lista_circular(pontos, intersecoes_por_aresta):
+    """Lista circular de _Vertice com as interseções de cada aresta inseridas em ordem."""
+    nos = []
+    for i, (x, y) in enumerate(pontos):
+        nos.append(_Vertice(x, y))
+        nos.extend(no for _, no in sorted(intersecoes_por_aresta.get(i, ()), key=lambda par: par[0]))
+    for atual, seguinte in zip(nos, nos[1:] + nos[:1]):
+        atual.prox, seguinte.ant = seguinte, atual
+    return nos
+
+
+def _marcar_entradas(nos, dentro, inverter):
+    """Marca as interseções como entrada/saída, alternando a partir do estado do primeiro vértice."""
+    for no in nos:
+        if no.intersecao:
+            no.entrada = (not dentro) != inverter
+            dentro = not dentro
+
+
+def _sem_fechamento(pontos):
+    """Vértices sem repetidos consecutivos e sem o fechamento (último == primeiro)."""
+    saida = []
+    for p in pontos:
+        p = tuple(p)
+        if not saida or p != saida[-1]:
+            saida.append(p)
+    if len(saida) >= 2 and saida[0] == saida[-1]:
+        saida.pop()
+    return saida
+
+
+def _fechado(pontos):
+    return list(pontos) + [pontos[0]]
+
+
+def greiner_hormann_clip(subject_polygon, clip_polygon, operacao=OPERACAO_INTERSECAO):
+    """
+    Operação booleana entre dois polígonos quaisquer (côncavos ou não), pelo
+    algoritmo de Greiner–Hormann.
+
+    Args:
+        subject_polygon: lista de (x, y) do polígono sujeito (aberto ou fechado).
+        clip_polygon: lista de (x, y) do polígono de recorte (aberto ou fechado).
+        operacao: OPERACAO_INTERSECAO (recorte), OPERACAO_UNIAO ou
+            OPERACAO_DIFERENCA (sujeito menos a janela).
+
+    Returns:
+        list: contornos do resultado, cada um uma lista de (x, y) fechada.
+        Um buraco (janela inteira dentro do sujeito, na diferença) vem como
+        contorno à parte, em sentido oposto ao do sujeito.
+    """
+    _validar_operacao(operacao)
+    S = _sem_fechamento(subject_polygon)
+    C = _sem_fechamento(clip_polygon)
+    if len(S) < 3 or len(C) < 3:
+        if operacao == OPERACAO_INTERSECAO:
+            return []
+        validos = [S] if len(S) >= 3 else []
+        if operacao == OPERACAO_UNIAO and len(C) >= 3:
+            validos.append(C)
+        return [_fechado(p) for p in validos]
+
+    dx, dy = _PERTURBACAO
+    Cp = [(x + dx, y + dy) for x, y in C]
+
+    # 1) Interseções entre arestas, procurando só entre as vizinhas no índice da janela
+    indice = _IndiceArestas(Cp)
+    intersecoes_s, intersecoes_c = defaultdict(list), defaultdict(list)
+    for i in range(len(S)):
+        (p1x, p1y), (p2x, p2y) = S[i], S[(i + 1) % len(S)]
+        rx, ry = p2x - p1x, p2y - p1y
+        for j in indice.candidatas(S[i], S[(i + 1) % len(S)]):
+            (q1x, q1y), (q2x, q2y) = Cp[j], Cp[(j + 1) % len(Cp)]
+            sx, sy = q2x - q1x, q2y - q1y
+            den = rx * sy - ry * sx
+            if den == 0:
+                continue  # paralelas (sem sobreposição, graças à perturbação)
+            qpx, qpy = q1x - p1x, q1y - p1y
+            t = (qpx * sy - qpy * sx) / den  # posição na aresta do sujeito
+            u = (qpx * ry - qpy * rx) / den  # posição na aresta da janela
+            if 0 < t < 1 and 0 < u < 1:
+                no_s = _Vertice(p1x + t * rx, p1y + t * ry, intersecao=True)
+                no_c = _Vertice(no_s.x, no_s.y, intersecao=True)
+                no_s.vizinho, no_c.vizinho = no_c, no_s
+                intersecoes_s[i].append((t, no_s))
+                intersecoes_c[j].append((u, no_c))
+
+    s_em_c = _dentro_par_impar(S[0], Cp)
+    c_em_s = _dentro_par_impar(Cp[0], S)
+    if not intersecoes_s:
+        # Sem cruzamentos: um contém o outro ou são disjuntos
+        if operacao == OPERACAO_INTERSECAO:
+            contornos = [S] if s_em_c else [C] if c_em_s else []
+        elif operacao == OPERACAO_UNIAO:
+            contornos = [C] if s_em_c else [S] if c_em_s else [S, C]
+        else:
+            contornos = [] if s_em_c else [S, C[::-1]] if c_em_s else [S]
+        return [_fechado(p) for p in contornos]
+
+    # 2) Listas com as interseções inseridas e marcas de entrada/saída
+    nos_s = _lista_circular(S, intersecoes_s)
+    nos_c = _lista_circular(Cp, intersecoes_c)
+    _marcar_entradas(nos_s, s_em_c, inverter=operacao != OPERACAO_INTERSECAO)
+    _marcar_entradas(nos_c, c_em_s, inverter=operacao == OPERACAO_UNIAO)
+
+    # 3) Percurso: para frente nas entradas, para trás nas saídas, trocando de lista
+    contornos = []
+    for inicio in nos_s:
+        if not inicio.intersecao or inicio.visitado:
+            continue
+        atual = inicio
+        contorno = [(atual.x, atual.y)]
+        while True:
+            atual.visitado = atual.vizinho.visitado = True
+            avancar = atual.entrada
+            while True:
+                atual = atual.prox if avancar else atual.ant
+                contorno.append((atual.x, atual.y))
+                if atual.intersecao:
+                    break
+            atual = atual.vizinho
+            if atual.visitado:
+                break
+        resultado = _poligono_arredondado(np.array(contorno, dtype=np.float64))
+        if len(resultado) >= 4:  # pelo menos 3 vértices distintos depois de arredondar
+            contornos.append(resultado)
+    return contornos
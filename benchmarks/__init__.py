@@ -0,0 +1,25 @@
+"""
+Benchmarks dos algoritmos, um módulo bench_*.py por tema.
+
+Uso (na raiz do projeto):
+    python -m benchmarks.<módulo>
+"""
+
+import time
+
+
+def cronometrar(funcao, repeticoes=1):
+    """
+    Executa funcao() 'repeticoes' vezes e retorna (resultado, tempo em ms).
+
+    O tempo é o da execução mais rápida: com mais de uma repetição, a primeira
+    (que paga a inicialização do NumPy e de caches) e o ruído do sistema não
+    entram na medida. O resultado é o da última execução.
+    """
+    melhor = float('inf')
+    resultado = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        melhor = min(melhor, (time.perf_counter() - inicio) * 1000)
+    return resultado, melhor
@@ -0,0 +1,64 @@
+"""
+Benchmark da Bézier cúbica: amostragem fixa (num_segmentos=20, o padrão
+antigo) versus amostragem adaptativa (fórmula de Wang, tolerância em células).
+
+Para cada curva informa o tempo de rasterização, o número de segmentos, o
+número de pixels e o desvio máximo entre a curva exata (amostrada densamente)
+e o pixel rasterizado mais próximo — métrica de "quão poligonal" ficou
+(inf: algum trecho da curva ficou a mais de 3 células dos pixels).
+O tempo é o da melhor de 50 execuções (antes era a média delas).
+
+Uso (na raiz do projeto):
+    python -m benchmarks.bench_bezier
+"""
+
+import math
+
+from algoritmos.curvas_bezier import numero_segmentos_adaptativo, rasterizar_curva_bezier
+from benchmarks import cronometrar
+
+CURVAS = {
+    'minúscula': ((0, 0), (1, 3), (3, 3), (4, 0)),
+    'pequena': ((0, 0), (5, 20), (20, 20), (25, 0)),
+    'média': ((-150, -100), (-80, 200), (120, -200), (150, 100)),
+    'grande': ((-2000, -1500), (-500, 3000), (1500, -3000), (2000, 1500)),
+    'enorme': ((-20000, 0), (-10000, 40000), (10000, -40000), (20000, 0)),
+}
+
+
+def _ponto(p0, p1, p2, p3, t):
+    u = 1 - t
+    b = (u * u * u, 3 * t * u * u, 3 * t * t * u, t * t * t)
+    return (sum(bi * p[0] for bi, p in zip(b, (p0, p1, p2, p3))),
+            sum(bi * p[1] for bi, p in zip(b, (p0, p1, p2, p3))))
+
+
+def _desvio_maximo(controle, pixels, amostras=4000):
+    """Maior distância de um ponto da curva exata ao pixel rasterizado mais próximo (vizinhança 7x7)."""
+    ocupados = set(pixels)
+    pior = 0.0
+    for i in range(amostras + 1):
+        x, y = _ponto(*controle, i / amostras)
+        cx, cy = round(x), round(y)
+        melhor = math.inf
+        for dx in range(-3, 4):
+            for dy in range(-3, 4):
+                if (cx + dx, cy + dy) in ocupados:
+                    melhor = min(melhor, math.hypot(cx + dx - x, cy + dy - y))
+        pior = max(pior, melhor)
+    return pior
+
+
+def main():
+    print(f"{'curva':>10} {'modo':>10} {'segmentos':>10} {'pixels':>8} {'tempo (ms)':>11} {'desvio máx':>11}")
+    for nome, controle in CURVAS.items():
+        for modo, num_segmentos in (('fixo 20', 20), ('adaptativo', None)):
+            pixels, tempo = cronometrar(lambda: rasterizar_curva_bezier(*controle, num_segmentos=num_segmentos),
+                                        repeticoes=50)
+            segmentos = num_segmentos or numero_segmentos_adaptativo(*controle)
+            desvio = _desvio_maximo(controle, pixels)
+            print(f"{nome:>10} {modo:>10} {segmentos:>10} {len(pixels):>8} {tempo:>11.3f} {desvio:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
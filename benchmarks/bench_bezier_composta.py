@@ -0,0 +1,59 @@
+"""
+Benchmark dos caminhos longos: um caminho com muitos pontos desenhado como
+várias cúbicas separadas (uma rasterização por trecho, como era antes) versus
+um único item Bézier composta / B-spline avaliado pelas matrizes de base em
+cache, e o custo de reavaliar o caminho após editá-lo (cache quente).
+Antes, confere que a Bézier de grau 3 pelas matrizes de base dá exatamente os
+pixels da cúbica por diferenças progressivas (inclusive em curvas degeneradas).
+Cada tempo é o da melhor de 5 execuções (antes era a média delas).
+
+Uso (na raiz do projeto):
+    python -m benchmarks.bench_bezier_composta
+"""
+
+import random
+
+from algoritmos.curvas_bezier import (
+    avaliar_bezier_composta, avaliar_bspline, matriz_base_bezier, matriz_base_bspline,
+    rasterizar_bezier_composta, rasterizar_bezier_grau_n, rasterizar_bspline, rasterizar_curva_bezier,
+)
+from benchmarks import cronometrar
+
+
+def _conferir_grau_3(curvas):
+    """avaliar_bezier_grau_n com 4 pontos deve dar os pixels do caminho cúbico."""
+    for num_segmentos in (None, 20):
+        for c in curvas:
+            assert rasterizar_bezier_grau_n(c, num_segmentos) == \
+                rasterizar_curva_bezier(*c, num_segmentos=num_segmentos), f"grau 3 difere da cúbica em {c}"
+
+
+def main():
+    rnd = random.Random(0)
+    degeneradas = [[(5, 5)] * 4, [(5, 5), (5, 5), (6, 5), (5, 5)], [(-3, 7), (-3, 7), (-3, 7), (-3, 8)]]
+    _conferir_grau_3(degeneradas + [[(rnd.randint(-400, 400), rnd.randint(-400, 400)) for _ in range(4)]
+                                    for _ in range(500)])
+    print(f"{'pontos':>7} {'cúbicas 1 a 1':>14} {'composta':>9} {'B-spline':>9} "
+          f"{'aval. fria':>11} {'aval. quente':>13}   (ms)")
+    for quantidade in (31, 301, 3001):
+        pontos = [(rnd.randint(-400, 400), rnd.randint(-400, 400)) for _ in range(quantidade)]
+        trechos = [pontos[i:i + 4] for i in range(0, quantidade - 3, 3)]
+        _, t_cubicas = cronometrar(lambda: [rasterizar_curva_bezier(*t) for t in trechos], repeticoes=5)
+        _, t_composta = cronometrar(lambda: rasterizar_bezier_composta(pontos), repeticoes=5)
+        _, t_bspline = cronometrar(lambda: rasterizar_bspline(pontos), repeticoes=5)
+
+        def avaliar_sem_cache():
+            matriz_base_bezier.cache_clear()
+            matriz_base_bspline.cache_clear()
+            avaliar_bezier_composta(pontos, num_segmentos=50)
+            avaliar_bspline(pontos, num_segmentos=50)
+
+        _, t_fria = cronometrar(avaliar_sem_cache, repeticoes=5)
+        _, t_quente = cronometrar(lambda: (avaliar_bezier_composta(pontos, num_segmentos=50),
+                                           avaliar_bspline(pontos, num_segmentos=50)), repeticoes=5)
+        print(f"{quantidade:>7} {t_cubicas:>14.2f} {t_composta:>9.2f} {t_bspline:>9.2f} "
+              f"{t_fria:>11.2f} {t_quente:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark da amostragem de Béziers: avaliação de Bernstein por amostra (como
+era antes) versus diferenças progressivas (escalar e em lote), e a
+rasterização completa de muitas curvas, uma a uma versus em lote (conferindo
+que o lote dá os mesmos pixels, inclusive em curvas degeneradas).
+
+Uso (na raiz do projeto):
+    python -m benchmarks.bench_bezier_lote
+"""
+
+import random
+
+from algoritmos.curvas_bezier import (
+    avaliar_bezier_lote, calcular_amostras_bezier_cubica,
+    rasterizar_curva_bezier, rasterizar_curvas_bezier_lote,
+)
+from benchmarks import cronometrar
+
+
+def _amostras_bernstein(p0, p1, p2, p3, num_segmentos):
+    """Amostragem antiga: potências e coeficientes de Bernstein para cada t."""
+    amostras = []
+    for i in range(num_segmentos + 1):
+        t = i / num_segmentos
+        u = 1 - t
+        b0, b1, b2, b3 = u ** 3, 3 * t * (u ** 2), 3 * (t ** 2) * u, t ** 3
+        amostras.append((b0 * p0[0] + b1 * p1[0] + b2 * p2[0] + b3 * p3[0],
+                         b0 * p0[1] + b1 * p1[1] + b2 * p2[1] + b3 * p3[1]))
+    return amostras
+
+
+def _conferir_lote(curvas):
+    """O lote deve dar exatamente os pixels da rasterização curva a curva."""
+    for num_segmentos in (None, 20):
+        lote = rasterizar_curvas_bezier_lote(curvas, num_segmentos=num_segmentos)
+        escalar = [rasterizar_curva_bezier(*c, num_segmentos=num_segmentos) for c in curvas]
+        assert lote == escalar, "rasterização em lote difere da escalar"
+
+
+def main():
+    rnd = random.Random(0)
+    # Curvas degeneradas (todas as amostras na mesma célula) não geram pixels
+    degeneradas = [[(5, 5)] * 4, [(5, 5), (5, 5), (6, 5), (5, 5)], [(-3, 7), (-3, 7), (-3, 7), (-3, 8)]]
+    _conferir_lote(degeneradas)
+    _conferir_lote(degeneradas[:1])
+    _conferir_lote(degeneradas + [[(rnd.randint(-400, 400), rnd.randint(-400, 400)) for _ in range(4)]
+                                  for _ in range(200)])
+    print(f"{'curvas':>7} {'segm.':>6} {'Bernstein':>10} {'dif. prog.':>11} {'lote':>8} "
+          f"{'rast. 1 a 1':>12} {'rast. lote':>11}   (ms)")
+    for quantidade in (100, 1000):
+        curvas = [[(rnd.randint(-400, 400), rnd.randint(-400, 400)) for _ in range(4)]
+                  for _ in range(quantidade)]
+        for num_segmentos in (20, 200):
+            _, t_bernstein = cronometrar(lambda: [_amostras_bernstein(*c, num_segmentos) for c in curvas])
+            _, t_diferencas = cronometrar(lambda: [calcular_amostras_bezier_cubica(*c, num_segmentos) for c in curvas])
+            _, t_lote = cronometrar(lambda: avaliar_bezier_lote(curvas, num_segmentos))
+            _, t_rast = cronometrar(lambda: [rasterizar_curva_bezier(*c, num_segmentos=num_segmentos) for c in curvas])
+            _, t_rast_lote = cronometrar(lambda: rasterizar_curvas_bezier_lote(curvas, num_segmentos=num_segmentos))
+            print(f"{quantidade:>7} {num_segmentos:>6} {t_bernstein:>10.2f} {t_diferencas:>11.2f} {t_lote:>8.2f} "
+                  f"{t_rast:>12.2f} {t_rast_lote:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
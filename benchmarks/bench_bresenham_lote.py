@@ -0,0 +1,45 @@
+"""
+Benchmark: Bresenham escalar (um segmento por vez) versus em lote (NumPy).
+
+Simula malhas projetadas com muitas arestas curtas e compara o tempo de
+calcular_linha_bresenham por segmento com calcular_linhas_bresenham_lote,
+conferindo que os pixels gerados são idênticos.
+
+Uso (na raiz do projeto):
+    python -m benchmarks.bench_bresenham_lote
+"""
+
+import random
+
+from algoritmos.bresenham import calcular_linha_bresenham, calcular_linhas_bresenham_lote
+from benchmarks import cronometrar
+
+
+def _segmentos_aleatorios(quantidade, comprimento_max, semente=0):
+    rnd = random.Random(semente)
+    segmentos = []
+    for _ in range(quantidade):
+        x1, y1 = rnd.randint(-500, 500), rnd.randint(-500, 500)
+        segmentos.append((x1, y1,
+                          x1 + rnd.randint(-comprimento_max, comprimento_max),
+                          y1 + rnd.randint(-comprimento_max, comprimento_max)))
+    return segmentos
+
+
+def main():
+    print(f"{'arestas':>8} {'comp.':>6} {'pixels':>9} {'escalar (ms)':>13} {'lote (ms)':>10} {'ganho':>7}")
+    for quantidade in (100, 1_000, 10_000):
+        for comprimento_max in (10, 100):
+            segmentos = _segmentos_aleatorios(quantidade, comprimento_max)
+
+            escalar, t_escalar = cronometrar(lambda: [pixel for x1, y1, x2, y2 in segmentos
+                                                      for pixel in calcular_linha_bresenham((x1, y1), (x2, y2))])
+            lote, t_lote = cronometrar(lambda: calcular_linhas_bresenham_lote(segmentos))
+
+            assert [tuple(p) for p in lote.tolist()] == escalar, "versão em lote divergiu da escalar"
+            print(f"{quantidade:>8} {comprimento_max:>6} {len(escalar):>9} {t_escalar:>13.2f} "
+                  f"{t_lote:>10.2f} {t_escalar / t_lote:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""
+Benchmark do círculo: calcular_circulo (8 cópias por passo, com repetições)
+versus calcular_circulo_unico (sem repetições, com e sem ordem de contorno)
+e as faixas do disco preenchido. Cada tempo é o da melhor de várias
+execuções (antes era a média delas).
+
+Uso (na raiz do projeto):
+    python -m benchmarks.bench_circulo
+"""
+
+from algoritmos.circulo_elipse import calcular_circulo, calcular_circulo_unico, iterar_faixas_circulo
+from benchmarks import cronometrar
+
+
+def main():
+    print(f"{'raio':>6} {'emitidos':>9} {'únicos':>8} {'original (ms)':>14} "
+          f"{'único (ms)':>11} {'contorno (ms)':>14} {'faixas (ms)':>12}")
+    for raio in (10, 100, 1000, 2500, 5000):
+        repeticoes = max(3, 20000 // raio)
+        centro = (0, 0)
+        original, t_orig = cronometrar(lambda: calcular_circulo(centro, raio), repeticoes=repeticoes)
+        unico, t_unico = cronometrar(lambda: calcular_circulo_unico(centro, raio), repeticoes=repeticoes)
+        _, t_contorno = cronometrar(lambda: calcular_circulo_unico(centro, raio, ordem_contorno=True), repeticoes=repeticoes)
+        _, t_faixas = cronometrar(lambda: list(iterar_faixas_circulo(centro, raio)), repeticoes=repeticoes)
+        assert set(unico) == set(original)
+        print(f"{raio:>6} {len(original):>9} {len(unico):>8} {t_orig:>14.3f} "
+              f"{t_unico:>11.3f} {t_contorno:>14.3f} {t_faixas:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
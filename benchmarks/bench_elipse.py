@@ -0,0 +1,47 @@
+"""
+Benchmark da elipse preenchida: aproximação por polígono de 72 lados +
+preencher_scanline (caminho antigo das ferramentas de preenchimento) versus
+faixas do Ponto Médio inteiro (iterar_faixas_elipse + pixels_de_faixas).
+
+Também informa quantos pixels do contorno rasterizado ficam de fora do
+preenchimento poligonal (o caminho por faixas cobre o contorno exatamente).
+
+Uso (na raiz do projeto):
+    python -m benchmarks.bench_elipse
+"""
+
+import math
+
+from algoritmos.circulo_elipse import calcular_elipse, iterar_faixas_elipse
+from algoritmos.pixels import pixels_de_faixas
+from algoritmos.preenchimento import preencher_scanline
+from benchmarks import cronometrar
+
+
+def _poligono_elipse(centro, rx, ry, num_segmentos=72):
+    """Mesma aproximação usada por Aplicacao._vertices_para_preenchimento."""
+    pts = []
+    for i in range(num_segmentos):
+        ang = 2 * math.pi * i / num_segmentos
+        pts.append((round(centro[0] + rx * math.cos(ang)), round(centro[1] + ry * math.sin(ang))))
+    pts.append(pts[0])
+    return pts
+
+
+def main():
+    print(f"{'rx':>6} {'ry':>6} {'contorno (ms)':>14} {'polígono (ms)':>14} {'faixas (ms)':>12} "
+          f"{'pixels pol.':>12} {'pixels faixas':>14} {'contorno fora (pol.)':>21}")
+    for rx, ry in ((20, 10), (100, 60), (400, 250), (1000, 700)):
+        centro = (0, 0)
+        contorno, t_contorno = cronometrar(lambda: set(calcular_elipse(centro, rx, ry)))
+        poligono, t_poligono = cronometrar(lambda: preencher_scanline(_poligono_elipse(centro, rx, ry)))
+        faixas, t_faixas = cronometrar(lambda: pixels_de_faixas(iterar_faixas_elipse(centro, rx, ry)))
+
+        fora = len(contorno - set(poligono))
+        assert contorno <= set(faixas)
+        print(f"{rx:>6} {ry:>6} {t_contorno:>14.2f} {t_poligono:>14.2f} {t_faixas:>12.2f} "
+              f"{len(poligono):>12} {len(faixas):>14} {fora:>21}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark de regiões preenchidas: o mesmo disco guardado como "Pontos"
+(um pixel por célula) versus "Faixas" (y, x_inicio, x_fim), medindo a
+repintura completa em cada backend e a memória ocupada por cada forma.
+O tempo é o da melhor de 10 repinturas (antes era a média delas).
+
+Uso (na raiz do projeto):
+    python -m benchmarks.bench_faixas
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+
+from algoritmos.circulo_elipse import iterar_faixas_circulo  # noqa: E402
+from algoritmos.pixels import pixels_de_faixas  # noqa: E402
+from benchmarks import cronometrar  # noqa: E402
+from interface.area_desenho import AreaDesenho, BACKEND_CELULAS, BACKEND_FRAMEBUFFER  # noqa: E402
+
+LARGURA_CANVAS = 800
+ALTURA_CANVAS = 800
+
+
+def main():
+    pygame.init()
+    tela = pygame.display.set_mode((LARGURA_CANVAS, ALTURA_CANVAS))
+    print(f"{'grade':>6} {'raio':>5} {'pixels':>7} {'faixas':>7} {'backend':>12} "
+          f"{'Pontos (ms)':>12} {'Faixas (ms)':>12}")
+    for grade in (200, 400):
+        raio = grade // 2 - 1
+        faixas = np.array(list(iterar_faixas_circulo((0, 0), raio)), dtype=np.int64)
+        pixels = pixels_de_faixas(faixas)
+        for backend in (BACKEND_CELULAS, BACKEND_FRAMEBUFFER):
+            tempos = []
+            for tipo, parametros in (("Pontos", {'pontos': pixels}), ("Faixas", {'faixas': faixas})):
+                area = AreaDesenho(LARGURA_CANVAS, ALTURA_CANVAS, grade, grade, backend=backend)
+                area.adicionar_forma(tipo, parametros)
+                area.desenhar(tela)  # aquece o cache
+
+                def frame_completo():
+                    area.invalidar_tudo()
+                    area.desenhar(tela)
+
+                tempos.append(cronometrar(frame_completo, repeticoes=10)[1])
+            print(f"{grade:>6} {raio:>5} {len(pixels):>7} {len(faixas):>7} {backend:>12} "
+                  f"{tempos[0]:>12.2f} {tempos[1]:>12.2f}")
+    print(f"\nMemória do disco de raio {raio}: Pontos {len(pixels) * 8} bytes, "
+          f"Faixas {faixas.nbytes} bytes")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark do flood fill: DFS por pixel (como era antes: 4 vizinhos de cada
+pixel na pilha e conjunto de visitados) versus preenchimento por faixas
+(Smith/Heckbert, visitados num bitmap), numa região delimitada por um círculo.
+
+Mede tempo, pico de memória (tracemalloc) e quantas sementes passam pela
+pilha em cada versão.
+
+Uso (na raiz do projeto):
+    python -m benchmarks.bench_flood
+"""
+
+import tracemalloc
+
+from algoritmos.circulo_elipse import iterar_circulo
+from algoritmos.preenchimento import preencher_flood_canvas
+from benchmarks import cronometrar
+
+
+def _flood_dfs(ocupados, seed, bounds):
+    """Versão antiga: DFS com os 4 vizinhos de cada pixel e conjunto de visitados."""
+    min_x, max_x, min_y, max_y = bounds
+    visitados = set()
+    pilha = [seed]
+    preenchidos = []
+    empilhados = 1
+    while pilha:
+        x, y = pilha.pop()
+        if (x, y) in visitados:
+            continue
+        visitados.add((x, y))
+        if x < min_x or x > max_x or y < min_y or y > max_y or (x, y) in ocupados:
+            continue
+        preenchidos.append((x, y))
+        pilha.extend(((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)))
+        empilhados += 4
+    return preenchidos, empilhados
+
+
+def _medir_com_memoria(funcao):
+    """(resultado, tempo em ms, pico de memória em MB) de funcao()."""
+    tracemalloc.start()
+    resultado, duracao = cronometrar(funcao)
+    pico = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    return resultado, duracao, pico
+
+
+def main():
+    print(f"{'caso':>10} {'raio':>5} {'pixels':>8} {'faixas':>7} {'sementes DFS':>13} "
+          f"{'DFS (ms)':>9} {'faixas (ms)':>12} {'DFS (MB)':>9} {'faixas (MB)':>12}")
+    for raio in (100, 200, 300):
+        borda = set(iterar_circulo((0, 0), raio))
+        limites = (-raio - 1, raio + 1, -raio - 1, raio + 1)
+        (antigos, empilhados), t_dfs, m_dfs = _medir_com_memoria(lambda: _flood_dfs(borda, (0, 0), limites))
+        faixas, t_faixas, m_faixas = _medir_com_memoria(
+            lambda: preencher_flood_canvas(borda, (0, 0), limites, como_faixas=True))
+        assert int((faixas[:, 2] - faixas[:, 1] + 1).sum()) == len(antigos)
+        print(f"{'canvas':>10} {raio:>5} {len(antigos):>8} {len(faixas):>7} {empilhados:>13} "
+              f"{t_dfs:>9.1f} {t_faixas:>12.1f} {m_dfs:>9.2f} {m_faixas:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark de memória: lista de tuplas versus PixelBuffer.
+
+Faz um flood fill grande no canvas (região delimitada por um círculo) e mede,
+com tracemalloc, a memória retida pelo resultado em cada representação:
+- lista de tuplas (x, y), como os algoritmos devolviam antes;
+- PixelBuffer (array('i') intercalado), como devolvem agora.
+
+Uso (na raiz do projeto):
+    python -m benchmarks.bench_memoria_pixels
+"""
+
+import gc
+import tracemalloc
+
+from algoritmos.circulo_elipse import iterar_circulo
+from algoritmos.pixels import PixelBuffer
+from algoritmos.preenchimento import iterar_flood_canvas
+from benchmarks import cronometrar
+
+
+def _medir_retido(construir):
+    """Memória (bytes) retida pelo objeto devolvido por construir() e o tempo gasto (ms)."""
+    gc.collect()
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    resultado, duracao = cronometrar(construir)
+    gc.collect()  # descarta estruturas temporárias (visitados, pilha)
+    retido = tracemalloc.get_traced_memory()[0] - antes
+    tracemalloc.stop()
+    return resultado, retido, duracao
+
+
+def main():
+    print(f"{'raio':>5} {'pixels':>9} {'lista (MB)':>11} {'B/pixel':>8} "
+          f"{'buffer (MB)':>12} {'B/pixel':>8} {'redução':>8}")
+    for raio in (100, 200, 300):
+        borda = set(iterar_circulo((0, 0), raio))
+        limites = (-raio - 1, raio + 1, -raio - 1, raio + 1)
+
+        lista, mem_lista, t_lista = _medir_retido(
+            lambda: list(iterar_flood_canvas(borda, (0, 0), limites)))
+        buffer, mem_buffer, t_buffer = _medir_retido(
+            lambda: PixelBuffer(iterar_flood_canvas(borda, (0, 0), limites)))
+        assert buffer == lista
+
+        n = len(lista)
+        print(f"{raio:>5} {n:>9} {mem_lista / 2**20:>11.2f} {mem_lista / n:>8.1f} "
+              f"{mem_buffer / 2**20:>12.2f} {mem_buffer / n:>8.1f} {mem_lista / mem_buffer:>7.1f}x"
+              f"   (tempo: {t_lista / 1000:.2f}s lista, {t_buffer / 1000:.2f}s buffer)")
+        del lista, buffer
+
+
+if __name__ == "__main__":
+    main()
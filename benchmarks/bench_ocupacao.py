@@ -0,0 +1,61 @@
+"""
+Benchmark da latência do flood fill num canvas cheio: reconstruir o conjunto
+de células ocupadas a partir de todo o histórico a cada seed (como era antes)
+versus o mapa de ocupação persistente da AreaDesenho, já sincronizado pelos
+frames anteriores.
+
+Uso (na raiz do projeto):
+    python -m benchmarks.bench_ocupacao
+"""
+
+import os
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from algoritmos.preenchimento import preencher_flood_canvas  # noqa: E402
+from benchmarks import cronometrar  # noqa: E402
+from interface.area_desenho import AreaDesenho  # noqa: E402
+
+LARGURA_CANVAS = 800
+ALTURA_CANVAS = 800
+
+
+def _conjunto_ocupados(area):
+    """Versão antiga: todos os pixels de todos os itens num set de tuplas."""
+    ocupados = set()
+    for desenho in area.obter_historico():
+        for bloco in area.blocos_desenho(desenho):
+            ocupados.update(map(tuple, bloco.tolist()))
+    return ocupados
+
+
+def main():
+    pygame.init()
+    tela = pygame.display.set_mode((LARGURA_CANVAS, ALTURA_CANVAS))
+    rnd = random.Random(0)
+    print(f"{'grade':>6} {'formas':>7} {'conjunto (ms)':>14} {'mapa (ms)':>10} {'sincronizar 1 nova (ms)':>24}")
+    for grade, formas in ((200, 100), (400, 1000)):
+        area = AreaDesenho(LARGURA_CANVAS, ALTURA_CANVAS, grade, grade)
+        meia = grade // 2
+        for _ in range(formas):
+            area.adicionar_forma("Linha (Bresenham)", {
+                'p1': (rnd.randint(-meia, meia), rnd.randint(-meia, meia)),
+                'p2': (rnd.randint(-meia, meia), rnd.randint(-meia, meia)),
+            })
+        area.desenhar(tela)  # frame normal: rasteriza e sincroniza a ocupação
+        limites = area.limites_grade()
+        seed = (0, 0)
+
+        _, t_conjunto = cronometrar(lambda: preencher_flood_canvas(_conjunto_ocupados(area), seed, limites, como_faixas=True))
+        _, t_mapa = cronometrar(lambda: preencher_flood_canvas(area.mapa_ocupacao()[0], seed, limites, como_faixas=True))
+        area.adicionar_forma("Círculo", {'centro': (0, 0), 'raio': meia // 2})
+        _, t_sinc = cronometrar(area.mapa_ocupacao)
+        print(f"{grade:>6} {formas:>7} {t_conjunto:>14.2f} {t_mapa:>10.2f} {t_sinc:>24.2f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark da polilinha: pixels de cada segmento concatenados por inteiro
+(como era antes, repetindo os vértices compartilhados) versus a passada única
+de rasterizar_polilinha, com e sem a deduplicação por bitmap, conferindo que
+o conjunto de pixels é o mesmo.
+
+Simula uma malha projetada: uma polilinha fechada com milhares de arestas
+curtas que se cruzam.
+
+Uso (na raiz do projeto):
+    python -m benchmarks.bench_polilinha
+"""
+
+import random
+
+import numpy as np
+
+from algoritmos.bresenham import calcular_linhas_bresenham_lote
+from algoritmos.polilinha import rasterizar_polilinha
+from benchmarks import cronometrar
+
+
+def _polilinha_concatenada(pontos):
+    """Versão antiga: todos os pixels de todos os segmentos, com as junções repetidas."""
+    segmentos = [(*pontos[i], *pontos[i + 1]) for i in range(len(pontos) - 1)]
+    return calcular_linhas_bresenham_lote(segmentos)
+
+
+def main():
+    rnd = random.Random(0)
+    print(f"{'vértices':>9} {'antes':>9} {'1 passada':>10} {'+ bitmap':>9} "
+          f"{'antes (ms)':>11} {'1 passada (ms)':>15} {'+ bitmap (ms)':>14}")
+    for quantidade in (1_000, 10_000, 100_000):
+        pontos = [(rnd.randint(-300, 300), rnd.randint(-300, 300))]
+        for _ in range(quantidade - 2):
+            x, y = pontos[-1]
+            pontos.append((max(-300, min(300, x + rnd.randint(-15, 15))),
+                           max(-300, min(300, y + rnd.randint(-15, 15)))))
+        pontos.append(pontos[0])  # fechada
+
+        antes, t_antes = cronometrar(lambda: _polilinha_concatenada(pontos))
+        passada, t_passada = cronometrar(lambda: rasterizar_polilinha(pontos))
+        unicos, t_unicos = cronometrar(lambda: rasterizar_polilinha(pontos, deduplicar=True))
+
+        conjunto = set(map(tuple, antes.tolist()))
+        assert set(passada) == conjunto and set(unicos) == conjunto
+        assert len(np.unique(unicos.como_numpy(), axis=0)) == len(unicos)
+        print(f"{quantidade:>9} {len(antes):>9} {len(passada):>10} {len(unicos):>9} "
+              f"{t_antes:>11.2f} {t_passada:>15.2f} {t_unicos:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
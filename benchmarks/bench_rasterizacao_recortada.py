@@ -0,0 +1,60 @@
+"""
+Benchmark da rasterização recortada à grade visível: formas que se estendem
+muito além de uma grade 200x200 rasterizadas inteiras (e filtradas depois)
+versus rasterizadas já com a janela (só os pixels visíveis são gerados).
+
+Uso (na raiz do projeto):
+    python -m benchmarks.bench_rasterizacao_recortada
+"""
+
+
+import numpy as np
+
+from algoritmos.bresenham import calcular_linha_bresenham, calcular_linha_bresenham_recortada
+from algoritmos.circulo_elipse import calcular_circulo_unico, iterar_elipse
+from algoritmos.polilinha import rasterizar_polilinha
+from benchmarks import cronometrar
+
+JANELA = (-100, -100, 100, 100)
+
+
+def _visiveis(pixels):
+    pts = np.asarray(list(pixels) if not hasattr(pixels, 'como_numpy') else pixels.como_numpy())
+    pts = pts.reshape(-1, 2)
+    xmin, ymin, xmax, ymax = JANELA
+    return int(((pts[:, 0] >= xmin) & (pts[:, 0] <= xmax)
+                & (pts[:, 1] >= ymin) & (pts[:, 1] <= ymax)).sum())
+
+
+def main():
+    casos = [
+        ("linha 100000 px",
+         lambda: calcular_linha_bresenham((-50_000, -30_000), (50_000, 30_000)),
+         lambda: calcular_linha_bresenham_recortada((-50_000, -30_000), (50_000, 30_000), JANELA)),
+        ("círculo r=50000",
+         lambda: calcular_circulo_unico((0, -49_950), 50_000),
+         lambda: calcular_circulo_unico((0, -49_950), 50_000, janela=JANELA)),
+        # Elipse: o quadrante é percorrido até sair do alcance da janela, então
+        # o ganho depende de onde está a parte visível (topo cedo, ponta no fim)
+        ("elipse (topo)",
+         lambda: list(iterar_elipse((0, -29_950), 40_000, 30_000)),
+         lambda: list(iterar_elipse((0, -29_950), 40_000, 30_000, janela=JANELA))),
+        ("elipse (ponta)",
+         lambda: list(iterar_elipse((39_950, 0), 40_000, 90)),
+         lambda: list(iterar_elipse((39_950, 0), 40_000, 90, janela=JANELA))),
+        ("polilinha 200 seg.",
+         lambda: rasterizar_polilinha([(-20_000 + 200 * i, (-1) ** i * 5_000) for i in range(201)],
+                                      deduplicar=True),
+         lambda: rasterizar_polilinha([(-20_000 + 200 * i, (-1) ** i * 5_000) for i in range(201)],
+                                      deduplicar=True, janela=JANELA)),
+    ]
+    print(f"{'forma':<20} {'pixels':>9} {'visíveis':>9} {'inteira (ms)':>13} {'recortada (ms)':>15}")
+    for nome, inteira, recortada in casos:
+        pixels, t_inteira = cronometrar(inteira, repeticoes=3)
+        visiveis, t_recortada = cronometrar(recortada, repeticoes=3)
+        assert len(visiveis) == _visiveis(pixels)
+        print(f"{nome:<20} {len(pixels):>9} {len(visiveis):>9} {t_inteira:>13.2f} {t_recortada:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark do recorte por janela convexa: a versão antiga de
+suth_hodgman_clip_convexo (laço Python por borda e por vértice, round() a cada
+interseção) versus JanelaConvexa preparada uma vez e reutilizada para todas as
+polilinhas, com janelas grandes (muitos vértices, como as capturadas por clique).
+
+Também mede o recorte de segmentos (Cyrus–Beck em lote) e o teste de
+pertinência por busca binária na maior janela.
+
+Uso (na raiz do projeto):
+    python -m benchmarks.bench_recorte_convexo
+"""
+
+import math
+import random
+
+import numpy as np
+
+from algoritmos.recorte import JanelaConvexa, suth_hodgman_clip_convexo
+from benchmarks import cronometrar
+from utils.geometria import garantir_ccw
+
+
+def _recortar_antigo(subject, clip):
+    """Sutherland–Hodgman convexo como era antes (janela refeita a cada chamada)."""
+    def intersect(p1, p2, q1, q2):
+        x1, y1 = p1; x2, y2 = p2
+        x3, y3 = q1; x4, y4 = q2
+        den = (x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4)
+        if den == 0:
+            return p2
+        px = ((x1*y2 - y1*x2)*(x3 - x4) - (x1 - x2)*(x3*y4 - y3*x4)) / den
+        py = ((x1*y2 - y1*x2)*(y3 - y4) - (y1 - y2)*(x3*y4 - y3*x4)) / den
+        return (round(px), round(py))
+
+    def inside(p, a, b):
+        return (b[0] - a[0]) * (p[1] - a[1]) - (b[1] - a[1]) * (p[0] - a[0]) >= 0
+
+    clip = garantir_ccw(clip)
+    output = subject
+    for i in range(len(clip)):
+        a, b = clip[i], clip[(i + 1) % len(clip)]
+        entrada, output = output, []
+        if not entrada:
+            break
+        for j in range(len(entrada)):
+            s, e = entrada[j], entrada[(j + 1) % len(entrada)]
+            s_in, e_in = inside(s, a, b), inside(e, a, b)
+            if s_in != e_in:
+                output.append(intersect(s, e, a, b))
+            if e_in:
+                output.append(e)
+    return output
+
+
+def _janela(vertices, raio):
+    """Polígono regular (convexo) com muitos vértices, como uma janela clicada."""
+    return [(round(raio * math.cos(2 * math.pi * i / vertices)),
+             round(raio * math.sin(2 * math.pi * i / vertices))) for i in range(vertices)]
+
+
+def main():
+    rnd = random.Random(0)
+    # Polilinhas espalhadas: umas dentro, outras fora, outras cruzando a borda
+    polilinhas = []
+    for _ in range(200):
+        cx, cy, r = rnd.randint(-1500, 1500), rnd.randint(-1500, 1500), rnd.randint(50, 400)
+        polilinhas.append([(cx + rnd.randint(-r, r), cy + rnd.randint(-r, r)) for _ in range(40)])
+
+    print(f"{len(polilinhas)} polilinhas de 40 vértices")
+    print(f"{'vértices da janela':>18} {'antiga (ms)':>12} {'por chamada (ms)':>17} {'reutilizada (ms)':>17}")
+    for vertices in (8, 100, 1000):
+        clip = _janela(vertices, 1000)
+        _, t_antigo = cronometrar(lambda: [_recortar_antigo(p, clip) for p in polilinhas])
+        _, t_chamada = cronometrar(lambda: [suth_hodgman_clip_convexo(p, clip) for p in polilinhas], repeticoes=3)
+
+        def reutilizada():
+            janela = JanelaConvexa(clip)
+            return [janela.recortar_poligono(p) for p in polilinhas]
+        _, t_reutilizada = cronometrar(reutilizada, repeticoes=3)
+        print(f"{vertices:>18} {t_antigo:>12.2f} {t_chamada:>17.2f} {t_reutilizada:>17.2f}")
+
+    # Segmentos: Cyrus–Beck em lote versus teste de pertinência + laço escalar
+    janela = JanelaConvexa(_janela(1000, 1000))
+    segmentos = np.random.default_rng(0).integers(-1500, 1501, size=(20_000, 4))
+    (_, aceitos), t_lote = cronometrar(lambda: janela.recortar_segmentos(segmentos), repeticoes=3)
+    print(f"{len(segmentos)} segmentos, janela de 1000 vértices: lote {t_lote:.2f} ms, "
+          f"{int(aceitos.sum())} aceitos")
+    dentro, t_contem = cronometrar(lambda: janela.contem_lote(segmentos.reshape(-1, 2)), repeticoes=3)
+    print(f"{len(dentro)} pontos testados por busca binária: {t_contem:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
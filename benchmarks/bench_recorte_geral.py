@@ -0,0 +1,51 @@
+"""
+Benchmark do recorte geral (Greiner–Hormann) com polígonos côncavos: tempo de
+greiner_hormann_clip para as três operações e quantos pares de arestas o
+índice em grade manda testar, comparado aos n·m pares da busca exaustiva.
+
+Uso (na raiz do projeto):
+    python -m benchmarks.bench_recorte_geral
+"""
+
+import math
+import random
+
+from algoritmos.recorte import (
+    OPERACAO_DIFERENCA, OPERACAO_INTERSECAO, OPERACAO_UNIAO, _IndiceArestas, greiner_hormann_clip,
+)
+from benchmarks import cronometrar
+
+
+def _flor(cx, cy, vertices, raio, petalas, fase):
+    """Polígono simples e côncavo (raio ondulado), amostrado com muitos vértices."""
+    pontos = []
+    for i in range(vertices):
+        angulo = 2 * math.pi * i / vertices
+        r = raio * (0.7 + 0.3 * math.sin(petalas * angulo + fase))
+        pontos.append((cx + round(r * math.cos(angulo)), cy + round(r * math.sin(angulo))))
+    return pontos
+
+
+def _pares_testados(sujeito, janela):
+    indice = _IndiceArestas(janela)
+    n = len(sujeito)
+    return sum(len(indice.candidatas(sujeito[i], sujeito[(i + 1) % n])) for i in range(n))
+
+
+def main():
+    rnd = random.Random(0)
+    print(f"{'vértices':>9} {'pares n·m':>11} {'pares testados':>15} "
+          f"{'interseção (ms)':>16} {'união (ms)':>11} {'diferença (ms)':>15} {'contornos':>10}")
+    for vertices in (100, 1_000, 10_000, 50_000):
+        sujeito = _flor(0, 0, vertices, 5000, 7, 0.0)
+        janela = _flor(1500, 800, vertices, 5000, 5, rnd.uniform(0, math.pi))
+        resultados = {operacao: cronometrar(lambda: greiner_hormann_clip(sujeito, janela, operacao), repeticoes=3)
+                      for operacao in (OPERACAO_INTERSECAO, OPERACAO_UNIAO, OPERACAO_DIFERENCA)}
+        contornos, t_intersecao = resultados[OPERACAO_INTERSECAO]
+        print(f"{vertices:>9} {vertices * vertices:>11} {_pares_testados(sujeito, janela):>15} "
+              f"{t_intersecao:>16.2f} {resultados[OPERACAO_UNIAO][1]:>11.2f} "
+              f"{resultados[OPERACAO_DIFERENCA][1]:>15.2f} {len(contornos):>10}")
+
+
+if __name__ == "__main__":
+    main()
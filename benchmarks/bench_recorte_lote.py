@@ -0,0 +1,33 @@
+"""
+Benchmark do recorte de linhas: laço Python com cohen_sutherland_clip (um
+segmento por chamada) versus liang_barsky_clip no mesmo laço versus
+liang_barsky_clip_lote (todos os segmentos numa passada NumPy).
+
+Uso (na raiz do projeto):
+    python -m benchmarks.bench_recorte_lote
+"""
+
+
+import numpy as np
+
+from algoritmos.recorte import cohen_sutherland_clip, liang_barsky_clip, liang_barsky_clip_lote
+from benchmarks import cronometrar
+
+
+def main():
+    rng = np.random.default_rng(0)
+    janela = (-60, -40, 60, 40)
+    print(f"{'segmentos':>10} {'Cohen-Sutherland (ms)':>22} {'Liang-Barsky (ms)':>18} "
+          f"{'lote (ms)':>10} {'aceitos':>8}")
+    for n in (1_000, 10_000, 100_000):
+        segmentos = rng.integers(-150, 151, size=(n, 4))
+        lista = [((x1, y1), (x2, y2)) for x1, y1, x2, y2 in segmentos.tolist()]
+        _, t_cs = cronometrar(lambda: [cohen_sutherland_clip(p1, p2, *janela) for p1, p2 in lista])
+        escalar, t_lb = cronometrar(lambda: [liang_barsky_clip(p1, p2, *janela) for p1, p2 in lista])
+        (_, aceitos), t_lote = cronometrar(lambda: liang_barsky_clip_lote(segmentos, *janela))
+        assert aceitos.tolist() == [r is not None for r in escalar]
+        print(f"{n:>10} {t_cs:>22.2f} {t_lb:>18.2f} {t_lote:>10.2f} {int(aceitos.sum()):>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Benchmark da união de polígonos sobrepostos: preencher cada polígono à parte e
+unir os pixels num conjunto (como seria sem a regra não-zero) versus uma única
+varredura ET/AET com regra não-zero, que já devolve as faixas da união.
+
+Uso (na raiz do projeto):
+    python -m benchmarks.bench_regra_preenchimento
+"""
+
+import math
+import random
+
+from algoritmos.preenchimento import (
+    REGRA_NAO_ZERO, REGRA_PAR_IMPAR, preencher_scanline, preencher_scanline_multi,
+)
+from benchmarks import cronometrar
+from utils.geometria import garantir_ccw
+
+
+def _poligono_regular(cx, cy, raio, lados, horario):
+    pts = [(cx + round(raio * math.cos(2 * math.pi * i / lados)),
+            cy + round(raio * math.sin(2 * math.pi * i / lados))) for i in range(lados)]
+    return pts[::-1] if horario else pts
+
+
+def main():
+    rnd = random.Random(0)
+    print(f"{'polígonos':>9} {'pixels':>9} {'união de conjuntos (ms)':>23} "
+          f"{'não-zero (ms)':>14} {'par-ímpar (ms)':>15}")
+    for quantidade in (4, 16, 64):
+        poligonos = [_poligono_regular(rnd.randint(-200, 200), rnd.randint(-200, 200),
+                                       rnd.randint(40, 160), rnd.randint(3, 40), rnd.random() < 0.5)
+                     for _ in range(quantidade)]
+        uniao, t_conjuntos = cronometrar(
+            lambda: set().union(*(set(preencher_scanline(p)) for p in poligonos)))
+        orientados = [garantir_ccw(p) for p in poligonos]
+        pixels, t_nao_zero = cronometrar(
+            lambda: preencher_scanline_multi(orientados, regra=REGRA_NAO_ZERO))
+        _, t_par_impar = cronometrar(
+            lambda: preencher_scanline_multi(orientados, regra=REGRA_PAR_IMPAR))
+        assert set(pixels) == uniao
+        print(f"{quantidade:>9} {len(pixels):>9} {t_conjuntos:>23.2f} "
+              f"{t_nao_zero:>14.2f} {t_par_impar:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
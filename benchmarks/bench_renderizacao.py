@@ -0,0 +1,74 @@
+"""
+Benchmark de tempo de frame da AreaDesenho.
+
+Mede, para algumas resoluções de grade e para cada backend:
+- camada de grade: custo de desenhar todas as linhas (reconstrução) versus
+  copiar a camada pré-renderizada (o que acontece a cada frame);
+- frame completo: repintura total da cena (invalidar_tudo + desenhar);
+- frame ocioso: nada mudou desde o frame anterior.
+Cada tempo é o da melhor de várias execuções (antes era a média delas).
+
+Uso (na raiz do projeto):
+    python -m benchmarks.bench_renderizacao
+"""
+
+import os
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from benchmarks import cronometrar  # noqa: E402
+from interface.area_desenho import AreaDesenho, BACKEND_CELULAS, BACKEND_FRAMEBUFFER  # noqa: E402
+
+LARGURA_CANVAS = 800
+ALTURA_CANVAS = 800
+
+
+def _montar_cena(area, num_formas, semente=0):
+    """Preenche o histórico com círculos, linhas, Béziers e polilinhas aleatórios."""
+    rnd = random.Random(semente)
+    meia_l = area.largura_grid // 2
+    meia_a = area.altura_grid // 2
+
+    def ponto():
+        return (rnd.randint(-meia_l, meia_l), rnd.randint(-meia_a, meia_a))
+
+    for i in range(num_formas):
+        tipo = i % 4
+        if tipo == 0:
+            area.adicionar_forma("Círculo", {'centro': ponto(), 'raio': rnd.randint(5, meia_l // 2)})
+        elif tipo == 1:
+            area.adicionar_forma("Linha (Bresenham)", {'p1': ponto(), 'p2': ponto()})
+        elif tipo == 2:
+            area.adicionar_forma("Curva de Bézier", {f'p{k}': ponto() for k in range(4)})
+        else:
+            area.adicionar_forma("Polilinha", {'pontos': [ponto() for _ in range(8)]})
+
+
+def main():
+    tela = pygame.Surface((LARGURA_CANVAS, ALTURA_CANVAS))
+    print(f"{'grade':>9} {'backend':>12} {'grade:linhas':>13} {'grade:blit':>11} "
+          f"{'frame total':>12} {'frame ocioso':>13}   (ms)")
+    for resolucao in (100, 200, 400):
+        for backend in (BACKEND_CELULAS, BACKEND_FRAMEBUFFER):
+            area = AreaDesenho(LARGURA_CANVAS, ALTURA_CANVAS, resolucao, resolucao, backend=backend)
+            _montar_cena(area, num_formas=200)
+            area.desenhar(tela)  # aquece o cache de rasterização
+
+            _, t_linhas = cronometrar(area._construir_camada_grade, repeticoes=20)
+            _, t_blit = cronometrar(area.desenhar_grade, repeticoes=200)
+
+            def frame_total():
+                area.invalidar_tudo()
+                area.desenhar(tela)
+
+            _, t_total = cronometrar(frame_total, repeticoes=10)
+            _, t_ocioso = cronometrar(lambda: area.desenhar(tela), repeticoes=200)
+            print(f"{resolucao:>4}x{resolucao:<4} {backend:>12} {t_linhas:>13.3f} {t_blit:>11.3f} "
+                  f"{t_total:>12.3f} {t_ocioso:>13.3f}")
+
+
+if __name__ == "__main__":
+    main()
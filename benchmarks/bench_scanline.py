@@ -0,0 +1,45 @@
+"""
+Benchmark do preenchimento Scanline: varredura que testa todas as arestas em
+cada linha (como era antes, O(H·E)) versus tabela de arestas + arestas ativas
+(O(H + E + faixas)), em polígonos regulares com cada vez mais lados.
+
+Uso (na raiz do projeto):
+    python -m benchmarks.bench_scanline
+"""
+
+import math
+
+from algoritmos.preenchimento import iterar_faixas_scanline, preencher_scanline
+from benchmarks import cronometrar
+
+
+def _faixas_todas_arestas(vertices):
+    """Versão antiga: para cada y, interseção (float) com todas as arestas."""
+    pts = list(vertices) + [vertices[0]]
+    ys = [y for _, y in pts]
+    faixas = []
+    for y in range(min(ys), max(ys) + 1):
+        xs = []
+        for (x1, y1), (x2, y2) in zip(pts, pts[1:]):
+            if y1 != y2 and min(y1, y2) <= y < max(y1, y2):
+                xs.append(x1 + (y - y1) / (y2 - y1) * (x2 - x1))
+        xs.sort()
+        for j in range(0, len(xs) - 1, 2):
+            faixas.append((y, math.ceil(xs[j]), math.floor(xs[j + 1])))
+    return faixas
+
+
+def main():
+    raio = 300
+    print(f"{'lados':>7} {'faixas':>7} {'todas arestas (ms)':>19} {'ET/AET (ms)':>12} {'pixels (ms)':>12}")
+    for lados in (72, 1_000, 10_000):
+        vertices = [(round(raio * math.cos(2 * math.pi * i / lados)),
+                     round(raio * math.sin(2 * math.pi * i / lados))) for i in range(lados)]
+        _, t_antes = cronometrar(lambda: _faixas_todas_arestas(vertices))
+        faixas, t_aet = cronometrar(lambda: list(iterar_faixas_scanline(vertices)))
+        _, t_pixels = cronometrar(lambda: preencher_scanline(vertices))
+        print(f"{lados:>7} {len(faixas):>7} {t_antes:>19.2f} {t_aet:>12.2f} {t_pixels:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
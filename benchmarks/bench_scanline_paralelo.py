@@ -0,0 +1,47 @@
+"""
+Benchmark do Scanline multi-polígono paralelo: o mesmo conjunto de polígonos
+varrido em série e com 2, 4, ... processos (bandas horizontais num
+ProcessPoolExecutor), conferindo que as faixas são idênticas às da versão serial.
+
+O tempo paralelo inclui criar o pool e enviar a tabela de arestas a cada
+processo; o ganho só aparece em grades/polígonos grandes e com vários núcleos.
+
+Uso (na raiz do projeto):
+    python -m benchmarks.bench_scanline_paralelo
+"""
+
+import math
+import os
+import random
+
+import numpy as np
+
+from algoritmos.preenchimento import preencher_scanline_multi
+from benchmarks import cronometrar
+
+
+def _estrela(cx, cy, raio, pontas):
+    """Polígono estrelado (côncavo) com 2·pontas vértices."""
+    return [(cx + round((raio if i % 2 == 0 else raio // 3) * math.cos(math.pi * i / pontas)),
+             cy + round((raio if i % 2 == 0 else raio // 3) * math.sin(math.pi * i / pontas)))
+            for i in range(2 * pontas)]
+
+
+def main():
+    rnd = random.Random(0)
+    poligonos = [_estrela(rnd.randint(-1000, 1000), rnd.randint(-1000, 1000),
+                          rnd.randint(100, 600), rnd.randint(50, 2000)) for _ in range(20)]
+    serial, t_serial = cronometrar(lambda: preencher_scanline_multi(poligonos, como_faixas=True))
+    print(f"{len(poligonos)} polígonos, {len(serial)} faixas; núcleos disponíveis: {os.cpu_count()}")
+    print(f"{'processos':>9} {'tempo (ms)':>11} {'aceleração':>11}")
+    print(f"{'serial':>9} {t_serial:>11.2f} {1.0:>10.2f}x")
+    contagens = sorted({2, 4, os.cpu_count() or 1} - {1})
+    for trabalhadores in contagens:
+        faixas, t = cronometrar(lambda: preencher_scanline_multi(
+            poligonos, como_faixas=True, trabalhadores=trabalhadores))
+        assert np.array_equal(faixas, serial), "resultado paralelo difere do serial"
+        print(f"{trabalhadores:>9} {t:>11.2f} {t_serial / t:>10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
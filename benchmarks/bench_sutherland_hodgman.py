@@ -0,0 +1,81 @@
+"""
+Benchmark do Sutherland–Hodgman retangular: a versão antiga (quatro listas
+intermediárias, índice com módulo e round() a cada borda) versus a atual
+(estágios vetorizados em float, arredondando uma vez no fim).
+
+Mede o tempo em polígonos com milhares de vértices e, em lascas finas
+(triângulos quase degenerados), quantos resultados diferem do recorte exato
+com frações arredondado no fim.
+
+Uso (na raiz do projeto):
+    python -m benchmarks.bench_sutherland_hodgman
+"""
+
+import math
+import random
+from fractions import Fraction
+
+from algoritmos.recorte import sutherland_hodgman_clip
+from benchmarks import cronometrar
+
+
+def _bordas(xmin, ymin, xmax, ymax):
+    """(eixo, limite, lado) de cada borda: dentro <=> lado * (coordenada - limite) >= 0."""
+    return ((0, xmin, 1), (0, xmax, -1), (1, ymin, 1), (1, ymax, -1))
+
+
+def _recortar(poligono, janela, converter, arredondar_cada_borda):
+    """Sutherland–Hodgman com laço por borda (como era antes, se arredondar_cada_borda)."""
+    vertices = [(converter(x), converter(y)) for x, y in poligono]
+    for eixo, limite, lado in _bordas(*janela):
+        saida = []
+        for i in range(len(vertices)):
+            p, q = vertices[i], vertices[(i + 1) % len(vertices)]
+            p_dentro = lado * (p[eixo] - limite) >= 0
+            q_dentro = lado * (q[eixo] - limite) >= 0
+            if p_dentro != q_dentro:
+                outro = p[1 - eixo] + (q[1 - eixo] - p[1 - eixo]) * (limite - p[eixo]) / (q[eixo] - p[eixo])
+                ponto = (limite, outro) if eixo == 0 else (outro, limite)
+                saida.append(tuple(map(round, ponto)) if arredondar_cada_borda else ponto)
+            if q_dentro:
+                saida.append(q)
+        vertices = saida
+    return _compactar([(round(x), round(y)) for x, y in vertices])
+
+
+def _compactar(vertices):
+    compacto = []
+    for p in vertices:
+        if not compacto or p != compacto[-1]:
+            compacto.append(p)
+    if len(compacto) >= 2 and compacto[0] != compacto[-1]:
+        compacto.append(compacto[0])
+    return compacto
+
+
+def main():
+    janela = (-3000, -2500, 3500, 4000)
+    print(f"{'vértices':>9} {'antiga (ms)':>12} {'atual (ms)':>11}")
+    for n in (1_000, 10_000, 100_000):
+        poligono = [(round(5000 * math.cos(2 * math.pi * i / n) * (1 + 0.3 * math.sin(14 * math.pi * i / n))),
+                     round(5000 * math.sin(2 * math.pi * i / n))) for i in range(n)]
+        antigo, t_antigo = cronometrar(lambda: _recortar(poligono, janela, int, True))
+        atual, t_atual = cronometrar(lambda: sutherland_hodgman_clip(poligono, janela))
+        print(f"{n:>9} {t_antigo:>12.2f} {t_atual:>11.2f}")
+
+    rnd = random.Random(0)
+    casos, erros_antigo, erros_atual = 2000, 0, 0
+    for _ in range(casos):
+        # Lasca fina: dois vértices distantes e um terceiro quase sobre a reta entre eles
+        a = (rnd.randint(-400, 400), rnd.randint(-400, 400))
+        b = (rnd.randint(-400, 400), rnd.randint(-400, 400))
+        c = ((a[0] + b[0]) // 2 + rnd.randint(-2, 2), (a[1] + b[1]) // 2 + rnd.randint(-2, 2))
+        janela = (rnd.randint(-150, -1), rnd.randint(-150, -1), rnd.randint(1, 150), rnd.randint(1, 150))
+        exato = _recortar([a, c, b], janela, Fraction, False)
+        erros_antigo += _recortar([a, c, b], janela, int, True) != exato
+        erros_atual += sutherland_hodgman_clip([a, c, b], janela) != exato
+    print(f"lascas finas: {casos} casos; diferentes do exato: antiga {erros_antigo}, atual {erros_atual}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,19 @@
 import math
+import numpy as np
 import pygame
 import pygame_gui
 from interface.painel_controle import PainelControle
 from interface.painel_projecoes import PainelProjecoes
 from interface.area_desenho import AreaDesenho
-from algoritmos.circulo_elipse import calcular_circulo, calcular_elipse
-from algoritmos.preenchimento import preencher_scanline, preencher_flood_canvas, preencher_scanline_multi
-from algoritmos.recorte import cohen_sutherland_clip, sutherland_hodgman_clip, suth_hodgman_clip_convexo
+from algoritmos.circulo_elipse import (
+    calcular_circulo_unico, calcular_elipse, iterar_faixas_circulo, iterar_faixas_elipse
+)
+from algoritmos.pixels import PixelBuffer, pixels_de_faixas
+from algoritmos.preenchimento import preencher_flood_canvas, preencher_scanline, preencher_scanline_multi
+from algoritmos.recorte import (
+    JanelaConvexa, cohen_sutherland_clip, greiner_hormann_clip, liang_barsky_clip_lote,
+    sutherland_hodgman_clip,
+)
 from algoritmos.projecoes import (
     obter_cubo_padrao, obter_arestas_cubo, projecao_ortogonal,
     projecao_cavalier, projecao_cabinet, projecao_perspectiva
@@ -14,6 +21,16 @@ from algoritmos.projecoes import (
 from utils.geometria import eh_convexo
 import algoritmos.transformacoes as transform
 
+# Opções de "Traçar como" (painel da Polilinha) -> tipo do item no histórico.
+# Todos guardam {'pontos': [...]} e se transformam ponto a ponto como a Polilinha.
+TRACADOS_POLILINHA = {
+    'Polilinha': "Polilinha",
+    'Bézier': "Bézier (grau n)",
+    'Composta': "Bézier Composta",
+    'B-spline': "B-spline",
+}
+TIPOS_TRACADO_POR_PONTOS = tuple(TRACADOS_POLILINHA.values())
+
 # --- Constantes de Layout ---
 LARGURA_TOTAL = 1250
 ALTURA_TOTAL = 800
@@ -36,7 +53,7 @@ class Aplicacao:
         self.proximo_clique_define = None
         self.polilinha_capturando = False
         self.polilinha_pontos = []
-        # Captura de janela de recorte poligonal (convexa)
+        # Captura de janela de recorte poligonal (convexa ou côncava)
         self.clip_poly_capturando = False
         self.clip_poly_pontos = []
         self.painel_projecoes = None
@@ -214,6 +231,16 @@ class Aplicacao:
             pygame.display.flip()
         pygame.quit()
 
+    def _tipo_tracado_selecionado(self):
+        """Tipo de histórico escolhido em "Traçar como" para os pontos da polilinha."""
+        try:
+            opc = self.painel_controle.elementos_polilinha['dropdown_traco'].selected_option
+            if isinstance(opc, tuple):
+                opc = opc[0]
+        except Exception:
+            opc = 'Polilinha'
+        return TRACADOS_POLILINHA.get(opc, "Polilinha")
+
     def _obter_vertices_selecionados(self):
         indice = self.area_desenho.obter_indice_selecionado()
         if indice is None:
@@ -224,7 +251,7 @@ class Aplicacao:
             pontos = [desenho.parametros['p1'], desenho.parametros['p2']]
         elif desenho.tipo == "Curva de Bézier":
             pontos = [desenho.parametros[f'p{i}'] for i in range(4)]
-        elif desenho.tipo == "Polilinha":
+        elif desenho.tipo in TIPOS_TRACADO_POR_PONTOS:
             pontos = desenho.parametros.get('pontos', [])
         elif desenho.tipo == "Pontos":
             pontos = desenho.parametros.get('pontos', [])
@@ -240,10 +267,10 @@ class Aplicacao:
         elif desenho.tipo == "Curva de Bézier":
             for i, ponto in enumerate(novos_pontos):
                 desenho.parametros[f'p{i}'] = ponto
-        elif desenho.tipo == "Polilinha":
+        elif desenho.tipo in TIPOS_TRACADO_POR_PONTOS:
             desenho.parametros['pontos'] = novos_pontos
         elif desenho.tipo == "Pontos":
-            desenho.parametros['pontos'] = novos_pontos
+            desenho.parametros['pontos'] = PixelBuffer(novos_pontos)
 
     def _converter_para_polilinha(self, desenho):
         # Conversão de figuras paramétricas (Círculo/Elipse) para polilinha
@@ -318,22 +345,14 @@ class Aplicacao:
         elif tipo_figura == 'flood':
             # Flood fill livre no canvas: preenche região vazia conectada à seed
             seed = (coords[0], coords[1])
-            historico = self.area_desenho.obter_historico()
-            ocupados = set()
-            for d in historico:
-                pixels = self.area_desenho.rasterizar_desenho(d)
-                for p in pixels:
-                    ocupados.add(tuple(p))
-            # Limites do grid (em coords de grade)
-            min_x = - (self.area_desenho.largura_grid // 2)
-            max_x = (self.area_desenho.largura_grid // 2)
-            min_y = - (self.area_desenho.altura_grid // 2)
-            max_y = (self.area_desenho.altura_grid // 2)
-            preenchidos = preencher_flood_canvas(ocupados, seed, (min_x, max_x, min_y, max_y))
-            if not preenchidos:
+            # Bitmap de ocupação mantido pela AreaDesenho (só as alterações desde o
+            # último frame são sincronizadas) e os limites do grid em coords de grade
+            ocupados, limites = self.area_desenho.mapa_ocupacao()
+            faixas = preencher_flood_canvas(ocupados, seed, limites, como_faixas=True)
+            if not len(faixas):
                 print("Nada a preencher (seed inválida ou célula já ocupada).")
                 return
-            self.area_desenho.adicionar_forma("Pontos", { 'pontos': preenchidos })
+            self.area_desenho.adicionar_forma("Faixas", { 'faixas': faixas })
         
 
     def manipular_selecao_historico(self, evento):
@@ -367,7 +386,7 @@ class Aplicacao:
         - Configurações e Projeções 3D
         - Desenho de figuras
         - Polilinha (texto e por clique)
-        - Recorte (margens e janela convexa)
+        - Recorte (margens e janela poligonal)
         - Transformações (trans/escala/rotação)
         - Preenchimentos (scanline e flood)
         - Botões de definição (Def) e ações gerais (limpar/desfazer)
@@ -601,7 +620,7 @@ class Aplicacao:
                 pontos_str = [p.strip() for p in painel.elementos_polilinha['entrada_pontos'].get_text().split(';')]
                 pontos = [tuple(map(int, p.split(','))) for p in pontos_str if p]
                 if len(pontos) < 2: print("Erro: A polilinha precisa de pelo menos 2 pontos."); return
-                self.area_desenho.adicionar_forma("Polilinha", {'pontos': pontos})
+                self.area_desenho.adicionar_forma(self._tipo_tracado_selecionado(), {'pontos': pontos})
             except ValueError: print("Erro: Formato dos pontos inválido. Use 'x1,y1; x2,y2; ...'")
         elif evento.ui_element == painel.elementos_polilinha.get('btn_iniciar_clique'):
             self.polilinha_capturando = True
@@ -654,7 +673,7 @@ class Aplicacao:
             if len(self.polilinha_pontos) < 2:
                 print("Polilinha por clique requer pelo menos 2 pontos.")
             else:
-                self.area_desenho.adicionar_forma("Polilinha", {'pontos': list(self.polilinha_pontos)})
+                self.area_desenho.adicionar_forma(self._tipo_tracado_selecionado(), {'pontos': list(self.polilinha_pontos)})
             self.polilinha_capturando = False
             self.polilinha_pontos = []
             # Remove a prévia após finalizar
@@ -685,26 +704,20 @@ class Aplicacao:
                 except ValueError:
                     print("Erro: Formato dos pontos inválido. Use 'x1,y1; x2,y2; ...'")
 
-        # --- Recorte por janela poligonal convexa (definida por clique) ---
+        # --- Recorte por janela poligonal (definida por clique) ---
         elif evento.ui_element == painel.elementos_recorte.get('btn_clip_iniciar'):
             # Inicia captura de janela de recorte por clique
             self.clip_poly_capturando = True
             self.clip_poly_pontos = []
             self.area_desenho.limpar_preview_clip_poligono()
-            print("Clique no canvas para definir os vértices da janela (convexa). Clique em 'Finalizar' para aplicar.")
+            print("Clique no canvas para definir os vértices da janela. Clique em 'Finalizar' para aplicar.")
         elif evento.ui_element == painel.elementos_recorte.get('btn_clip_finalizar'):
-            # Finaliza captura e aplica recorte se convexa
+            # Finaliza captura e aplica o recorte (convexa: JanelaConvexa; côncava: Greiner–Hormann)
             if len(self.clip_poly_pontos) < 3:
                 print("A janela poligonal requer pelo menos 3 vértices.")
                 self.clip_poly_capturando = False
                 # mantém a prévia para referência
                 return
-            # Valida convexidade
-            if not eh_convexo(self.clip_poly_pontos):
-                print("Janela inválida: o polígono não é convexo. Redefina com pontos convexos.")
-                self.clip_poly_capturando = False
-                # mantém a prévia para o usuário visualizar o erro
-                return
 
             # Atualiza o campo de texto com os pontos da janela que será usada
             try:
@@ -713,34 +726,56 @@ class Aplicacao:
             except Exception as e:
                 print(f"Erro ao atualizar campo de texto da janela: {e}")
 
-            # Aplica recorte apenas para Polilinha selecionada
+            if eh_convexo(self.clip_poly_pontos):
+                # Janela convexa: preparada uma vez (normais das bordas) e reutilizada
+                try:
+                    janela = JanelaConvexa(self.clip_poly_pontos)
+                except ValueError as e:
+                    print(f"Janela inválida: {e}")
+                    self.clip_poly_capturando = False
+                    return
+
+                def recortar(pontos):
+                    resultado = janela.recortar_poligono(pontos)
+                    return [resultado] if resultado else []
+            else:
+                # Janela côncava: recorte geral (Greiner–Hormann), que pode gerar vários contornos
+                clip_poly = self.clip_poly_pontos[:]
+
+                def recortar(pontos):
+                    return greiner_hormann_clip(pontos, clip_poly)
+
+            historico = self.area_desenho.obter_historico()
             indice_sel = self.area_desenho.obter_indice_selecionado()
             if indice_sel is None:
-                print("Selecione uma Polilinha para aplicar o recorte.")
-                self.clip_poly_capturando = False
-                return
-            desenho = self.area_desenho.obter_historico()[indice_sel]
-            if desenho.tipo != 'Polilinha':
+                # Sem seleção: recorta todas as Polilinhas pela mesma janela
+                indices = [i for i, d in enumerate(historico) if d.tipo == 'Polilinha']
+                if not indices:
+                    print("Nenhuma Polilinha no histórico para recortar.")
+                    self.clip_poly_capturando = False
+                    return
+            elif historico[indice_sel].tipo != 'Polilinha':
                 print("Recorte poligonal disponível apenas para Polilinha.")
                 self.clip_poly_capturando = False
                 return
-            subject = desenho.parametros.get('pontos', [])
-            # Remove fechamento duplicado do sujeito, se houver
-            if len(subject) >= 2 and subject[0] == subject[-1]:
-                subject = subject[:-1]
-            clip_poly = self.clip_poly_pontos[:]
-            resultado = suth_hodgman_clip_convexo(subject, clip_poly)
-            if resultado:
-                # Garante fechamento para rasterização de polilinha
-                if resultado[0] != resultado[-1]:
-                    resultado.append(resultado[0])
-                desenho.parametros['pontos'] = resultado
-                print("Polilinha recortada pela janela convexa.")
             else:
-                # Nada restou — remove desenho
-                self.area_desenho.remover_desenho_indice(indice_sel)
-                print("Polilinha completamente fora da janela convexa. Removida.")
-            
+                indices = [indice_sel]
+            removidas, novos_contornos = [], []
+            for i in indices:
+                desenho = historico[i]
+                contornos = recortar(desenho.parametros.get('pontos', []))
+                if contornos:
+                    desenho.parametros['pontos'] = contornos[0]  # já vem fechado
+                    novos_contornos.extend(contornos[1:])  # partes separadas viram novas Polilinhas
+                else:
+                    removidas.append(i)  # nada restou
+            if removidas:
+                self.area_desenho.remover_desenhos_indices(removidas)
+            for contorno in novos_contornos:
+                self.area_desenho.adicionar_forma("Polilinha", {'pontos': contorno})
+            print(f"{len(indices) - len(removidas)} Polilinha(s) recortada(s) pela janela; "
+                  f"{len(removidas)} removida(s) (fora da janela); {len(novos_contornos)} parte(s) extra(s).")
+
             # Finaliza o modo de captura, mas mantém a janela (pontos e preview) para referência futura
             self.clip_poly_capturando = False
         
@@ -757,7 +792,10 @@ class Aplicacao:
                     desenho.parametros['centro'] = (cx + tx, cy + ty)
                 elif desenho.tipo == "Pontos":
                     novos = transform.transladar(desenho.parametros.get('pontos', []), tx, ty)
-                    desenho.parametros['pontos'] = novos
+                    desenho.parametros['pontos'] = PixelBuffer(novos)
+                elif desenho.tipo == "Faixas":
+                    # Translação inteira preserva as faixas: desloca y e os dois extremos em x
+                    desenho.parametros['faixas'] = desenho.parametros['faixas'] + np.array([ty, tx, tx])
                 else:
                     desenho_v, pontos = self._obter_vertices_selecionados()
                     if not desenho_v: return
@@ -797,7 +835,12 @@ class Aplicacao:
                     desenho.parametros['ry'] = round(desenho.parametros['ry'] * sy)
                 elif desenho.tipo == "Pontos":
                     novos = transform.escalar(desenho.parametros.get('pontos', []), sx, sy, ponto_fixo)
-                    desenho.parametros['pontos'] = novos
+                    desenho.parametros['pontos'] = PixelBuffer(novos)
+                elif desenho.tipo == "Faixas":
+                    # Escala genérica não preserva faixas: passa a tratá-lo como 'Pontos'
+                    pixels = pixels_de_faixas(desenho.parametros['faixas'])
+                    desenho.tipo = "Pontos"
+                    desenho.parametros = { 'pontos': PixelBuffer(transform.escalar(pixels, sx, sy, ponto_fixo)) }
                 else:
                     pontos = []
                     if desenho.tipo in ["Círculo", "Elipse"]:
@@ -819,18 +862,23 @@ class Aplicacao:
                 py = int(painel.elementos_transformacao['rot_py'].get_text())
                 if desenho.tipo == "Círculo":
                     # Rotaciona cada pixel rasterizado do círculo e passa a tratá-lo como 'Pontos'
-                    pixels = calcular_circulo(desenho.parametros['centro'], desenho.parametros['raio'])
+                    pixels = calcular_circulo_unico(desenho.parametros['centro'], desenho.parametros['raio'])
                     novos_pontos = transform.rotacionar(pixels, angulo, (px, py))
                     desenho.tipo = "Pontos"
-                    desenho.parametros = { 'pontos': novos_pontos }
+                    desenho.parametros = { 'pontos': PixelBuffer(novos_pontos) }
                 elif desenho.tipo == "Elipse":
                     pixels = calcular_elipse(desenho.parametros['centro'], desenho.parametros['rx'], desenho.parametros['ry'])
                     novos_pontos = transform.rotacionar(pixels, angulo, (px, py))
                     desenho.tipo = "Pontos"
-                    desenho.parametros = { 'pontos': novos_pontos }
+                    desenho.parametros = { 'pontos': PixelBuffer(novos_pontos) }
                 elif desenho.tipo == "Pontos":
                     novos_pontos = transform.rotacionar(desenho.parametros.get('pontos', []), angulo, (px, py))
-                    desenho.parametros['pontos'] = novos_pontos
+                    desenho.parametros['pontos'] = PixelBuffer(novos_pontos)
+                elif desenho.tipo == "Faixas":
+                    pixels = pixels_de_faixas(desenho.parametros['faixas'])
+                    novos_pontos = transform.rotacionar(pixels, angulo, (px, py))
+                    desenho.tipo = "Pontos"
+                    desenho.parametros = { 'pontos': PixelBuffer(novos_pontos) }
                 else:
                     _, pontos = self._obter_vertices_selecionados()
                     if not pontos: return
@@ -886,6 +934,33 @@ class Aplicacao:
             except ValueError:
                 print("Erro nos parâmetros de recorte.")
 
+        elif evento.ui_element == painel.elementos_recorte.get('btn_recorte_todas'):
+            # Recorta todas as linhas do histórico numa única chamada (Liang–Barsky em lote)
+            try:
+                left = int(painel.elementos_recorte['left'].get_text())
+                bottom = int(painel.elementos_recorte['bottom'].get_text())
+                right = int(painel.elementos_recorte['right'].get_text())
+                top = int(painel.elementos_recorte['top'].get_text())
+            except ValueError:
+                print("Erro nos parâmetros de recorte."); return
+            xmin, xmax = sorted([left, right])
+            ymin, ymax = sorted([bottom, top])
+            historico = self.area_desenho.obter_historico()
+            indices = [i for i, d in enumerate(historico) if d.tipo == "Linha (Bresenham)"]
+            if not indices:
+                print("Nenhuma linha no histórico para recortar."); return
+            self.area_desenho.definir_janela_recorte((xmin, ymin, xmax, ymax))
+            segmentos = [(*historico[i].parametros['p1'], *historico[i].parametros['p2']) for i in indices]
+            recortados, aceitos = liang_barsky_clip_lote(segmentos, xmin, ymin, xmax, ymax)
+            for i, original, novo, aceito in zip(indices, segmentos, recortados.tolist(), aceitos):
+                if aceito and tuple(novo) != original:
+                    # Uma única atualização → uma única nova versão do desenho
+                    historico[i].parametros.update(p1=tuple(novo[:2]), p2=tuple(novo[2:]))
+            removidas = [i for i, aceito in zip(indices, aceitos) if not aceito]
+            if removidas:
+                self.area_desenho.remover_desenhos_indices(removidas)
+            print(f"{len(indices) - len(removidas)} linha(s) recortada(s); {len(removidas)} removida(s) (fora da janela).")
+
     # Botão específico de polígono removido — recorte unificado no botão principal
 
         elif evento.ui_element == painel.elementos_transformacao.get('btn_preencher_scan'):
@@ -903,11 +978,11 @@ class Aplicacao:
                 if not todos_vertices:
                     print("Nenhum polígono válido para preencher no canvas.")
                     return
-                pixels = preencher_scanline_multi(todos_vertices)
-                if not pixels:
+                faixas = preencher_scanline_multi(todos_vertices, como_faixas=True)
+                if not len(faixas):
                     print("Nada a preencher considerando todos os polígonos.")
                     return
-                self.area_desenho.adicionar_forma("Pontos", { 'pontos': pixels })
+                self.area_desenho.adicionar_forma("Faixas", { 'faixas': faixas })
                 print(f"Scanline aplicado tratando {len(todos_vertices)} polígonos como um só.")
                 return
             else:
@@ -915,15 +990,28 @@ class Aplicacao:
                 if desenho.tipo not in ["Polilinha", "Círculo", "Elipse"]:
                     print("Scanline disponível para Polilinha, Círculo e Elipse.")
                     return
+                if desenho.tipo in ["Círculo", "Elipse"]:
+                    # Preenchimento exato pelas faixas do próprio Ponto Médio (sem aproximar por polígono)
+                    params = desenho.parametros
+                    if desenho.tipo == "Círculo":
+                        faixas = iterar_faixas_circulo(params['centro'], params['raio'])
+                    else:
+                        faixas = iterar_faixas_elipse(params['centro'], params['rx'], params['ry'])
+                    faixas = np.array(list(faixas), dtype=np.int64).reshape(-1, 3)
+                    if not len(faixas):
+                        print("Nada a preencher (raio inválido).")
+                        return
+                    self.area_desenho.adicionar_forma("Faixas", { 'faixas': faixas })
+                    return
                 vertices = self._vertices_para_preenchimento(desenho)
                 if len(vertices) < 3:
                     print("Não há vértices suficientes para preencher.")
                     return
-                pixels = preencher_scanline(vertices)
-                if not pixels:
+                faixas = preencher_scanline(vertices, como_faixas=True)
+                if not len(faixas):
                     print("Nada a preencher (verifique se o polígono é simples/fechado).")
                     return
-                self.area_desenho.adicionar_forma("Pontos", { 'pontos': pixels })
+                self.area_desenho.adicionar_forma("Faixas", { 'faixas': faixas })
 
         elif evento.ui_element == painel.elementos_transformacao.get('btn_preencher_rec'):
             # Ativa modo seed por clique para Flood Fill
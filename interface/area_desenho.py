@@ -1,9 +1,16 @@
+import math
+import numpy as np
 import pygame
 from utils.historico import Historico
-from algoritmos.bresenham import calcular_linha_bresenham
-from algoritmos.circulo_elipse import calcular_circulo, calcular_elipse
-from algoritmos.curvas_bezier import rasterizar_curva_bezier
-from algoritmos.polilinha import rasterizar_polilinha
+from utils.cache_raster import CacheRaster
+from algoritmos.pixels import PixelBuffer, pixels_de_faixas, recortar_faixas
+from algoritmos.bresenham import calcular_linha_bresenham_recortada, iterar_linha_bresenham
+from algoritmos.circulo_elipse import calcular_circulo_unico, iterar_elipse
+from algoritmos.curvas_bezier import (
+    iterar_curva_bezier, rasterizar_curvas_bezier_lote,
+    rasterizar_bezier_grau_n, rasterizar_bezier_composta, rasterizar_bspline,
+)
+from algoritmos.polilinha import iterar_polilinha, rasterizar_polilinha
 
 COR_FUNDO = (20, 20, 20)
 COR_GRADE = (40, 40, 40)
@@ -11,6 +18,55 @@ COR_EIXO = (80, 80, 80)
 COR_PIXEL = (255, 255, 255)
 COR_SELECIONADO = (255, 255, 0)
 
+# Backends de renderização disponíveis:
+# - "celulas": pinta cada célula como retângulo diretamente no canvas;
+# - "framebuffer": rasteriza num buffer com 1 pixel por célula (resolução da
+#   grade) e faz uma única ampliação (vizinho mais próximo) para o canvas.
+BACKEND_CELULAS = 'celulas'
+BACKEND_FRAMEBUFFER = 'framebuffer'
+# Cor de fundo transparente (colorkey) do framebuffer; não é usada por formas
+COR_CHAVE_FRAMEBUFFER = (255, 0, 255)
+
+# Acima deste número de regiões sujas num frame, repinta a caixa envolvente
+MAX_REGIOES_SUJAS = 8
+# Células com mais pixels de tela que isto são pintadas com fill (uma por
+# célula); abaixo disso, a pintura vetorizada por deslocamento compensa.
+MAX_AREA_CELULA_VETORIZADA = 64
+
+
+def _bbox_pixels(pixels):
+    """Caixa envolvente (xmin, ymin, xmax, ymax) de uma lista de pixels."""
+    if not pixels:
+        return None
+    xs = [p[0] for p in pixels]
+    ys = [p[1] for p in pixels]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def _bbox_blocos(blocos):
+    """Caixa envolvente de pixels recebidos em blocos NumPy (k, 2)."""
+    bbox = None
+    for bloco in blocos:
+        xmin, ymin = bloco.min(axis=0).tolist()
+        xmax, ymax = bloco.max(axis=0).tolist()
+        if bbox is not None:
+            xmin, ymin = min(xmin, bbox[0]), min(ymin, bbox[1])
+            xmax, ymax = max(xmax, bbox[2]), max(ymax, bbox[3])
+        bbox = (xmin, ymin, xmax, ymax)
+    return bbox
+
+
+def _bbox_faixas(faixas):
+    """Caixa envolvente de faixas (y, x_inicio, x_fim)."""
+    f = np.asarray(faixas, dtype=np.int64).reshape(-1, 3)
+    if len(f) == 0:
+        return None
+    return (int(f[:, 1].min()), int(f[:, 0].min()), int(f[:, 2].max()), int(f[:, 0].max()))
+
+
+def _bboxes_intersectam(a, b):
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
 
 class AreaDesenho:
     """
@@ -23,41 +79,91 @@ class AreaDesenho:
     - Desenhar a grade e eixos (x=0, y=0) para referência visual;
     - Gerenciar o histórico (adicionar, remover, desfazer, seleção atual);
     - Rasterizar e desenhar cada item do histórico por tipo (linha, círculo,
-        elipse, Bézier, polilinha, pontos);
-    - Exibir pré-visualizações (polilinha em construção e janela convexa);
+        elipse, Bézier, polilinha, pontos, faixas), reaproveitando os pixels de cada
+        versão do desenho por meio de um cache LRU (CacheRaster);
+    - Exibir pré-visualizações (polilinha em construção e janela de recorte poligonal);
+    - Escolher o backend de renderização: células pintadas uma a uma no
+        canvas ("celulas") ou framebuffer na resolução da grade ampliado de uma
+        só vez ("framebuffer"), mais adequado para grades muito finas;
     - Converter coordenadas de tela (pixels) para coordenadas de grade (inteiros).
     """
-    def __init__(self, largura, altura, largura_grid, altura_grid):
+    def __init__(self, largura, altura, largura_grid, altura_grid, backend=BACKEND_CELULAS):
         self.largura = largura
         self.altura = altura
         self.surface = pygame.Surface((largura, altura))
         self.historico = Historico()
+        self.cache_raster = CacheRaster()
         self.indice_selecionado = None
         self.janela_recorte = None
         self.preview_polilinha = None  # lista de pontos (x, y) para pré-visualização
-        self.preview_clip_poligono = None  # janela de recorte poligonal (convexa)
+        self.preview_clip_poligono = None  # janela de recorte poligonal (convexa ou côncava)
+        self._pixels_preview_polilinha = []  # pixels já rasterizados das prévias
+        self._pixels_preview_clip = []
+        # Estado do renderizador retido (regiões sujas em coordenadas de grade)
+        self._regioes_sujas = []
+        self._redesenho_total = True
+        self._estado_anterior = set()  # {(versao, cor, bbox)} do último frame
+        self._bbox_por_versao = {}
+        # Mapa de ocupação persistente (ver _sincronizar_ocupacao): quantos
+        # itens ocupam cada célula da grade e as células de cada versão
+        self._ocupacao = None
+        self._limites_ocupacao = None
+        self._celulas_por_versao = {}
+        # Pintura em lote via NumPy/surfarray; False usa o caminho antigo
+        # (um pygame.draw.rect por célula), útil para comparar pixel a pixel.
+        self.pintura_vetorizada = True
+        # Rasteriza linhas, círculos, elipses, polilinhas e faixas já recortados
+        # às células visíveis (janela_rasterizacao); False gera a forma inteira.
+        self.rasterizacao_recortada = True
+        self.backend = backend
+        self._framebuffer = None  # pygame.Surface na resolução da grade
+        self._janela_framebuffer = (0, 0, 0, 0)  # (gx0, gx1, gy0, gy1) visíveis
         # valores padrão até atualizar a resolução
         self.tamanho_celula_x = 0
         self.tamanho_celula_y = 0
+        self._camada_grade = None  # fundo + grade + eixos pré-renderizados
         self.atualizar_resolucao_grid(largura_grid, altura_grid)
 
     def definir_janela_recorte(self, rect):
+        if rect == self.janela_recorte:
+            return
+        self.marcar_regiao_suja(self.janela_recorte)
         self.janela_recorte = rect
+        self.marcar_regiao_suja(rect)
 
     def limpar_janela_recorte(self):
-        self.janela_recorte = None
+        self.definir_janela_recorte(None)
 
     def definir_preview_polilinha(self, pontos):
-        self.preview_polilinha = list(pontos) if pontos else None
+        pontos = list(pontos) if pontos else None
+        if pontos == self.preview_polilinha:
+            return
+        self.preview_polilinha = pontos
+        self.marcar_regiao_suja(_bbox_pixels(self._pixels_preview_polilinha))
+        # Rasteriza uma única vez por alteração (e não a cada frame)
+        self._pixels_preview_polilinha = (
+            rasterizar_polilinha(pontos) if pontos and len(pontos) >= 2 else []
+        )
+        self.marcar_regiao_suja(_bbox_pixels(self._pixels_preview_polilinha))
 
     def limpar_preview_polilinha(self):
-        self.preview_polilinha = None
+        self.definir_preview_polilinha(None)
 
     def definir_preview_clip_poligono(self, pontos):
-        self.preview_clip_poligono = list(pontos) if pontos else None
+        pontos = list(pontos) if pontos else None
+        if pontos == self.preview_clip_poligono:
+            return
+        self.preview_clip_poligono = pontos
+        pixels = []
+        if pontos and len(pontos) >= 2:
+            chain = pontos if pontos[0] == pontos[-1] else (pontos + [pontos[0]] if len(pontos) >= 3 else pontos)
+            pixels = rasterizar_polilinha(chain)
+        self.marcar_regiao_suja(_bbox_pixels(self._pixels_preview_clip))
+        self._pixels_preview_clip = pixels
+        self.marcar_regiao_suja(_bbox_pixels(pixels))
 
     def limpar_preview_clip_poligono(self):
-        self.preview_clip_poligono = None
+        self.definir_preview_clip_poligono(None)
 
     def atualizar_resolucao_grid(self, nova_largura, nova_altura):
         """
@@ -67,15 +173,61 @@ class AreaDesenho:
         """
         self.largura_grid = nova_largura
         self.altura_grid = nova_altura
-        self.tamanho_celula_x = (self.largura / self.largura_grid) if self.largura_grid > 0 else 0
-        self.tamanho_celula_y = (self.altura / self.altura_grid) if self.altura_grid > 0 else 0
         self.limpar_pixels()
+        self._recalcular_celulas()
 
-    def desenhar_grade(self):
+    def redimensionar(self, largura, altura):
+        """
+        Ajusta o canvas a um novo tamanho de janela (em pixels), mantendo a
+        resolução da grade e o histórico; as células são reescaladas.
+        """
+        self.largura = largura
+        self.altura = altura
+        self.surface = pygame.Surface((largura, altura))
+        self._recalcular_celulas()
+
+    def _recalcular_celulas(self):
+        """Recalcula tamanho das células e as camadas que dependem dele."""
+        self.tamanho_celula_x = (self.largura / self.largura_grid) if self.largura_grid > 0 else 0
+        self.tamanho_celula_y = (self.altura / self.altura_grid) if self.altura_grid > 0 else 0
+        self._construir_camada_grade()
+        self._preparar_framebuffer()
+        self.invalidar_tudo()
+
+    def definir_backend(self, backend):
+        """Alterna entre BACKEND_CELULAS e BACKEND_FRAMEBUFFER."""
+        if backend not in (BACKEND_CELULAS, BACKEND_FRAMEBUFFER):
+            raise ValueError(f"Backend de renderização desconhecido: {backend}")
+        self.backend = backend
+        self.invalidar_tudo()
+
+    def _preparar_framebuffer(self):
+        """
+        Calcula o intervalo de células visíveis no canvas e (re)cria o
+        framebuffer com um pixel por célula. As células visíveis são as que
+        cobrem ao menos parte de [0, largura) x [0, altura) na tela.
+        """
+        if self.tamanho_celula_x <= 0 or self.tamanho_celula_y <= 0:
+            self._framebuffer = None
+            return
+        cx, cy = self.largura / 2, self.altura / 2
+        gx0 = math.floor(-cx / self.tamanho_celula_x)
+        gx1 = math.ceil((self.largura - cx) / self.tamanho_celula_x) - 1
+        gy0 = math.floor((cy - self.altura) / self.tamanho_celula_y)
+        gy1 = math.ceil(cy / self.tamanho_celula_y) - 1
+        self._janela_framebuffer = (gx0, gx1, gy0, gy1)
+        self._framebuffer = pygame.Surface((gx1 - gx0 + 1, gy1 - gy0 + 1))
+        self._framebuffer.set_colorkey(COR_CHAVE_FRAMEBUFFER)
+
+    def _construir_camada_grade(self):
         """
-        Desenha linhas verticais e horizontais igualmente espaçadas conforme a
-        resolução de grade atual. Os eixos x=0 e y=0 são destacados.
+        Pré-renderiza fundo, linhas verticais/horizontais igualmente
+        espaçadas e eixos (x=0 e y=0 destacados) numa superfície própria.
+        Só é refeita quando a resolução da grade ou o tamanho do canvas mudam;
+        a cada frame basta copiá-la (desenhar_grade).
         """
+        camada = pygame.Surface((self.largura, self.altura))
+        camada.fill(COR_FUNDO)
         centro_x, centro_y = self.largura / 2, self.altura / 2
         half_w = self.largura_grid // 2
         half_h = self.altura_grid // 2
@@ -83,12 +235,24 @@ class AreaDesenho:
         for xg in range(-half_w, half_w + 1):
             pos_x = centro_x + xg * self.tamanho_celula_x
             cor = COR_EIXO if xg == 0 else COR_GRADE
-            pygame.draw.line(self.surface, cor, (pos_x, 0), (pos_x, self.altura))
+            pygame.draw.line(camada, cor, (pos_x, 0), (pos_x, self.altura))
 
         for yg in range(-half_h, half_h + 1):
             pos_y = centro_y - yg * self.tamanho_celula_y
             cor = COR_EIXO if yg == 0 else COR_GRADE
-            pygame.draw.line(self.surface, cor, (0, pos_y), (self.largura, pos_y))
+            pygame.draw.line(camada, cor, (0, pos_y), (self.largura, pos_y))
+        self._camada_grade = camada
+
+    def desenhar_grade(self, area=None):
+        """
+        Copia a camada de fundo + grade + eixos para o canvas (primeira
+        camada de cada frame). area: pygame.Rect opcional para copiar apenas
+        parte dela (repintura de regiões sujas).
+        """
+        if area is None:
+            self.surface.blit(self._camada_grade, (0, 0))
+        else:
+            self.surface.blit(self._camada_grade, area.topleft, area)
 
     def desenhar_pixel(self, x_grid, y_grid, cor=COR_PIXEL):
         """
@@ -108,12 +272,91 @@ class AreaDesenho:
         rect = pygame.Rect(x_tela, y_tela, self.tamanho_celula_x, self.tamanho_celula_y)
         pygame.draw.rect(self.surface, cor, rect)
 
+    def desenhar_pixels(self, pixels, cor=COR_PIXEL):
+        """
+        Pinta várias células de uma vez. Com pintura_vetorizada, as
+        coordenadas de grade viram retângulos de tela em um único passo
+        NumPy e são escritas direto na superfície (pygame.surfarray),
+        respeitando o clipping atual. Caso contrário, usa desenhar_pixel.
+        """
+        if not self.pintura_vetorizada:
+            for p in pixels:
+                self.desenhar_pixel(p[0], p[1], cor)
+            return
+        if self.tamanho_celula_x <= 0 or self.tamanho_celula_y <= 0 or len(pixels) == 0:
+            return
+        pts = np.asarray(pixels, dtype=np.int64).reshape(-1, 2)
+        cx, cy = self.largura / 2, self.altura / 2
+        # Mesma conversão de desenhar_pixel; pygame.Rect trunca em direção a zero
+        xs = np.trunc(cx + pts[:, 0] * self.tamanho_celula_x).astype(np.int64)
+        ys = np.trunc(cy - (pts[:, 1] + 1) * self.tamanho_celula_y).astype(np.int64)
+        w = int(self.tamanho_celula_x)
+        h = int(self.tamanho_celula_y)
+        if w <= 0 or h <= 0:
+            return
+        clip = self.surface.get_clip()
+        # Descarta células que não tocam a área de clipping
+        visiveis = (xs < clip.right) & (xs + w > clip.left) & (ys < clip.bottom) & (ys + h > clip.top)
+        xs, ys = xs[visiveis], ys[visiveis]
+        if xs.size == 0:
+            return
+
+        if w * h > MAX_AREA_CELULA_VETORIZADA:
+            # Células grandes: poucos pixels de grade, um fill por célula
+            for x, y in zip(xs.tolist(), ys.tolist()):
+                self.surface.fill(cor, (x, y, w, h))
+            return
+
+        valor = self.surface.map_rgb(cor)
+        tela = pygame.surfarray.pixels2d(self.surface)
+        try:
+            # Um passo vetorizado por deslocamento (dx, dy) dentro da célula
+            for dx in range(w):
+                px = xs + dx
+                dentro_x = (px >= clip.left) & (px < clip.right)
+                for dy in range(h):
+                    py = ys + dy
+                    m = dentro_x & (py >= clip.top) & (py < clip.bottom)
+                    tela[px[m], py[m]] = valor
+        finally:
+            del tela  # libera o lock da superfície
+
+    def desenhar_faixas(self, faixas, cor=COR_PIXEL):
+        """
+        Pinta faixas horizontais (y, x_inicio, x_fim) da grade, cada uma como
+        um único retângulo de tela (uma região 200×200 são 200 fills, não
+        40 000). Os cantos seguem a mesma conversão de desenhar_pixel.
+
+        Com células de tamanho fracionário, o truncamento deixa frestas entre
+        células vizinhas que um retângulo único cobriria; nesse caso pintamos
+        célula a célula para o resultado ser o mesmo de "Pontos".
+        """
+        f = np.asarray(faixas, dtype=np.int64).reshape(-1, 3)
+        if self.tamanho_celula_x <= 0 or self.tamanho_celula_y <= 0 or len(f) == 0:
+            return
+        w = int(self.tamanho_celula_x)
+        h = int(self.tamanho_celula_y)
+        if w <= 0 or h <= 0:
+            return
+        if w != self.tamanho_celula_x or h != self.tamanho_celula_y or not self.pintura_vetorizada:
+            self.desenhar_pixels(pixels_de_faixas(f), cor)
+            return
+        cx, cy = self.largura / 2, self.altura / 2
+        x0 = np.trunc(cx + f[:, 1] * self.tamanho_celula_x).astype(np.int64)
+        x1 = np.trunc(cx + f[:, 2] * self.tamanho_celula_x).astype(np.int64) + w
+        y0 = np.trunc(cy - (f[:, 0] + 1) * self.tamanho_celula_y).astype(np.int64)
+        clip = self.surface.get_clip()
+        visiveis = (x0 < clip.right) & (x1 > clip.left) & (y0 < clip.bottom) & (y0 + h > clip.top)
+        for xa, xb, ya in zip(x0[visiveis].tolist(), x1[visiveis].tolist(), y0[visiveis].tolist()):
+            self.surface.fill(cor, (xa, ya, xb - xa, h))  # fill respeita o clipping
+
     def adicionar_forma(self, tipo_desenho, parametros):
         self.historico.adicionar_desenho(tipo_desenho, parametros or {})
         self.indice_selecionado = None
 
     def limpar_pixels(self):
         self.historico.limpar_historico()
+        self.cache_raster.limpar()
         self.indice_selecionado = None
         self.limpar_janela_recorte()
         self.limpar_preview_polilinha()
@@ -121,6 +364,7 @@ class AreaDesenho:
 
     def desfazer_ultimo_desenho(self):
         self.historico.desfazer_ultimo_desenho()
+        self.cache_raster.descartar(d.versao for d in self.obter_historico())
         self.indice_selecionado = None
 
     def obter_historico(self):
@@ -128,6 +372,12 @@ class AreaDesenho:
 
     def remover_desenho_indice(self, indice: int):
         self.historico.remover_por_indice(indice)
+        self.cache_raster.descartar(d.versao for d in self.obter_historico())
+        self.indice_selecionado = None
+
+    def remover_desenhos_indices(self, indices):
+        self.historico.remover_por_indices(indices)
+        self.cache_raster.descartar(d.versao for d in self.obter_historico())
         self.indice_selecionado = None
 
     def selecionar_desenho(self, indice):
@@ -146,67 +396,382 @@ class AreaDesenho:
 
     def desenhar(self, tela):
         """
-        Redesenha completamente a área de desenho:
+        Atualiza a área de desenho em modo retido (retained mode):
+        a superfície composta é mantida entre frames e apenas as regiões
+        "sujas" (retângulos em coordenadas de grade) são repintadas.
+
+        Regiões ficam sujas quando formas são adicionadas, removidas,
+        selecionadas ou transformadas (detectado comparando a versão/cor de
+        cada item com o frame anterior) e quando prévias ou a janela de
+        recorte mudam. Frames ociosos apenas copiam a superfície para a tela.
+
+        Ordem de pintura em cada região:
         1) Fundo + grade + eixos
         2) Janela retangular de recorte (se houver)
         3) Formas do histórico rasterizadas (com destaque para a seleção)
-        4) Pré-visualizações (polilinha e janela convexa)
+        4) Pré-visualizações (polilinha e janela de recorte poligonal)
         """
-        self.surface.fill(COR_FUNDO)
-        self.desenhar_grade()
+        itens = self._coletar_itens()
+        self._marcar_alteracoes_historico(itens)
+        self._sincronizar_ocupacao(itens)
+
+        if self.backend == BACKEND_FRAMEBUFFER and self._framebuffer is not None:
+            # O framebuffer é barato de recompor inteiro: qualquer sujeira
+            # dispara uma composição completa; frames ociosos não fazem nada.
+            if self._redesenho_total or self._regioes_sujas:
+                self._compor_framebuffer(itens)
+        elif self._redesenho_total:
+            self._repintar_regiao(None, itens)
+        else:
+            for regiao in self._agrupar_regioes(self._regioes_sujas):
+                self._repintar_regiao(regiao, itens)
+        self._regioes_sujas = []
+        self._redesenho_total = False
 
-        # Janela retangular (margens) em vermelho
-        if self.janela_recorte:
-            xmin, ymin, xmax, ymax = self.janela_recorte
-            x0 = self.largura / 2 + xmin * self.tamanho_celula_x
-            y0 = self.altura / 2 - (ymax + 1) * self.tamanho_celula_y
-            w = (xmax - xmin + 1) * self.tamanho_celula_x
-            h = (ymax - ymin + 1) * self.tamanho_celula_y
-            rect = pygame.Rect(x0, y0, w, h)
-            pygame.draw.rect(self.surface, (255, 0, 0), rect, 1)
-
-        # Desenha histórico
+        tela.blit(self.surface, (0, 0))
+
+    def invalidar_tudo(self):
+        """Força a repintura completa da superfície no próximo frame."""
+        self._redesenho_total = True
+
+    def marcar_regiao_suja(self, bbox):
+        """Agenda a repintura da região (xmin, ymin, xmax, ymax) da grade."""
+        if bbox is not None:
+            self._regioes_sujas.append(bbox)
+
+    def _coletar_itens(self):
+        """
+        Monta a lista (versao, cor, bbox, desenho) dos itens do histórico na
+        ordem de pintura. A bbox de cada versão é reaproveitada do frame
+        anterior, então o custo em frames ociosos é O(número de itens) e nenhum
+        item é rasterizado.
+        """
+        bboxes_anteriores = self._bbox_por_versao
+        self._bbox_por_versao = {}
+        self._rasterizar_curvas_pendentes(bboxes_anteriores)
+        itens = []
         for i, desenho in enumerate(self.obter_historico()):
             cor = COR_SELECIONADO if i == self.indice_selecionado else COR_PIXEL
-            pixels = self.rasterizar_desenho(desenho)
-            for p in pixels:
-                self.desenhar_pixel(p[0], p[1], cor)
+            if desenho.versao in bboxes_anteriores:
+                bbox = bboxes_anteriores[desenho.versao]
+            elif desenho.tipo == "Faixas":
+                bbox = _bbox_faixas(desenho.parametros['faixas'])
+            else:
+                bbox = _bbox_blocos(self.blocos_desenho(desenho))
+            self._bbox_por_versao[desenho.versao] = bbox
+            itens.append((desenho.versao, cor, bbox, desenho))
+        return itens
+
+    def _rasterizar_curvas_pendentes(self, bboxes_anteriores):
+        """
+        Rasteriza de uma vez (rasterizar_curvas_bezier_lote) as curvas de
+        Bézier novas/alteradas deste frame e as coloca no cache, em vez de
+        amostrar uma curva por vez. Útil ao carregar/transformar cenas com
+        muitas curvas.
+        """
+        pendentes = [
+            d for d in self.obter_historico()
+            if d.tipo == "Curva de Bézier" and d.versao not in bboxes_anteriores
+            and not self.cache_raster.contem(d)
+        ]
+        if len(pendentes) < 2:
+            return
+        controles = [[d.parametros[f'p{i}'] for i in range(4)] for d in pendentes]
+        for desenho, pixels in zip(pendentes, rasterizar_curvas_bezier_lote(controles)):
+            self.cache_raster.guardar(desenho, pixels)
+
+    def janela_rasterizacao(self):
+        """
+        Janela (xmin, ymin, xmax, ymax), inclusiva, usada para recortar a
+        rasterização: as células visíveis (as mesmas de _preparar_framebuffer)
+        unidas a limites_grade, para o mapa de ocupação não mudar. Depende só
+        da grade: não muda ao redimensionar o canvas, e mudar a grade limpa o
+        histórico e o cache, então os pixels recortados no cache seguem válidos.
+        """
+        lg, ag = self.largura_grid, self.altura_grid
+        return (-((lg + 1) // 2), -((ag + 1) // 2), lg // 2, ag // 2)
+
+    def limites_grade(self):
+        """Limites inclusivos (min_x, max_x, min_y, max_y) da grade, em células."""
+        meia_l, meia_a = self.largura_grid // 2, self.altura_grid // 2
+        return (-meia_l, meia_l, -meia_a, meia_a)
+
+    def mapa_ocupacao(self):
+        """
+        Bitmap das células ocupadas por algum item do histórico, pronto para o
+        flood fill (preencher_flood_canvas aceita o bitmap no lugar do conjunto).
+
+        Returns:
+            tuple: (array bool (altura, largura) com linha = y - min_y e
+            coluna = x - min_x, limites_grade()).
+        """
+        self._sincronizar_ocupacao(self._coletar_itens())
+        return self._ocupacao > 0, self._limites_ocupacao
+
+    def _sincronizar_ocupacao(self, itens):
+        """
+        Atualiza o mapa de ocupação pela diferença de versões desde a última
+        sincronização: versões que sumiram (removidas/alteradas) descontam suas
+        células, versões novas somam as suas. Usamos contagens (não bool) para
+        que remover um item não libere células que outro item também ocupa.
+        Em frames sem alterações o custo é O(número de itens).
+        """
+        limites = self.limites_grade()
+        if self._ocupacao is None or limites != self._limites_ocupacao:
+            min_x, max_x, min_y, max_y = limites
+            self._ocupacao = np.zeros((max_y - min_y + 1, max_x - min_x + 1), dtype=np.int32)
+            self._limites_ocupacao = limites
+            self._celulas_por_versao = {}
+        contagem = self._ocupacao.reshape(-1)  # visão linear (linha * largura + coluna)
+        vivas = {versao: (bbox, desenho) for versao, _, bbox, desenho in itens}
+        for versao in [v for v in self._celulas_por_versao if v not in vivas]:
+            contagem[self._celulas_por_versao.pop(versao)] -= 1
+        for versao, (bbox, desenho) in vivas.items():
+            if versao not in self._celulas_por_versao:
+                celulas = self._celulas_ocupadas(desenho, bbox)
+                contagem[celulas] += 1  # índices únicos: a soma direta é segura
+                self._celulas_por_versao[versao] = celulas
+
+    def _celulas_ocupadas(self, desenho, bbox):
+        """Índices lineares (únicos) das células do mapa ocupadas pelo desenho."""
+        min_x, max_x, min_y, max_y = self._limites_ocupacao
+        largura = max_x - min_x + 1
+        vazio = np.empty(0, dtype=np.int64)
+        if bbox is None or not _bboxes_intersectam(bbox, (min_x, min_y, max_x, max_y)):
+            return vazio
+        if desenho.tipo == "Faixas":
+            # Recorta as faixas aos limites antes de expandir
+            f = np.asarray(desenho.parametros['faixas'], dtype=np.int64).reshape(-1, 3)
+            f = np.stack([f[:, 0], np.maximum(f[:, 1], min_x), np.minimum(f[:, 2], max_x)], axis=1)
+            f = f[(f[:, 0] >= min_y) & (f[:, 0] <= max_y)]
+            blocos = [pixels_de_faixas(f).como_numpy()]
+        else:
+            blocos = self.blocos_desenho(desenho)
+        partes = []
+        for bloco in blocos:
+            b = np.asarray(bloco, dtype=np.int64).reshape(-1, 2)
+            dentro = (b[:, 0] >= min_x) & (b[:, 0] <= max_x) & (b[:, 1] >= min_y) & (b[:, 1] <= max_y)
+            b = b[dentro]
+            partes.append((b[:, 1] - min_y) * largura + (b[:, 0] - min_x))
+        return np.unique(np.concatenate(partes)) if partes else vazio
+
+    def _marcar_alteracoes_historico(self, itens):
+        """Compara o estado do histórico com o do frame anterior."""
+        estado = {(versao, cor, bbox) for versao, cor, bbox, _ in itens}
+        # Itens que surgiram (novos/alterados/recoloridos) ou sumiram
+        for _, _, bbox in estado.symmetric_difference(self._estado_anterior):
+            self.marcar_regiao_suja(bbox)
+        self._estado_anterior = estado
+
+    def _agrupar_regioes(self, regioes):
+        """
+        Une regiões sobrepostas. Se sobrarem muitas, usa a caixa envolvente
+        de todas (repintar um retângulo grande é mais barato que dezenas).
+        """
+        grupos = []
+        for r in regioes:
+            # Loop de fusão: absorve todo grupo que intersecta a região atual
+            i = 0
+            while i < len(grupos):
+                g = grupos[i]
+                if r[0] <= g[2] + 1 and g[0] <= r[2] + 1 and r[1] <= g[3] + 1 and g[1] <= r[3] + 1:
+                    r = (min(r[0], g[0]), min(r[1], g[1]), max(r[2], g[2]), max(r[3], g[3]))
+                    grupos.pop(i)
+                    i = 0
+                else:
+                    i += 1
+            grupos.append(r)
+        if len(grupos) > MAX_REGIOES_SUJAS:
+            grupos = [(
+                min(g[0] for g in grupos), min(g[1] for g in grupos),
+                max(g[2] for g in grupos), max(g[3] for g in grupos),
+            )]
+        return grupos
+
+    def _retangulo_tela(self, bbox):
+        """Converte uma bbox de grade em um pygame.Rect de tela (com margem)."""
+        xmin, ymin, xmax, ymax = bbox
+        cx, cy = self.largura / 2, self.altura / 2
+        x0 = math.floor(cx + xmin * self.tamanho_celula_x) - 1
+        x1 = math.ceil(cx + (xmax + 1) * self.tamanho_celula_x) + 1
+        y0 = math.floor(cy - (ymax + 1) * self.tamanho_celula_y) - 1
+        y1 = math.ceil(cy - ymin * self.tamanho_celula_y) + 1
+        return pygame.Rect(x0, y0, x1 - x0 + 1, y1 - y0 + 1).clip(self.surface.get_rect())
+
+    def _repintar_regiao(self, regiao, itens):
+        """
+        Repinta uma região da grade (ou a superfície inteira se regiao=None),
+        com clipping para não tocar no restante da superfície retida.
+        """
+        if regiao is None:
+            area = self.surface.get_rect()
+        else:
+            area = self._retangulo_tela(regiao)
+            if area.width <= 0 or area.height <= 0:
+                return
+        self.surface.set_clip(area)
+        self.desenhar_grade(area)
+
+        self._desenhar_janela_recorte()
+
+        # Desenha histórico (apenas itens cuja bbox toca a região). A região
+        # é expandida em algumas células porque a margem da área de tela (e o
+        # truncamento dos retângulos das células) alcança as vizinhas.
+        if regiao is not None:
+            k = 1 + math.ceil(2 / min(self.tamanho_celula_x, self.tamanho_celula_y))
+            regiao = (regiao[0] - k, regiao[1] - k, regiao[2] + k, regiao[3] + k)
+        for _, cor, bbox, desenho in itens:
+            if bbox is None or (regiao is not None and not _bboxes_intersectam(bbox, regiao)):
+                continue
+            if desenho.tipo == "Faixas":
+                self.desenhar_faixas(desenho.parametros['faixas'], cor)
+                continue
+            for bloco in self.blocos_desenho(desenho):
+                self.desenhar_pixels(bloco, cor)
 
         # Pré-visualização da polilinha (em vermelho)
-        if self.preview_polilinha and len(self.preview_polilinha) >= 2:
-            preview_pixels = rasterizar_polilinha(self.preview_polilinha)
-            for p in preview_pixels:
-                self.desenhar_pixel(p[0], p[1], (255, 0, 0))
+        self.desenhar_pixels(self._pixels_preview_polilinha, (255, 0, 0))
 
         # Pré-visualização da janela de recorte poligonal (em vermelho)
-        if self.preview_clip_poligono and len(self.preview_clip_poligono) >= 2:
-            pts = self.preview_clip_poligono
-            chain = pts if pts[0] == pts[-1] else (pts + [pts[0]] if len(pts) >= 3 else pts)
-            clip_pixels = rasterizar_polilinha(chain)
-            for p in clip_pixels:
-                self.desenhar_pixel(p[0], p[1], (255, 0, 0))
+        self.desenhar_pixels(self._pixels_preview_clip, (255, 0, 0))
 
-        tela.blit(self.surface, (0, 0))
+        self.surface.set_clip(None)
+
+    def _compor_framebuffer(self, itens):
+        """
+        Backend framebuffer: fundo, grade e janela de recorte são desenhados
+        no canvas; as formas são escritas no framebuffer (1 pixel por célula)
+        e ampliadas uma única vez com vizinho mais próximo.
+        """
+        self.desenhar_grade()
+        self._desenhar_janela_recorte()
+
+        fb = self._framebuffer
+        fb.fill(COR_CHAVE_FRAMEBUFFER)
+        for _, cor, bbox, desenho in itens:
+            if bbox is None:
+                continue
+            if desenho.tipo == "Faixas":
+                self._escrever_faixas_framebuffer(desenho.parametros['faixas'], cor)
+                continue
+            for bloco in self.blocos_desenho(desenho):
+                self._escrever_framebuffer(bloco, cor)
+        self._escrever_framebuffer(self._pixels_preview_polilinha, (255, 0, 0))
+        self._escrever_framebuffer(self._pixels_preview_clip, (255, 0, 0))
+
+        gx0, gx1, gy0, gy1 = self._janela_framebuffer
+        cx, cy = self.largura / 2, self.altura / 2
+        destino_x = round(cx + gx0 * self.tamanho_celula_x)
+        destino_y = round(cy - (gy1 + 1) * self.tamanho_celula_y)
+        largura = round(cx + (gx1 + 1) * self.tamanho_celula_x) - destino_x
+        altura = round(cy - gy0 * self.tamanho_celula_y) - destino_y
+        ampliado = pygame.transform.scale(fb, (largura, altura))
+        self.surface.blit(ampliado, (destino_x, destino_y))
+
+    def _escrever_framebuffer(self, pixels, cor):
+        """Escreve pixels de grade no framebuffer (coluna = x, linha = y invertido)."""
+        if len(pixels) == 0:
+            return
+        gx0, gx1, gy0, gy1 = self._janela_framebuffer
+        pts = np.asarray(pixels, dtype=np.int64).reshape(-1, 2)
+        cols = pts[:, 0] - gx0
+        linhas = gy1 - pts[:, 1]
+        m = (cols >= 0) & (cols <= gx1 - gx0) & (linhas >= 0) & (linhas <= gy1 - gy0)
+        fb = pygame.surfarray.pixels2d(self._framebuffer)
+        try:
+            fb[cols[m], linhas[m]] = self._framebuffer.map_rgb(cor)
+        finally:
+            del fb
+
+    def _escrever_faixas_framebuffer(self, faixas, cor):
+        """Escreve faixas (y, x_inicio, x_fim) no framebuffer: um fatiamento por faixa."""
+        gx0, gx1, gy0, gy1 = self._janela_framebuffer
+        f = np.asarray(faixas, dtype=np.int64).reshape(-1, 3)
+        linhas = gy1 - f[:, 0]
+        c0 = np.maximum(f[:, 1] - gx0, 0)
+        c1 = np.minimum(f[:, 2] - gx0, gx1 - gx0)
+        m = (linhas >= 0) & (linhas <= gy1 - gy0) & (c0 <= c1)
+        if not m.any():
+            return
+        valor = self._framebuffer.map_rgb(cor)
+        fb = pygame.surfarray.pixels2d(self._framebuffer)
+        try:
+            for linha, a, b in zip(linhas[m].tolist(), c0[m].tolist(), c1[m].tolist()):
+                fb[a:b + 1, linha] = valor
+        finally:
+            del fb
+
+    def _desenhar_janela_recorte(self):
+        """Contorno vermelho da janela retangular de recorte (se houver)."""
+        if not self.janela_recorte:
+            return
+        xmin, ymin, xmax, ymax = self.janela_recorte
+        x0 = self.largura / 2 + xmin * self.tamanho_celula_x
+        y0 = self.altura / 2 - (ymax + 1) * self.tamanho_celula_y
+        w = (xmax - xmin + 1) * self.tamanho_celula_x
+        h = (ymax - ymin + 1) * self.tamanho_celula_y
+        rect = pygame.Rect(x0, y0, w, h)
+        # Contorno de 1 px com quatro fills: diferente de draw.rect com
+        # largura, o resultado não muda quando há clipping ativo.
+        for borda in (
+            (rect.left, rect.top, rect.width, 1),
+            (rect.left, rect.bottom - 1, rect.width, 1),
+            (rect.left, rect.top, 1, rect.height),
+            (rect.right - 1, rect.top, 1, rect.height),
+        ):
+            self.surface.fill((255, 0, 0), borda)
+
+    def blocos_desenho(self, desenho):
+        """
+        Pixels de um item do histórico em blocos NumPy (k, 2). Usa o cache
+        quando possível; caso contrário rasteriza em streaming, mantendo a
+        memória limitada para formas enormes (ver CacheRaster.iterar_blocos).
+        """
+        return self.cache_raster.iterar_blocos(desenho, self.iterar_pixels_desenho)
 
     def rasterizar_desenho(self, desenho):
         """
-        Converte um item do histórico (tipo + parâmetros) na lista de pixels de
-        grade que devem ser pintados. Para curvas/linhas, delega para os módulos
-        de algoritmos correspondentes; para "Pontos" retorna diretamente.
+        Converte um item do histórico (tipo + parâmetros) no PixelBuffer de
+        pixels de grade que devem ser pintados (envoltório de iterar_pixels_desenho).
+        """
+        pixels = self.iterar_pixels_desenho(desenho)
+        return pixels if isinstance(pixels, PixelBuffer) else PixelBuffer(pixels)
+
+    def iterar_pixels_desenho(self, desenho):
+        """
+        Iterável com os pixels de um item do histórico. Para curvas/linhas,
+        delega para os geradores dos módulos de algoritmos correspondentes;
+        para "Pontos" retorna diretamente o PixelBuffer armazenado e, para
+        "Faixas", os pixels das faixas (a pintura usa as faixas direto).
         """
         tipo = desenho.tipo
         params = desenho.parametros
+        # Janela visível: só os pixels dentro dela são gerados (formas enormes
+        # custam apenas a parte visível)
+        janela = self.janela_rasterizacao() if self.rasterizacao_recortada else None
         if tipo == "Linha (Bresenham)":
-            return calcular_linha_bresenham(params['p1'], params['p2'])
+            if janela is not None:
+                return calcular_linha_bresenham_recortada(params['p1'], params['p2'], janela)
+            return iterar_linha_bresenham(params['p1'], params['p2'])
         elif tipo == "Círculo":
-            return calcular_circulo(params['centro'], params['raio'])
+            return calcular_circulo_unico(params['centro'], params['raio'], janela=janela)
         elif tipo == "Elipse":
-            return calcular_elipse(params['centro'], params['rx'], params['ry'])
+            return iterar_elipse(params['centro'], params['rx'], params['ry'], janela=janela)
         elif tipo == "Curva de Bézier":
             pontos = [params[f'p{i}'] for i in range(4)]
-            return rasterizar_curva_bezier(*pontos)
+            return iterar_curva_bezier(*pontos)
+        elif tipo == "Bézier (grau n)":
+            return rasterizar_bezier_grau_n(params['pontos'])
+        elif tipo == "Bézier Composta":
+            return rasterizar_bezier_composta(params['pontos'])
+        elif tipo == "B-spline":
+            return rasterizar_bspline(params['pontos'])
         elif tipo == "Polilinha":
-            return rasterizar_polilinha(params['pontos'])
+            return iterar_polilinha(params['pontos'], deduplicar=True, janela=janela)
+        elif tipo == "Faixas":
+            if janela is not None:
+                return pixels_de_faixas(recortar_faixas(params['faixas'], janela))
+            return pixels_de_faixas(params['faixas'])
         elif tipo.startswith("Projeção") or tipo == "Pontos":
             return params.get('pontos', [])
         return []
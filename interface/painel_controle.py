@@ -26,7 +26,7 @@ import pygame_gui
 #   separado (self.elementos_<figura>) para facilitar show/hide conforme a seleção.
 # - O painel de recorte aparece conforme o tipo do item selecionado no histórico:
 #   • Linha → exibe campos de margens (left, bottom, right, top) + botão aplicar
-#   • Polilinha → exibe janela poligonal (convexa) por clique + campo de texto
+#   • Polilinha → exibe janela poligonal (convexa ou côncava) por clique + campo de texto
 # - Os controles de Projeções 3D aparecem somente quando a figura selecionada é
 #   “Projeções 3D”; o botão abre um painel próprio (painel_projecoes.py).
 # -----------------------------------------------------------------------------
@@ -122,7 +122,7 @@ class PainelControle:
         # Recorte (abaixo do histórico)
         # Dois submodos de UI convivem aqui, com visibilidade alternada:
         # - Recorte de linha por margem (Cohen–Sutherland) → 4 campos e botão
-        # - Recorte de polígono (Sutherland–Hodgman) → janela convexa por clique
+        # - Recorte de polígono (Sutherland–Hodgman / Greiner–Hormann) → janela por clique
         y_recorte = self.altura_historico + 40
         x_hist = self.posicao_x_historico
         # Título
@@ -165,6 +165,11 @@ class PainelControle:
             relative_rect=pygame.Rect((x_hist, y_line), (self.largura_historico, 30)),
             text='Aplicar Recorte', manager=self.ui_manager, object_id='#botao_recorte'
         )
+        # Recorta todas as linhas do histórico de uma vez (Liang–Barsky em lote)
+        self.elementos_recorte['btn_recorte_todas'] = pygame_gui.elements.UIButton(
+            relative_rect=pygame.Rect((x_hist, y_line + 35), (self.largura_historico, 30)),
+            text='Recortar Todas as Linhas', manager=self.ui_manager, object_id='#botao_recorte_todas'
+        )
 
         # Botões e entrada para janela poligonal (Sutherland–Hodgman), ancorados sob o título
         self._construir_recorte_poligonal(x_hist, y_recorte)
@@ -339,7 +344,13 @@ class PainelControle:
         self.elementos_polilinha['label'] = pygame_gui.elements.UILabel(relative_rect=pygame.Rect((self.largura_canvas + 10, base_y), (220, 20)), text='Pontos (x1,y1; x2,y2; ...):', manager=self.ui_manager)
         self.elementos_polilinha['entrada_pontos'] = pygame_gui.elements.UITextEntryLine(relative_rect=pygame.Rect((self.largura_canvas + 10, base_y + 30), (210, 30)), manager=self.ui_manager)
         self.elementos_polilinha['entrada_pontos'].set_text('-10,-10; 0,20; 10,-10; 20,20')
-        self.elementos_polilinha['botao'] = pygame_gui.elements.UIButton(relative_rect=pygame.Rect((self.largura_canvas + 10, base_y + 70), (210, 40)), text='Desenhar Polilinha', manager=self.ui_manager, object_id='#botao_polilinha')
+        self.elementos_polilinha['botao'] = pygame_gui.elements.UIButton(relative_rect=pygame.Rect((self.largura_canvas + 10, base_y + 70), (100, 40)), text='Desenhar', manager=self.ui_manager, object_id='#botao_polilinha')
+        # "Traçar como": os mesmos pontos viram polilinha, Bézier de grau n, Bézier composta ou B-spline
+        self.elementos_polilinha['dropdown_traco'] = pygame_gui.elements.UIDropDownMenu(
+            options_list=['Polilinha', 'Bézier', 'Composta', 'B-spline'],
+            starting_option='Polilinha',
+            relative_rect=pygame.Rect((self.largura_canvas + 120, base_y + 79), (100, 22)),
+            manager=self.ui_manager)
         # Botões para desenhar por clique
         self.elementos_polilinha['btn_iniciar_clique'] = pygame_gui.elements.UIButton(
             relative_rect=pygame.Rect((self.largura_canvas + 10, base_y + 115), (100, 28)),
@@ -619,18 +630,19 @@ class PainelControle:
 
     def _construir_recorte_poligonal(self, x_hist: int, y_recorte: int) -> None:
         """
-        Cria os controles de janela poligonal (convexa) para Sutherland–Hodgman,
-        ancorados imediatamente abaixo do título de Recorte.
+        Cria os controles de janela poligonal (Sutherland–Hodgman se convexa,
+        Greiner–Hormann se côncava), ancorados imediatamente abaixo do título
+        de Recorte.
 
         Controles criados:
         - Botões Iniciar/Finalizar para captura por clique no canvas da janela
-          de recorte (polígono convexo);
+          de recorte (polígono convexo ou côncavo);
         - Campo de texto para edição manual dos vértices (x1,y1; x2,y2; ...).
         """
         y = y_recorte + 25
         self.elementos_recorte['label_clip_poly'] = pygame_gui.elements.UILabel(
             relative_rect=pygame.Rect((x_hist, y), (self.largura_historico, 20)),
-            text='Janela por clique (convexa):', manager=self.ui_manager
+            text='Janela por clique:', manager=self.ui_manager
         )
         y += 25
         btn_w, btn_h, gap = 90, 28, 10
@@ -675,6 +687,8 @@ class PainelControle:
         de acordo com o tipo do item selecionado:
         - Linha (Bresenham) → mostra campos de margens (Cohen–Sutherland)
         - Polilinha → mostra janela poligonal (Sutherland–Hodgman)
+        - Sem seleção, com linhas no histórico → margens e "Recortar Todas as
+          Linhas" (Liang–Barsky em lote)
         """
         assinatura_desenhos = '|'.join(str(d.timestamp) for d in historico)
         assinatura_completa = f"{len(historico)}:{indice_selecionado}:{assinatura_desenhos}"
@@ -692,6 +706,10 @@ class PainelControle:
                 show_recorte_linha = True
             elif desenho_selecionado.tipo == 'Polilinha':
                 show_recorte_poligono = True
+        elif any(d.tipo == 'Linha (Bresenham)' for d in historico):
+            show_recorte_linha = True
+        elif any(d.tipo == 'Polilinha' for d in historico):
+            show_recorte_poligono = True
 
         # Atualiza o título com o algoritmo correspondente
         if 'titulo' in self.elementos_recorte:
@@ -714,7 +732,7 @@ class PainelControle:
             'label_bottom','bottom','btn_bottom',
             'label_right','right','btn_right',
             'label_top','top','btn_top',
-            'botao','btn_recorte'
+            'botao','btn_recorte','btn_recorte_todas'
         }
 
         polyclip_keys = {
@@ -0,0 +1,98 @@
+"""Cache LRU dos pixels rasterizados de cada desenho do histórico."""
+
+from collections import OrderedDict
+from typing import Callable, Dict, Iterator
+
+import numpy as np
+
+from algoritmos.pixels import TAMANHO_BLOCO_PADRAO, PixelBuffer, agrupar_em_blocos
+
+
+class CacheRaster:
+    """Guarda os pixels (PixelBuffer) produzidos para cada versão de um desenho.
+
+    - A chave é `desenho.versao`, que muda a cada alteração de tipo/parâmetros
+      (ver utils/historico.py); assim transformações, recortes e
+      preenchimentos invalidam a entrada antiga automaticamente.
+    - O limite de memória é dado em número total de pixels armazenados
+      (max_pixels). Ao ultrapassá-lo, removemos as entradas usadas há mais
+      tempo (LRU). Entradas maiores que o próprio limite não são guardadas.
+    """
+
+    def __init__(self, max_pixels: int = 2_000_000):
+        self.max_pixels = max_pixels
+        self._entradas: "OrderedDict[int, PixelBuffer]" = OrderedDict()
+        self._total_pixels = 0
+        self.acertos = 0
+        self.faltas = 0
+
+    def iterar_blocos(self, desenho, iterar_pixels: Callable,
+                      tamanho_bloco: int = TAMANHO_BLOCO_PADRAO) -> Iterator[np.ndarray]:
+        """Pixels do desenho em blocos NumPy (k, 2), rasterizando em streaming.
+
+        Num acerto, a entrada do cache sai como um único bloco. Numa falta, os
+        blocos são produzidos à medida que o rasterizador gera pixels; eles são
+        acumulados para o cache somente enquanto couberem em max_pixels, de
+        modo que formas enormes passam com memória limitada a um bloco.
+        """
+        chave = desenho.versao
+        pixels = self._entradas.get(chave)
+        if pixels is not None:
+            self._entradas.move_to_end(chave)
+            self.acertos += 1
+            if len(pixels):
+                yield pixels.como_numpy()
+            return
+        self.faltas += 1
+        pixels = iterar_pixels(desenho)
+        if isinstance(pixels, PixelBuffer):
+            # Já materializado (ex.: "Pontos"): guarda o próprio buffer, sem cópia
+            self._guardar(chave, pixels)
+            yield from agrupar_em_blocos(pixels, tamanho_bloco)
+            return
+        acumulados = PixelBuffer()
+        for bloco in agrupar_em_blocos(pixels, tamanho_bloco):
+            if acumulados is not None:
+                acumulados.extend(bloco)
+                if len(acumulados) > self.max_pixels:
+                    acumulados = None  # não caberá no cache: desiste de acumular
+            yield bloco
+        if acumulados is not None:
+            self._guardar(chave, acumulados)
+
+    def contem(self, desenho) -> bool:
+        return desenho.versao in self._entradas
+
+    def guardar(self, desenho, pixels: PixelBuffer) -> None:
+        """Insere pixels já rasterizados por fora (ex.: rasterização em lote)."""
+        if desenho.versao not in self._entradas:
+            self._guardar(desenho.versao, pixels)
+
+    def _guardar(self, chave: int, pixels: PixelBuffer) -> None:
+        tamanho = len(pixels)
+        if tamanho > self.max_pixels:
+            return  # não cabe no cache: será rasterizado sob demanda
+        self._entradas[chave] = pixels
+        self._total_pixels += tamanho
+        # Despejo LRU: remove do início (menos recente) até caber no limite
+        while self._total_pixels > self.max_pixels:
+            _, antigo = self._entradas.popitem(last=False)
+            self._total_pixels -= len(antigo)
+
+    def descartar(self, versoes_vivas) -> None:
+        """Remove entradas cujas versões não pertencem mais ao histórico."""
+        vivas = set(versoes_vivas)
+        for chave in [c for c in self._entradas if c not in vivas]:
+            self._total_pixels -= len(self._entradas.pop(chave))
+
+    def limpar(self) -> None:
+        self._entradas.clear()
+        self._total_pixels = 0
+
+    def estatisticas(self) -> Dict[str, int]:
+        return {
+            'entradas': len(self._entradas),
+            'pixels': self._total_pixels,
+            'acertos': self.acertos,
+            'faltas': self.faltas,
+        }
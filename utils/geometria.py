@@ -48,7 +48,7 @@ def eh_convexo(pontos: List[Ponto]) -> bool:
 
 def garantir_ccw(pontos: List[Ponto]) -> List[Ponto]:
 	"""Retorna os pontos em ordem CCW (anti-horária)."""
-	pts = pontos[:]
+	pts = list(pontos)
 	if len(pts) >= 3 and area_orientada(pts) < 0:
 		pts.reverse()
 	return pts
\ No newline at end of file
@@ -1,7 +1,77 @@
 from dataclasses import dataclass, field
+from itertools import count
 from typing import List, Dict, Any
 from datetime import datetime
 
+import numpy as np
+
+# Contador global de versões: cada alteração em qualquer desenho recebe um
+# número novo e único, então (versao) identifica sozinho o estado de um item
+# (útil como chave de cache sem risco de colisão entre desenhos diferentes).
+_proxima_versao = count(1)
+
+
+def _congelar(valor):
+    """Versão imutável de um parâmetro: listas viram tuplas e arrays NumPy
+    viram visões somente leitura (os dados não são copiados)."""
+    if isinstance(valor, list):
+        return tuple(valor)
+    if isinstance(valor, np.ndarray) and valor.flags.writeable:
+        valor = valor.view()
+        valor.flags.writeable = False
+    return valor
+
+
+class Parametros(dict):
+    """Dicionário de parâmetros que avisa o desenho dono a cada alteração.
+
+    Atribuições como `desenho.parametros['p1'] = ...` (feitas pelas
+    transformações, recortes e preenchimentos) geram uma nova versão do
+    desenho, invalidando automaticamente caches baseados nela.
+
+    Alterações no próprio valor (`parametros['pontos'].append(...)`) não
+    passariam por aqui e deixariam o cache com pixels antigos; por isso os
+    valores são guardados congelados (ver _congelar) e quem altera um
+    parâmetro monta o valor novo e reatribui a chave. PixelBuffer (tipo
+    "Pontos") segue a mesma regra: é sempre substituído, nunca alterado.
+    """
+    __slots__ = ('_ao_alterar',)
+
+    def __init__(self, dados=(), ao_alterar=None):
+        super().__init__((chave, _congelar(valor)) for chave, valor in dict(dados).items())
+        self._ao_alterar = ao_alterar
+
+    def _notificar(self):
+        if self._ao_alterar is not None:
+            self._ao_alterar()
+
+    def __setitem__(self, chave, valor):
+        super().__setitem__(chave, _congelar(valor))
+        self._notificar()
+
+    def __delitem__(self, chave):
+        super().__delitem__(chave)
+        self._notificar()
+
+    def update(self, *args, **kwargs):
+        super().update((chave, _congelar(valor)) for chave, valor in dict(*args, **kwargs).items())
+        self._notificar()
+
+    def pop(self, *args):
+        valor = super().pop(*args)
+        self._notificar()
+        return valor
+
+    def setdefault(self, chave, padrao=None):
+        if chave not in self:
+            self[chave] = padrao
+        return self[chave]
+
+    def clear(self):
+        super().clear()
+        self._notificar()
+
+
 @dataclass
 class DesenhoHistorico:
     """Representa um único objeto desenhado, definido por seus parâmetros."""
@@ -9,11 +79,27 @@ class DesenhoHistorico:
     parametros: Dict[str, Any]
     timestamp: datetime = field(default_factory=datetime.now)
     # O campo 'pixels' foi removido. A rasterização agora é feita sob demanda.
+    # 'versao' muda sempre que 'tipo' ou 'parametros' são alterados.
+    versao: int = field(default=0, compare=False, repr=False)
+
+    def __post_init__(self):
+        self._nova_versao()
+
+    def __setattr__(self, nome, valor):
+        if nome == 'parametros':
+            valor = Parametros(valor, self._nova_versao)
+        object.__setattr__(self, nome, valor)
+        if nome in ('tipo', 'parametros') and 'versao' in self.__dict__:
+            self._nova_versao()
+
+    def _nova_versao(self):
+        object.__setattr__(self, 'versao', next(_proxima_versao))
+
 
 class Historico:
     def __init__(self):
         self.desenhos: List[DesenhoHistorico] = []
-    
+
     def adicionar_desenho(self, tipo: str, parametros: Dict[str, Any]):
         """Adiciona um novo desenho ao histórico, baseado em seus parâmetros."""
         desenho = DesenhoHistorico(
@@ -21,13 +107,13 @@ class Historico:
             parametros=parametros
         )
         self.desenhos.append(desenho)
-    
+
     def limpar_historico(self):
         self.desenhos.clear()
-    
+
     def obter_desenhos(self) -> List[DesenhoHistorico]:
         return self.desenhos
-    
+
     def desfazer_ultimo_desenho(self):
         """Remove o último desenho do histórico."""
         if not self.desenhos:
@@ -38,3 +124,8 @@ class Historico:
         """Remove o desenho pelo índice (0 = mais antigo)."""
         if 0 <= indice < len(self.desenhos):
             self.desenhos.pop(indice)
+
+    def remover_por_indices(self, indices):
+        """Remove vários desenhos de uma vez, preservando a ordem dos demais."""
+        remover = set(indices)
+        self.desenhos[:] = [d for i, d in enumerate(self.desenhos) if i not in remover]